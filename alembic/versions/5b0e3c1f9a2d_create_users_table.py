@@ -0,0 +1,41 @@
+"""create users table
+
+Revision ID: 5b0e3c1f9a2d
+Revises:
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "5b0e3c1f9a2d"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("username", sa.String(length=64), nullable=False),
+        sa.Column("password_hash", sa.String(length=256), nullable=False),
+        sa.Column(
+            "role",
+            sa.Enum("ADMIN", "MODERATOR", "USER", name="role"),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_users_username"), "users", ["username"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_users_username"), table_name="users")
+    op.drop_table("users")
+    sa.Enum(name="role").drop(op.get_bind(), checkfirst=False)
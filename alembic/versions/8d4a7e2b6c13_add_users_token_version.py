@@ -0,0 +1,28 @@
+"""add users token_version
+
+Revision ID: 8d4a7e2b6c13
+Revises: 5b0e3c1f9a2d
+Create Date: 2026-10-18 09:14:05.531872
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "8d4a7e2b6c13"
+down_revision: str | None = "5b0e3c1f9a2d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("token_version", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "token_version")
@@ -0,0 +1,39 @@
+"""add users timestamp server defaults
+
+Revision ID: a6d2f9c4e1b3
+Revises: f4c83a1d7e90
+Create Date: 2026-10-18 13:05:21.430968
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "a6d2f9c4e1b3"
+down_revision: str | None = "f4c83a1d7e90"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    for column in ("created_at", "updated_at"):
+        op.alter_column(
+            "users",
+            column,
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.text("timezone('UTC', now())"),
+        )
+
+
+def downgrade() -> None:
+    for column in ("created_at", "updated_at"):
+        op.alter_column(
+            "users",
+            column,
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
@@ -0,0 +1,55 @@
+"""use gist for users username trigram index
+
+Revision ID: b3e7a19d5c42
+Revises: a6d2f9c4e1b3
+Create Date: 2026-10-18 14:12:08.215573
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "b3e7a19d5c42"
+down_revision: str | None = "a6d2f9c4e1b3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # GiST can return the nearest usernames by trigram distance first, so a
+    # limited search stops early instead of ranking every match as with GIN.
+    # The new index is built before the old one is dropped, both concurrently.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_username_gist_trgm",
+            "users",
+            ["username"],
+            unique=False,
+            postgresql_using="gist",
+            postgresql_ops={"username": "gist_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_users_username_trgm",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_username_trgm",
+            "users",
+            ["username"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_users_username_gist_trgm",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,40 @@
+"""add users username trigram index
+
+Revision ID: c71f0a9e4b25
+Revises: 8d4a7e2b6c13
+Create Date: 2026-10-18 11:02:37.604415
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "c71f0a9e4b25"
+down_revision: str | None = "8d4a7e2b6c13"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Built concurrently so existing tables stay writable during the build.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_username_trgm",
+            "users",
+            ["username"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_username_trgm",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
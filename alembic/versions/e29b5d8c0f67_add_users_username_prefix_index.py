@@ -0,0 +1,37 @@
+"""add users username prefix index
+
+Revision ID: e29b5d8c0f67
+Revises: c71f0a9e4b25
+Create Date: 2026-10-18 11:48:12.290033
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "e29b5d8c0f67"
+down_revision: str | None = "c71f0a9e4b25"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_username_lower_pattern",
+            "users",
+            [sa.text("lower(username) text_pattern_ops")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_username_lower_pattern",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
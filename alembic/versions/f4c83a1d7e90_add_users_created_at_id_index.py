@@ -0,0 +1,36 @@
+"""add users created_at id index
+
+Revision ID: f4c83a1d7e90
+Revises: e29b5d8c0f67
+Create Date: 2026-10-18 12:20:54.817342
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "f4c83a1d7e90"
+down_revision: str | None = "e29b5d8c0f67"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_created_at_id",
+            "users",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_created_at_id",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
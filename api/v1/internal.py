@@ -0,0 +1,103 @@
+import os
+
+from fastapi import APIRouter, Depends
+
+from app.helpers import token_helper
+from app.models import Role
+from app.schemas.extras import (
+    DatabasePools,
+    DatabaseSlowQueries,
+    DatabaseStatementCaches,
+    PasswordPool,
+    PasswordPoolStatus,
+    PoolStatus,
+    SlowQueryStatus,
+    StatementCacheStatus,
+    TokenCache,
+    TokenCacheStatus,
+)
+from core.database.engine import get_pool_stats, get_statement_cache_stats
+from core.database.session import engines, replicas, slow_queries
+from core.security import password_handler
+from core.security.require_role import require_role
+
+internal_router = APIRouter(
+    prefix="/internal",
+    tags=["Internal"],
+    dependencies=[Depends(require_role(Role.ADMIN))],
+)
+
+
+@internal_router.get("/database/pools")
+async def database_pools() -> DatabasePools:
+    """Report connection pool occupancy and checkout waits.
+
+    Pools are per process, so each worker reports its own.
+
+    :returns: The pool statistics of this worker.
+    """
+    stats = get_pool_stats({**engines, **replicas.engines})
+    return DatabasePools(
+        worker_pid=os.getpid(),
+        pools=[PoolStatus.model_validate(pool) for pool in stats],
+    )
+
+
+@internal_router.get("/database/statement-cache")
+async def database_statement_cache() -> DatabaseStatementCaches:
+    """Report how often statements are served from the compiled cache.
+
+    Caches are per process, so each worker reports its own.
+
+    :returns: The compiled cache statistics of this worker.
+    """
+    stats = get_statement_cache_stats({**engines, **replicas.engines})
+    return DatabaseStatementCaches(
+        worker_pid=os.getpid(),
+        caches=[StatementCacheStatus.model_validate(cache) for cache in stats],
+    )
+
+
+@internal_router.get("/database/slow-queries")
+async def database_slow_queries() -> DatabaseSlowQueries:
+    """List the slowest recent statements with their query plans.
+
+    The log is per process, so each worker reports its own.
+
+    :returns: The slow queries recorded by this worker.
+    """
+    return DatabaseSlowQueries(
+        worker_pid=os.getpid(),
+        threshold=slow_queries.threshold,
+        queries=[
+            SlowQueryStatus.model_validate(query) for query in slow_queries.queries()
+        ],
+    )
+
+
+@internal_router.get("/security/password-pool")
+async def password_pool() -> PasswordPool:
+    """Report the queue and workers of the password hashing pool.
+
+    The pool is per process, so each worker reports its own.
+
+    :returns: The hashing pool statistics of this worker.
+    """
+    return PasswordPool(
+        worker_pid=os.getpid(),
+        pool=PasswordPoolStatus.model_validate(password_handler.stats()),
+    )
+
+
+@internal_router.get("/security/token-cache")
+async def token_cache() -> TokenCache:
+    """Report how often access tokens are served from the verified cache.
+
+    The cache is per process, so each worker reports its own.
+
+    :returns: The token cache statistics of this worker.
+    """
+    return TokenCache(
+        worker_pid=os.getpid(),
+        cache=TokenCacheStatus.model_validate(token_helper.cache.stats()),
+    )
@@ -6,8 +6,11 @@ from core.fastapi.dependencies import (
     BearerCredentialsDep,
     UserControllerDep,
 )
+from core.fastapi.routing import TrustedJSONRoute
 
-tokens_router = APIRouter(prefix="/tokens", tags=["Tokens"])
+tokens_router = APIRouter(
+    prefix="/tokens", tags=["Tokens"], route_class=TrustedJSONRoute
+)
 
 
 @tokens_router.post("")
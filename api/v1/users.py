@@ -1,23 +1,42 @@
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 
 from app.models import Role, User
 from app.schemas.requests import (
+    BatchCreateUsersRequest,
+    BatchDeleteUsersRequest,
+    BatchUpdateUsersRequest,
     RegisterUserRequest,
     UpdateSelfRequest,
     UpdateUserRequest,
+    UserAutocomplete,
+    UserExport,
     UserPagination,
+    UserSearch,
+)
+from app.schemas.responses import (
+    BatchItemResult,
+    BatchResponse,
+    UserResponse,
+    UserSuggestion,
 )
-from app.schemas.responses import UserResponse
 from core.fastapi.dependencies import (
+    AuthenticatedUserDep,
     AuthenticationRequiredDep,
     CurrentUserDep,
+    ReadOnlyDep,
     UserControllerDep,
 )
+from core.fastapi.routing import TrustedJSONRoute
 from core.security.require_role import require_role
 
-users_router = APIRouter(tags=["Users"])
+users_router = APIRouter(tags=["Users"], route_class=TrustedJSONRoute)
+
+# List endpoints select only the columns of the response instead of whole users.
+USER_RESPONSE_FIELDS = list(UserResponse.model_fields)
 
 
 @users_router.post(
@@ -35,29 +54,144 @@ async def create_user(
     return await user_controller.create(user_request.to_create_attributes())
 
 
+@users_router.post(
+    "/users/batch",
+    dependencies=[Depends(require_role(Role.ADMIN))],
+    response_model=BatchResponse,
+)
+async def create_users(
+    batch_request: BatchCreateUsersRequest,
+    user_controller: UserControllerDep,
+):
+    """Create up to 1000 users in one transaction.
+
+    Each item is validated like a single user creation; invalid items are
+    reported in ``results`` and the others are still created.
+    """
+    results, items = [], {}
+    for index, item in enumerate(batch_request.users):
+        try:
+            user_request = RegisterUserRequest.model_validate(item)
+        except ValidationError as e:
+            results.append(BatchItemResult(index=index, error=e.errors()[0]["msg"]))
+        else:
+            items[index] = user_request.to_create_attributes()
+
+    results += await user_controller.create_batch(items)
+    return BatchResponse(results=sorted(results, key=lambda result: result.index))
+
+
+@users_router.put(
+    "/users/batch",
+    dependencies=[Depends(require_role(Role.ADMIN))],
+    response_model=BatchResponse,
+)
+async def update_users(
+    batch_request: BatchUpdateUsersRequest,
+    user_controller: UserControllerDep,
+):
+    """Set the role of up to 1000 users in one statement."""
+    return BatchResponse(
+        results=await user_controller.update_batch(
+            batch_request.ids, batch_request.role
+        )
+    )
+
+
+@users_router.delete(
+    "/users/batch",
+    dependencies=[Depends(require_role(Role.ADMIN))],
+    response_model=BatchResponse,
+)
+async def delete_users(
+    batch_request: BatchDeleteUsersRequest,
+    user_controller: UserControllerDep,
+):
+    """Delete up to 1000 users in one statement."""
+    return BatchResponse(results=await user_controller.delete_batch(batch_request.ids))
+
+
 @users_router.get(
     "/users",
-    dependencies=[AuthenticationRequiredDep],
+    dependencies=[ReadOnlyDep, AuthenticationRequiredDep],
     response_model=list[UserResponse],
 )
 async def get_users(
+    response: Response,
     user_controller: UserControllerDep,
     query_params: UserPagination = Depends(),
 ):
+    """List users one keyset page at a time.
+
+    Pass the ``X-Next-Cursor`` response header back as ``cursor`` to fetch the
+    next page. Giving ``skip`` falls back to offset pagination.
+    """
     filters = []
     if query_params.creation_year:
         start_date = datetime(query_params.creation_year, 1, 1)
         end_date = datetime(query_params.creation_year + 1, 1, 1)
-        filters.append(User.created_at.between(start_date, end_date))
+        filters += [User.created_at >= start_date, User.created_at < end_date]
 
-    return await user_controller.get_filtered(
-        filters=filters, skip=query_params.skip, limit=query_params.limit
+    if query_params.skip:
+        return await user_controller.get_filtered(
+            filters=filters,
+            skip=query_params.skip,
+            limit=query_params.limit,
+            fields=USER_RESPONSE_FIELDS,
+        )
+
+    users, next_cursor = await user_controller.get_page(
+        filters=filters,
+        cursor=query_params.cursor,
+        limit=query_params.limit,
+        fields=USER_RESPONSE_FIELDS,
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return users
+
+
+@users_router.get(
+    "/users/export",
+    dependencies=[Depends(require_role(Role.ADMIN))],
+    response_class=StreamingResponse,
+)
+async def export_users(
+    user_controller: UserControllerDep,
+    query_params: UserExport = Depends(),
+):
+    """Stream every user as NDJSON or CSV.
+
+    Users are read through a server-side cursor and sent in chunks, so memory
+    stays constant whatever the number of users.
+    """
+    export_format = query_params.format
+    return StreamingResponse(
+        user_controller.export(export_format),
+        media_type=export_format.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="users.{export_format}"'
+        },
+    )
+
+
+@users_router.get(
+    "/users/autocomplete",
+    dependencies=[ReadOnlyDep, AuthenticationRequiredDep],
+    response_model=list[UserSuggestion],
+)
+async def autocomplete_usernames(
+    user_controller: UserControllerDep,
+    query_params: UserAutocomplete = Depends(),
+):
+    return await user_controller.autocomplete(
+        query_params.prefix, limit=query_params.limit
     )
 
 
 @users_router.get(
     "/users/{user_id}",
-    dependencies=[AuthenticationRequiredDep],
+    dependencies=[ReadOnlyDep, AuthenticationRequiredDep],
     response_model=UserResponse,
 )
 async def get_user_by_id(
@@ -69,11 +203,19 @@ async def get_user_by_id(
 
 @users_router.get(
     "/users/search/",
-    dependencies=[AuthenticationRequiredDep],
+    dependencies=[ReadOnlyDep, AuthenticationRequiredDep],
     response_model=list[UserResponse],
 )
-async def search_users_by_username(query: str, user_controller: UserControllerDep):
-    return await user_controller.search_by_username(query)
+async def search_users_by_username(
+    user_controller: UserControllerDep,
+    query_params: UserSearch = Depends(),
+):
+    return await user_controller.search_by_username(
+        query_params.query,
+        skip=query_params.skip,
+        limit=query_params.limit,
+        fields=USER_RESPONSE_FIELDS,
+    )
 
 
 @users_router.put(
@@ -105,6 +247,7 @@ async def delete_user(
 
 @users_router.get(
     "/me",
+    dependencies=[ReadOnlyDep],
     response_model=UserResponse,
 )
 async def me(current_user: CurrentUserDep):
@@ -118,7 +261,7 @@ async def me(current_user: CurrentUserDep):
 async def update_me(
     user_request: UpdateSelfRequest,
     user_controller: UserControllerDep,
-    current_user: CurrentUserDep,
+    current_user: AuthenticatedUserDep,
 ):
     return await user_controller.update(
         current_user.id, user_request.to_update_attributes()
@@ -132,6 +275,6 @@ async def update_me(
 )
 async def delete_me(
     user_controller: UserControllerDep,
-    current_user: CurrentUserDep,
+    current_user: AuthenticatedUserDep,
 ):
     return await user_controller.delete(current_user.id)
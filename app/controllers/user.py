@@ -1,11 +1,22 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Mapping, Sequence
+from typing import Any
 
-from app.helpers import token_helper
-from app.models import User
+from sqlalchemy import Row, case
+
+from app.helpers import ExportFormat, encode_export, token_helper, token_versions
+from app.models import Role, User
 from app.repositories import UserRepository
 from app.schemas.extras import Token
+from app.schemas.responses import BatchItemResult, UserResponse
+from core.config import config
 from core.controller import BaseController
-from core.exceptions import NotFoundException, UnauthorizedException
+from core.database import after_commit
+from core.exceptions import (
+    NotFoundException,
+    ServiceUnavailableException,
+    UnauthorizedException,
+)
+from core.security import password_handler
 
 
 class UserController(BaseController[User]):
@@ -13,14 +24,211 @@ class UserController(BaseController[User]):
         super().__init__(model=User, repository=user_repository)
         self.user_repository = user_repository
 
-    async def search_by_username(self, query: str) -> Sequence[User]:
+    async def create(self, attributes: Mapping[str, Any]) -> User:
+        """Create a user, hashing the password off the event loop.
+
+        :param attributes: The attributes to create the user with.
+
+        :return: The created user.
+        """
+        return await super().create(await self._hash_password(attributes))
+
+    async def update(self, id_: int, attributes: Mapping[str, Any]) -> User:
+        """Update a user, hashing a new password off the event loop.
+
+        Changing the role or the password bumps the user's token version, which
+        revokes every token issued before the change.
+
+        :param id_: The id of the user to update.
+        :param attributes: The attributes to update the user with.
+
+        :raises NotFoundException: If the user does not exist.
+
+        :return: The updated user.
+        """
+        attributes = await self._hash_password(attributes)
+        if attributes.get("password_hash") is not None:
+            attributes["token_version"] = User.token_version + 1
+        elif attributes.get("role") is not None:
+            attributes["token_version"] = case(
+                (User.role != attributes["role"], User.token_version + 1),
+                else_=User.token_version,
+            )
+
+        user = await super().update(id_, attributes)
+        self._cache_token_version(user.id, user.token_version)
+        return user
+
+    async def delete(self, id_: int) -> None:
+        """Delete a user and revoke their tokens.
+
+        :param id_: The id of the user to delete.
+        """
+        await super().delete(id_)
+        self._cache_token_version(id_, None)
+
+    async def create_batch(
+        self, items: Mapping[int, Mapping[str, Any]]
+    ) -> list[BatchItemResult]:
+        """Create many users with a single insert.
+
+        Items whose username is repeated in the batch or already taken, or
+        whose password cannot be hashed, are reported and left out; the rest
+        are hashed in parallel and inserted in one transaction.
+
+        :param items: The attributes of each user, by position in the request.
+
+        :return: The outcome of each item.
+        """
+        results = []
+        pending: dict[int, Mapping[str, Any]] = {}
+        seen = set()
+        for index, attributes in items.items():
+            if attributes["username"] in seen:
+                results.append(
+                    BatchItemResult(index=index, error="Duplicate username in batch")
+                )
+                continue
+            seen.add(attributes["username"])
+            pending[index] = attributes
+
+        taken = await self.user_repository.get_existing_usernames(list(seen))
+        for index, attributes in list(pending.items()):
+            if attributes["username"] in taken:
+                results.append(
+                    BatchItemResult(index=index, error="Username already exists")
+                )
+                del pending[index]
+
+        password_hashes = await password_handler.hash_passwords(
+            [attributes["password"] for attributes in pending.values()],
+            return_exceptions=True,
+        )
+        rows = {}
+        for (index, attributes), password_hash in zip(
+            pending.items(), password_hashes, strict=True
+        ):
+            if isinstance(password_hash, ServiceUnavailableException):
+                results.append(
+                    BatchItemResult(index=index, error=password_hash.message)
+                )
+            elif isinstance(password_hash, ValueError):
+                results.append(BatchItemResult(index=index, error=str(password_hash)))
+            elif isinstance(password_hash, BaseException):
+                raise password_hash
+            else:
+                rows[index] = {
+                    "username": attributes["username"],
+                    "password_hash": password_hash,
+                }
+
+        users = await self.bulk_create(list(rows.values()))
+        results += [
+            BatchItemResult(index=index, id=user.id)
+            for index, user in zip(rows, users, strict=True)
+        ]
+        return sorted(results, key=lambda result: result.index)
+
+    async def update_batch(
+        self, ids: Sequence[int], role: Role
+    ) -> list[BatchItemResult]:
+        """Set the role of many users with a single update.
+
+        Users whose role actually changes get their token version bumped,
+        revoking the tokens issued before the change.
+
+        :param ids: The ids of the users to update.
+        :param role: The new role.
+
+        :return: The outcome of each id, in request order.
+        """
+        users = await self.bulk_update(
+            ids,
+            {
+                "role": role,
+                "token_version": case(
+                    (User.role != role, User.token_version + 1),
+                    else_=User.token_version,
+                ),
+            },
+        )
+        for user in users:
+            self._cache_token_version(user.id, user.token_version)
+        return self._batch_results(ids, {user.id for user in users})
+
+    async def delete_batch(self, ids: Sequence[int]) -> list[BatchItemResult]:
+        """Delete many users with a single delete and revoke their tokens.
+
+        :param ids: The ids of the users to delete.
+
+        :return: The outcome of each id, in request order.
+        """
+        deleted_ids = await self.bulk_delete(ids)
+        for id_ in deleted_ids:
+            self._cache_token_version(id_, None)
+        return self._batch_results(ids, set(deleted_ids))
+
+    async def is_token_version_current(self, user_id: int, token_version: int) -> bool:
+        """Check a token version claim against the user's current version.
+
+        Recently confirmed versions are answered from memory; otherwise only
+        the version column is read.
+
+        :param user_id: The id of the user the token was issued to.
+        :param token_version: The token version claim.
+
+        :return: True if the token has not been revoked.
+        """
+        current_version = token_versions.get(user_id)
+        if current_version is None:
+            current_version = await self.user_repository.get_token_version(user_id)
+            self._cache_token_version(user_id, current_version)
+        return current_version == token_version
+
+    async def search_by_username(
+        self,
+        query: str,
+        skip: int = 0,
+        limit: int = 10,
+        fields: Sequence[str] | None = None,
+    ) -> Sequence[User] | Sequence[Row]:
         """Search for users by username using a query.
 
         :param query: The query to search for.
+        :param skip: The number of matches to skip.
+        :param limit: The number of matches to return.
+        :param fields: The columns to select, if not whole users.
 
-        :return: A list of users that match the query.
+        :return: A list of users that match the query, most similar first.
         """
-        return await self.user_repository.search_by_username(query)
+        return await self.user_repository.search_by_username(query, skip, limit, fields)
+
+    async def autocomplete(
+        self, prefix: str, limit: int = 10
+    ) -> Sequence[Row[tuple[int, str]]]:
+        """Suggest usernames starting with a prefix.
+
+        :param prefix: The prefix typed so far.
+        :param limit: The number of suggestions to return.
+
+        :return: The ``(id, username)`` rows of the suggestions.
+        """
+        return await self.user_repository.autocomplete_usernames(prefix.lower(), limit)
+
+    def export(
+        self, export_format: ExportFormat, batch_size: int = config.EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Encode every user, streamed in batches through a server-side cursor.
+
+        :param export_format: The output format.
+        :param batch_size: The number of users fetched and encoded at a time.
+
+        :return: An async iterator of encoded chunks.
+        """
+        batches = self.stream(
+            fields=list(UserResponse.model_fields), batch_size=batch_size
+        )
+        return encode_export(batches, UserResponse, export_format)
 
     async def login(self, username: str, password: str) -> Token | None:
         """Login a user with a username and password.
@@ -31,9 +239,13 @@ class UserController(BaseController[User]):
         :return: True if the login is successful, False otherwise.
         """
         user = await self.user_repository.get_by_username(username)
-        if user and user.verify_password(password):
-            return token_helper.issue_pair(user.id)
-        raise UnauthorizedException("Invalid username or password")
+        if not user or not await user.verify_password(password):
+            raise UnauthorizedException("Invalid username or password")
+
+        if password_handler.needs_rehash(user.password_hash):
+            await self._rehash_password(user, password)
+        self._cache_token_version(user.id, user.token_version)
+        return token_helper.issue_pair(user.id, user.role, user.token_version)
 
     async def refresh_token(
         self, access_token: str, refresh_token: str
@@ -45,8 +257,80 @@ class UserController(BaseController[User]):
         :return: A new token.
         """
         try:
-            user_id = token_helper.validate_refresh(access_token, refresh_token)
-            await self.get_by_id(user_id)
-            return token_helper.issue_pair(user_id)
+            payload = token_helper.validate_refresh(access_token, refresh_token)
+            user = await self.get_by_id(payload.user_id)
         except (KeyError, NotFoundException):
             raise UnauthorizedException("Invalid token")
+
+        if user.token_version != payload.token_version:
+            raise UnauthorizedException("Invalid token")
+
+        self._cache_token_version(user.id, user.token_version)
+        return token_helper.issue_pair(user.id, user.role, user.token_version)
+
+    def _cache_token_version(self, user_id: int, token_version: int | None) -> None:
+        """Cache a user's token version once the session's writes commit.
+
+        The version is only cached once the database holds it, so a rolled
+        back request cannot leave a version in the cache that was never stored.
+
+        :param user_id: The id of the user.
+        :param token_version: The current token version, or None for a
+            deleted user.
+        """
+        after_commit(
+            self.user_repository.session,
+            lambda: token_versions.set(user_id, token_version),
+        )
+
+    def _batch_results(
+        self, ids: Sequence[int], affected_ids: set[int]
+    ) -> list[BatchItemResult]:
+        """Report which of the requested ids were affected.
+
+        :param ids: The requested ids, in request order.
+        :param affected_ids: The ids the statement matched.
+
+        :return: The outcome of each id.
+        """
+        return [
+            BatchItemResult(
+                index=index,
+                id=id_,
+                error=(
+                    None
+                    if id_ in affected_ids
+                    else f"User with id: {id_} does not exist"
+                ),
+            )
+            for index, id_ in enumerate(ids)
+        ]
+
+    async def _hash_password(self, attributes: Mapping[str, Any]) -> dict[str, Any]:
+        """Replace a plaintext ``password`` attribute with its hash.
+
+        :param attributes: The user attributes, possibly holding a password.
+
+        :return: A copy of the attributes with ``password_hash`` set instead.
+        """
+        attributes = dict(attributes)
+        password = attributes.pop("password", None)
+        if password is not None:
+            attributes["password_hash"] = await password_handler.hash_password(password)
+        return attributes
+
+    async def _rehash_password(self, user: User, password: str) -> None:
+        """Store a new hash for a verified password using the current cost.
+
+        Rehashing is skipped when the hashing pool is saturated, in which case
+        it is retried on the user's next login, and when the password is too
+        long for the default hasher, in which case the old hash is kept.
+
+        :param user: The user who just logged in.
+        :param password: The verified plaintext password.
+        """
+        try:
+            password_hash = await password_handler.hash_password(password)
+        except (ServiceUnavailableException, ValueError):
+            return
+        await self.user_repository.update(user, {"password_hash": password_hash})
@@ -1,3 +1,11 @@
-from .token import TokenHelper, TokenType, token_helper
+from .export import ExportFormat, encode_export
+from .token import TokenHelper, TokenType, token_helper, token_versions
 
-__all__ = ["TokenHelper", "TokenType", "token_helper"]
+__all__ = [
+    "ExportFormat",
+    "TokenHelper",
+    "TokenType",
+    "encode_export",
+    "token_helper",
+    "token_versions",
+]
@@ -0,0 +1,52 @@
+import csv
+import io
+from collections.abc import AsyncIterator, Sequence
+from enum import StrEnum
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        """The content type of an export in this format."""
+        if self == ExportFormat.CSV:
+            return "text/csv"
+        return "application/x-ndjson"
+
+
+async def encode_export(
+    batches: AsyncIterator[Sequence[Any]],
+    model: type[BaseModel],
+    export_format: ExportFormat,
+) -> AsyncIterator[bytes]:
+    """Encode batches of records as NDJSON lines or CSV rows.
+
+    Each batch is encoded into one chunk, so memory is bounded by the batch
+    size rather than by the number of records.
+
+    :param batches: The batches of records, e.g. from a repository stream.
+    :param model: The model whose fields are exported, read off each record.
+    :param export_format: The output format.
+
+    :return: An async iterator of encoded chunks; CSV starts with a header.
+    """
+    adapter = TypeAdapter(list[model])
+    fields = list(model.model_fields)
+    if export_format == ExportFormat.CSV:
+        yield (",".join(fields) + "\r\n").encode()
+
+    async for batch in batches:
+        items = adapter.validate_python(batch, from_attributes=True)
+        if export_format == ExportFormat.NDJSON:
+            yield b"".join(item.model_dump_json().encode() + b"\n" for item in items)
+            continue
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fields)
+        writer.writerows(adapter.dump_python(items, mode="json"))
+        yield buffer.getvalue().encode()
@@ -1,10 +1,15 @@
+from datetime import datetime
 from enum import StrEnum
+from typing import Any
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ConfigDict
 
+from app.models import Role
 from app.schemas.extras import Token
+from core.config import config
 from core.exceptions import UnauthorizedException
 from core.security import jwt_handler
+from core.security.token_cache import TokenCache, TokenVersionCache
 
 
 class TokenType(StrEnum):
@@ -12,21 +17,52 @@ class TokenType(StrEnum):
     REFRESH = "refresh"
 
 
+TOKEN_TYPES = frozenset(TokenType)
+ROLES_BY_VALUE = {role.value: role for role in Role}
+
+
 class TokenPayload(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     user_id: int
     token_type: TokenType
+    role: Role
+    token_version: int
 
 
 class TokenHelper:
-    def issue_pair(self, user_id: int) -> Token:
+    def __init__(self, cache: TokenCache[TokenPayload] | None = None):
+        self.cache: TokenCache[TokenPayload] = (
+            cache if cache is not None else TokenCache(max_size=0)
+        )
+
+    def issue_pair(self, user_id: int, role: Role, token_version: int) -> Token:
+        expires_at = jwt_handler.expires_at()
         return Token(
-            access_token=self.encode(user_id=user_id, token_type=TokenType.ACCESS),
-            refresh_token=self.encode(user_id=user_id, token_type=TokenType.REFRESH),
+            access_token=self.encode(
+                user_id, TokenType.ACCESS, role, token_version, expires_at
+            ),
+            refresh_token=self.encode(
+                user_id, TokenType.REFRESH, role, token_version, expires_at
+            ),
         )
 
-    def encode(self, user_id: int, token_type: TokenType) -> str:
+    def encode(
+        self,
+        user_id: int,
+        token_type: TokenType,
+        role: Role,
+        token_version: int,
+        expires_at: datetime | None = None,
+    ) -> str:
         return jwt_handler.encode(
-            TokenPayload(user_id=user_id, token_type=token_type).model_dump()
+            {
+                "user_id": user_id,
+                "token_type": token_type.value,
+                "role": role.value,
+                "token_version": token_version,
+            },
+            expires_at,
         )
 
     def decode(
@@ -34,24 +70,56 @@ class TokenHelper:
         token: str,
         expected_type: TokenType | None = None,
     ) -> TokenPayload:
-        try:
-            payload = TokenPayload.model_validate(jwt_handler.decode(token))
-        except ValidationError:
-            raise UnauthorizedException("Invalid token")
+        payload = self.cache.get(token)
+        if payload is None:
+            claims = jwt_handler.decode(token)
+            payload = self._payload_from_claims(claims)
+            if isinstance(claims.get("exp"), int | float):
+                self.cache.set(token, payload, expires_at=claims["exp"])
 
         if expected_type is not None and payload.token_type != expected_type:
             raise UnauthorizedException("Invalid token")
 
         return payload
 
-    def validate_refresh(self, access_token: str, refresh_token: str) -> int:
+    def validate_refresh(self, access_token: str, refresh_token: str) -> TokenPayload:
         access_payload = self.decode(access_token, expected_type=TokenType.ACCESS)
         refresh_payload = self.decode(refresh_token, expected_type=TokenType.REFRESH)
 
-        if access_payload.user_id != refresh_payload.user_id:
+        if (
+            access_payload.user_id != refresh_payload.user_id
+            or access_payload.token_version != refresh_payload.token_version
+        ):
             raise UnauthorizedException("Invalid token")
 
-        return access_payload.user_id
+        return refresh_payload
+
+    def _payload_from_claims(self, claims: dict[str, Any]) -> TokenPayload:
+        # Checks the known claim shape directly instead of running a full
+        # pydantic validation on every decode.
+        user_id = claims.get("user_id")
+        token_type = claims.get("token_type")
+        role = claims.get("role")
+        token_version = claims.get("token_version")
+        if (
+            type(user_id) is not int
+            or not isinstance(token_type, str)
+            or token_type not in TOKEN_TYPES
+            or type(role) is not int
+            or role not in ROLES_BY_VALUE
+            or type(token_version) is not int
+        ):
+            raise UnauthorizedException("Invalid token")
+
+        return TokenPayload.model_construct(
+            user_id=user_id,
+            token_type=TokenType(token_type),
+            role=ROLES_BY_VALUE[role],
+            token_version=token_version,
+        )
 
 
-token_helper = TokenHelper()
+token_helper = TokenHelper(cache=TokenCache(max_size=config.TOKEN_CACHE_SIZE))
+token_versions = TokenVersionCache(
+    ttl=config.TOKEN_VERSION_TTL_SECONDS, max_size=config.TOKEN_CACHE_SIZE
+)
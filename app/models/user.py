@@ -10,11 +10,25 @@ from .role import Role
 
 class User(Base, TimestampMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        # Serves creation-year filters and the keyset order of user listings.
+        sa.Index("ix_users_created_at_id", "created_at", "id"),
+        # Serves username search, returning the nearest usernames first.
+        sa.Index(
+            "ix_users_username_gist_trgm",
+            "username",
+            postgresql_using="gist",
+            postgresql_ops={"username": "gist_trgm_ops"},
+        ),
+    )
 
     id: so.Mapped[int] = so.mapped_column(sa.Integer, primary_key=True)
     username: so.Mapped[str] = so.mapped_column(sa.String(64), unique=True, index=True)
     password_hash: so.Mapped[str] = so.mapped_column(sa.String(256))
     role: so.Mapped[Role] = so.mapped_column(sa.Enum(Role), default=Role.USER)
+    token_version: so.Mapped[int] = so.mapped_column(
+        sa.Integer, default=0, server_default="0"
+    )
 
     def __repr__(self) -> str:
         return f"<User {self.username}>"
@@ -25,7 +39,25 @@ class User(Base, TimestampMixin):
 
     @password.setter
     def password(self, password: str):
+        # Hashes inline; the user controller hashes in the worker pool instead,
+        # through ``password_handler.hash_password``.
         self.password_hash = password_handler.generate_password_hash(password)
 
-    def verify_password(self, password: str) -> bool:
-        return password_handler.check_password_hash(self.password_hash, password)
+    async def verify_password(self, password: str) -> bool:
+        return await password_handler.verify_password(self.password_hash, password)
+
+
+# Serves case-insensitive prefix lookups; text_pattern_ops compares bytewise,
+# so prefix ranges work whatever the database collation.
+sa.Index(
+    "ix_users_username_lower_pattern",
+    sa.func.lower(User.username).label("username_lower"),
+    postgresql_ops={"username_lower": "text_pattern_ops"},
+)
+
+# The trigram index needs pg_trgm; migrations create it too.
+sa.event.listen(
+    User.__table__,
+    "before_create",
+    sa.DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
@@ -1,12 +1,33 @@
 from collections.abc import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import Float, Row, bindparam, func, select, text
 
 from app.models.user import User
 from core.repository import BaseRepository
 
+GET_BY_USERNAME = select(User).filter(User.username == bindparam("username"))
+
+GET_TOKEN_VERSION = select(User.token_version).filter(User.id == bindparam("user_id"))
+
+
+def escape_like(value: str, escape: str = "/") -> str:
+    """Escape the wildcards of a ``LIKE`` pattern so they match literally.
+
+    :param value: The text to match.
+    :param escape: The escape character declared on the ``LIKE``.
+
+    :return: The escaped text.
+    """
+    return (
+        value.replace(escape, escape * 2)
+        .replace("%", escape + "%")
+        .replace("_", escape + "_")
+    )
+
 
 class UserRepository(BaseRepository[User]):
+    keyset_columns = ("created_at", "id")
+
     async def get_by_username(self, username: str) -> User | None:
         """Get a user by username.
 
@@ -14,19 +35,99 @@ class UserRepository(BaseRepository[User]):
 
         :return: The user with the username.
         """
-        result = await self.session.execute(
-            select(User).filter(User.username == username)
-        )
+        result = await self.session.execute(GET_BY_USERNAME, {"username": username})
         return result.scalar()
 
-    async def search_by_username(self, query: str) -> Sequence[User]:
-        """Get users by username using a query.
+    async def search_by_username(
+        self,
+        query: str,
+        skip: int = 0,
+        limit: int = 10,
+        fields: Sequence[str] | None = None,
+    ) -> Sequence[User] | Sequence[Row]:
+        """Get users whose username contains a query, most similar first.
+
+        Matches are ordered by trigram distance (``<->``), which the GiST
+        trigram index on ``username`` returns nearest first, so only the
+        requested page is ranked rather than every match. ``%`` and ``_`` in
+        the query match literally.
 
         :param query: The query to search for.
+        :param skip: The number of matches to skip.
+        :param limit: The number of matches to return.
+        :param fields: The columns to select, if not whole users.
+
+        :return: A list of users, or of rows when ``fields`` is given, that
+            match the query.
+        """
+        statement = self._statement(
+            ("search_by_username", None if fields is None else tuple(fields)),
+            lambda: self._select(fields)
+            .filter(User.username.ilike(bindparam("pattern"), escape="/"))
+            .order_by(
+                User.username.op("<->", return_type=Float)(
+                    bindparam("query", type_=User.username.type)
+                ),
+                User.id,
+            )
+            .offset(bindparam("skip"))
+            .limit(bindparam("limit")),
+        )
+        params = {
+            "pattern": f"%{escape_like(query)}%",
+            "query": query,
+            "skip": skip,
+            "limit": limit,
+        }
+        if fields is not None:
+            return await self._rows(statement, params)
+        return await self._all(statement, params)
+
+    async def get_existing_usernames(self, usernames: Sequence[str]) -> set[str]:
+        """Get which of the given usernames are already taken.
+
+        :param usernames: The usernames to look up.
+
+        :return: The usernames that belong to existing users.
+        """
+        if not usernames:
+            return set()
+
+        result = await self.session.execute(
+            select(User.username).filter(User.username.in_(usernames))
+        )
+        return set(result.scalars().all())
+
+    async def get_token_version(self, user_id: int) -> int | None:
+        """Get the current token version of a user without loading the row.
+
+        :param user_id: The id of the user.
+
+        :return: The token version, or None if the user does not exist.
+        """
+        result = await self.session.execute(GET_TOKEN_VERSION, {"user_id": user_id})
+        return result.scalar_one_or_none()
+
+    async def autocomplete_usernames(
+        self, prefix: str, limit: int = 10
+    ) -> Sequence[Row[tuple[int, str]]]:
+        """Get the ids and usernames starting with a prefix, case-insensitively.
+
+        The prefix is turned into a bytewise range on ``lower(username)`` and
+        read in order from its ``text_pattern_ops`` index, so the cost depends
+        on ``limit`` rather than on the table size.
+
+        :param prefix: The lowercase ASCII prefix to complete.
+        :param limit: The number of suggestions to return.
 
-        :return: A list of users that match the query.
+        :return: The matching ``(id, username)`` rows, alphabetically.
         """
+        username = func.lower(User.username)
+        upper_bound = prefix[:-1] + chr(ord(prefix[-1]) + 1)
         result = await self.session.execute(
-            select(User).filter(User.username.ilike(f"%{query}%"))
+            select(User.id, User.username)
+            .filter(username.op("~>=~")(prefix), username.op("~<~")(upper_bound))
+            .order_by(text("lower(users.username) USING ~<~"))
+            .limit(limit)
         )
-        return result.scalars().all()
+        return result.all()
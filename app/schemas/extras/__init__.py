@@ -1,10 +1,29 @@
 from .current_user import CurrentUser
+from .database import (
+    DatabasePools,
+    DatabaseSlowQueries,
+    DatabaseStatementCaches,
+    PoolStatus,
+    SlowQueryStatus,
+    StatementCacheStatus,
+)
 from .health import Health
+from .security import PasswordPool, PasswordPoolStatus, TokenCache, TokenCacheStatus
 from .token import RefreshTokenRequest, Token
 
 __all__ = [
     "Token",
     "RefreshTokenRequest",
     "CurrentUser",
+    "DatabasePools",
+    "DatabaseSlowQueries",
+    "DatabaseStatementCaches",
     "Health",
+    "PasswordPool",
+    "PasswordPoolStatus",
+    "PoolStatus",
+    "SlowQueryStatus",
+    "StatementCacheStatus",
+    "TokenCache",
+    "TokenCacheStatus",
 ]
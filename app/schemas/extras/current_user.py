@@ -1,7 +1,11 @@
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.models import Role
+
 
 class CurrentUser(BaseModel):
     model_config = ConfigDict(validate_assignment=True)
 
     id: int = Field(..., description="User ID")
+    role: Role = Field(..., description="User role, as carried by the access token")
+    token_version: int = Field(..., description="Token version of the access token")
@@ -0,0 +1,62 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class PoolStatus(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    name: str = Field(..., json_schema_extra={"example": "writer"})
+    size: int = Field(..., description="Configured number of pooled connections")
+    checked_in: int = Field(..., description="Idle connections in the pool")
+    checked_out: int = Field(..., description="Connections currently in use")
+    overflow: int = Field(..., description="Connections open beyond the pool size")
+    checkouts: int = Field(..., description="Successful checkouts so far")
+    timeouts: int = Field(..., description="Checkouts that timed out waiting")
+    total_wait: float = Field(..., description="Seconds spent waiting on checkouts")
+    max_wait: float = Field(..., description="Longest checkout wait in seconds")
+
+
+class DatabasePools(BaseModel):
+    worker_pid: int = Field(..., description="Process that owns these pools")
+    pools: list[PoolStatus]
+
+
+class StatementCacheStatus(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    name: str = Field(..., json_schema_extra={"example": "writer"})
+    size: int = Field(..., description="Compiled statements in the cache")
+    capacity: int = Field(..., description="Compiled statements the cache keeps")
+    hits: int = Field(..., description="Statements executed from the cache")
+    misses: int = Field(..., description="Statements compiled and then cached")
+    uncached: int = Field(..., description="Statements that could not be cached")
+    hit_ratio: float | None = Field(
+        ..., description="Share of cacheable statements found in the cache"
+    )
+
+
+class DatabaseStatementCaches(BaseModel):
+    worker_pid: int = Field(..., description="Process that owns these caches")
+    caches: list[StatementCacheStatus]
+
+
+class SlowQueryStatus(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    fingerprint: str = Field(..., description="Digest of the statement's shape")
+    statement: str = Field(..., description="Statement with its values replaced")
+    parameters: list[str] = Field(..., description="Types of the bound parameters")
+    duration: float = Field(..., description="Seconds the statement ran")
+    engine: str = Field(..., json_schema_extra={"example": "writer"})
+    recorded_at: datetime
+    failed: bool = Field(..., description="Whether the statement raised")
+    plan: Any = Field(None, description="EXPLAIN (FORMAT JSON) output, once captured")
+    explain_error: str | None = Field(None, description="Why the plan is missing")
+
+
+class DatabaseSlowQueries(BaseModel):
+    worker_pid: int = Field(..., description="Process that recorded these queries")
+    threshold: float = Field(..., description="Seconds above which queries are kept")
+    queries: list[SlowQueryStatus] = Field(..., description="Most recent first")
@@ -0,0 +1,34 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class PasswordPoolStatus(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    executor: str = Field(..., json_schema_extra={"example": "thread"})
+    workers: int = Field(..., description="Configured number of hashing workers")
+    max_queue_size: int = Field(..., description="Jobs allowed to wait for a worker")
+    queued: int = Field(..., description="Jobs currently waiting for a worker")
+    running: int = Field(..., description="Jobs currently being hashed")
+    peak_queued: int = Field(..., description="Most jobs ever waiting at once")
+    completed: int = Field(..., description="Jobs finished so far")
+    rejected: int = Field(..., description="Jobs refused because the queue was full")
+
+
+class PasswordPool(BaseModel):
+    worker_pid: int = Field(..., description="Process that owns this pool")
+    pool: PasswordPoolStatus
+
+
+class TokenCacheStatus(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    size: int = Field(..., description="Verified tokens in the cache")
+    max_size: int = Field(..., description="Verified tokens the cache keeps")
+    hits: int = Field(..., description="Tokens served from the cache")
+    misses: int = Field(..., description="Tokens verified from scratch")
+    evictions: int = Field(..., description="Entries dropped to make room")
+
+
+class TokenCache(BaseModel):
+    worker_pid: int = Field(..., description="Process that owns this cache")
+    cache: TokenCacheStatus
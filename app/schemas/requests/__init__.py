@@ -1,13 +1,25 @@
 from .users import (
+    BatchCreateUsersRequest,
+    BatchDeleteUsersRequest,
+    BatchUpdateUsersRequest,
     RegisterUserRequest,
     UpdateSelfRequest,
     UpdateUserRequest,
+    UserAutocomplete,
+    UserExport,
     UserPagination,
+    UserSearch,
 )
 
 __all__ = [
+    "BatchCreateUsersRequest",
+    "BatchDeleteUsersRequest",
+    "BatchUpdateUsersRequest",
     "RegisterUserRequest",
     "UpdateUserRequest",
+    "UserAutocomplete",
+    "UserExport",
     "UserPagination",
+    "UserSearch",
     "UpdateSelfRequest",
 ]
@@ -1,9 +1,10 @@
 import re
 from datetime import date
-from typing import Annotated
+from typing import Annotated, Any
 
-from pydantic import StringConstraints, field_validator
+from pydantic import Field, StringConstraints, field_validator
 
+from app.helpers import ExportFormat
 from app.models import Role
 from app.schemas.requests.base import Base
 
@@ -34,6 +35,20 @@ class UpdateUserRequest(BaseUserRequest):
     password: Password | None = None
 
 
+class BatchCreateUsersRequest(Base):
+    # Items are validated one by one so that a bad item only fails itself.
+    users: list[dict[str, Any]] = Field(..., min_length=1, max_length=1000)
+
+
+class BatchUpdateUsersRequest(Base):
+    ids: list[int] = Field(..., min_length=1, max_length=1000)
+    role: Role
+
+
+class BatchDeleteUsersRequest(Base):
+    ids: list[int] = Field(..., min_length=1, max_length=1000)
+
+
 class UpdateSelfRequest(BaseUserRequest):
     username: Username | None = None
     password: Password | None = None
@@ -42,6 +57,7 @@ class UpdateSelfRequest(BaseUserRequest):
 class UserPagination(Base):
     skip: int = 0
     limit: int = 10
+    cursor: str | None = None
     creation_year: int | None = None
 
     @field_validator("creation_year")
@@ -51,3 +67,20 @@ class UserPagination(Base):
         if value is not None and (value > current_year or value < 1900):
             raise ValueError("Invalid year")
         return value
+
+
+class UserSearch(Base):
+    query: Annotated[str, StringConstraints(min_length=1, max_length=64)]
+    skip: int = Field(0, ge=0)
+    limit: int = Field(10, ge=1, le=100)
+
+
+class UserExport(Base):
+    format: ExportFormat = ExportFormat.NDJSON
+
+
+class UserAutocomplete(Base):
+    prefix: Annotated[
+        str, StringConstraints(min_length=1, max_length=64, pattern=r"^[a-zA-Z0-9]+$")
+    ]
+    limit: int = Field(10, ge=1, le=50)
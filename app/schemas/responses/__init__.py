@@ -1,3 +1,4 @@
-from app.schemas.responses.users import UserResponse
+from app.schemas.responses.batch import BatchItemResult, BatchResponse
+from app.schemas.responses.users import UserResponse, UserSuggestion
 
-__all__ = ["UserResponse"]
+__all__ = ["BatchItemResult", "BatchResponse", "UserResponse", "UserSuggestion"]
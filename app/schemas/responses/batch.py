@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+
+
+class BatchItemResult(BaseModel):
+    index: int = Field(..., description="The position of the item in the request")
+    id: int | None = Field(None, description="The id of the affected record")
+    error: str | None = Field(None, description="Why the item was not applied")
+
+
+class BatchResponse(BaseModel):
+    results: list[BatchItemResult] = Field(
+        ..., description="The outcome of each item, in request order"
+    )
@@ -1,4 +1,4 @@
-from pydantic import Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models import Role
 
@@ -8,3 +8,10 @@ from .base import BaseResponse
 class UserResponse(BaseResponse):
     username: str = Field(..., description="The username of the user")
     role: Role = Field(..., description="The role of the user")
+
+
+class UserSuggestion(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int = Field(..., description="The unique identifier for this record")
+    username: str = Field(..., description="The username of the user")
@@ -1,8 +1,10 @@
 import typer
 
+from cli.benchmark import app as benchmark_app
 from cli.database import app as database_app
 from cli.shell import app as shell_app
 
 app = typer.Typer()
 app.add_typer(database_app, name="db")
 app.add_typer(shell_app, name="shell")
+app.add_typer(benchmark_app, name="bench")
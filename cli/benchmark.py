@@ -0,0 +1,440 @@
+import asyncio
+import multiprocessing
+import resource
+import sys
+import time
+import timeit
+import tracemalloc
+import uuid
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime, timedelta
+
+import typer
+from jose import jwt
+from pydantic import TypeAdapter
+from sqlalchemy import Select, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.helpers import TokenHelper, TokenType
+from app.helpers.token import TokenPayload
+from app.models import Role, User
+from app.repositories import UserRepository
+from app.repositories.users import GET_BY_USERNAME
+from app.schemas.responses import UserResponse
+from cli.database import get_async_engine
+from core.config import config
+from core.database.engine import StatementCacheStats, get_statement_cache_stats
+from core.fastapi.routing import trusted_serializer
+from core.security.hashers import (
+    Argon2Hasher,
+    BCryptHasher,
+    PasswordHasher,
+    PBKDF2Hasher,
+    ScryptHasher,
+    argon2_available,
+)
+from core.security.password_handler import PasswordHandler
+
+app = typer.Typer()
+
+
+def _max_rss_kib() -> int:
+    """Return the peak resident set size of the current process.
+
+    :return: The peak RSS in KiB.
+    """
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss // 1024 if sys.platform == "darwin" else max_rss
+
+
+def _run_hasher(hasher: PasswordHasher, duration: float) -> tuple[int, float, int]:
+    """Hash passwords in a loop for a fixed time.
+
+    Runs in a fresh process so the peak RSS reflects only this hasher.
+
+    :param hasher: The hasher to benchmark.
+    :param duration: The minimum number of seconds to keep hashing.
+
+    :return: The hash count, elapsed seconds and peak RSS growth in KiB.
+    """
+    baseline = _max_rss_kib()
+    count = 0
+    started_at = time.perf_counter()
+    while count == 0 or time.perf_counter() - started_at < duration:
+        hasher.hash(b"benchmark-password")
+        count += 1
+    return count, time.perf_counter() - started_at, _max_rss_kib() - baseline
+
+
+def _hasher_cases() -> list[tuple[str, PasswordHasher]]:
+    """Build the hashers and parameter sets to compare.
+
+    :return: Pairs of a parameter description and the configured hasher.
+    """
+    cases: list[tuple[str, PasswordHasher]] = [
+        ("rounds=10", BCryptHasher(rounds=10)),
+        ("rounds=12", BCryptHasher(rounds=12)),
+        ("ln=14,r=8,p=1", ScryptHasher(cost=14, block_size=8, parallelism=1)),
+        ("ln=15,r=8,p=1", ScryptHasher(cost=15, block_size=8, parallelism=1)),
+        ("ln=16,r=8,p=1", ScryptHasher(cost=16, block_size=8, parallelism=1)),
+        ("iterations=310000", PBKDF2Hasher(iterations=310_000)),
+        ("iterations=600000", PBKDF2Hasher(iterations=600_000)),
+    ]
+    if argon2_available():
+        cases += [
+            ("t=2,m=19456,p=1", Argon2Hasher(2, 19456, 1)),
+            ("t=3,m=65536,p=4", Argon2Hasher(3, 65536, 4)),
+        ]
+    return cases
+
+
+@app.command()
+def hashers(
+    duration: float = typer.Option(1.0, help="Seconds to spend on each case."),
+):
+    """Compare password hasher throughput and peak memory on this machine."""
+    context = multiprocessing.get_context("spawn")
+    print(f"{'algorithm':<15} {'parameters':<20} {'hashes/s':>10} {'peak KiB':>10}")
+    for parameters, hasher in _hasher_cases():
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            count, elapsed, peak_kib = executor.submit(
+                _run_hasher, hasher, duration
+            ).result()
+        print(
+            f"{hasher.algorithm:<15} {parameters:<20} "
+            f"{count / elapsed:>10.2f} {peak_kib:>10}"
+        )
+
+
+@app.command(name="bcrypt-rounds")
+def bcrypt_rounds(
+    budget_ms: float = typer.Option(
+        config.BCRYPT_HASH_BUDGET_MS, help="Target time for a single hash."
+    ),
+    min_rounds: int = typer.Option(config.BCRYPT_MIN_ROUNDS, help="Lowest cost."),
+    max_rounds: int = typer.Option(config.BCRYPT_MAX_ROUNDS, help="Highest cost."),
+):
+    """Pick the bcrypt cost that fits the budget on this machine.
+
+    Run it once on the deploy's hardware and set the printed ``BCRYPT_ROUNDS``
+    for every worker, so they all hash with the same cost.
+    """
+    handler = PasswordHandler(hashers=[BCryptHasher()], max_workers=1)
+    try:
+        rounds = asyncio.run(
+            handler.calibrate(budget_ms, min_rounds=min_rounds, max_rounds=max_rounds)
+        )
+    finally:
+        handler.shutdown()
+    print(f"BCRYPT_ROUNDS={rounds}")
+
+
+def _ops_per_second(func: Callable[[], object], number: int) -> float:
+    """Time a callable and return its throughput.
+
+    :param func: The operation to time.
+    :param number: How many times to call it per round.
+
+    :return: Calls per second, from the fastest of three rounds.
+    """
+    return number / min(timeit.repeat(func, number=number, repeat=3))
+
+
+def _jose_encode(user_id: int, token_type: TokenType) -> str:
+    """Encode a token the way TokenHelper did through python-jose.
+
+    :param user_id: The user id claim.
+    :param token_type: The token type claim.
+
+    :return: The encoded token.
+    """
+    claims = TokenPayload(
+        user_id=user_id, token_type=token_type, role=Role.USER, token_version=0
+    ).model_dump(mode="json")
+    claims["exp"] = datetime.now(UTC) + timedelta(minutes=config.JWT_EXPIRE_MINUTES)
+    return jwt.encode(claims, config.SECRET_KEY, algorithm=config.JWT_ALGORITHM)
+
+
+def _jose_decode(token: str) -> TokenPayload:
+    """Decode a token the way TokenHelper did through python-jose.
+
+    :param token: The encoded token.
+
+    :return: The validated payload.
+    """
+    return TokenPayload.model_validate(
+        jwt.decode(token, config.SECRET_KEY, algorithms=[config.JWT_ALGORITHM])
+    )
+
+
+@app.command(name="jwt")
+def jwt_codec(
+    number: int = typer.Option(10_000, help="Operations per timing round."),
+):
+    """Compare the python-jose token path with the compact codec."""
+    helper = TokenHelper()
+    token = helper.encode(1, TokenType.ACCESS, Role.USER, 0)
+    cases = [
+        (
+            "encode",
+            lambda: _jose_encode(1, TokenType.ACCESS),
+            lambda: helper.encode(1, TokenType.ACCESS, Role.USER, 0),
+        ),
+        ("decode", lambda: _jose_decode(token), lambda: helper.decode(token)),
+        (
+            "issue_pair",
+            lambda: (
+                _jose_encode(1, TokenType.ACCESS),
+                _jose_encode(1, TokenType.REFRESH),
+            ),
+            lambda: helper.issue_pair(1, Role.USER, 0),
+        ),
+    ]
+
+    print(f"{'operation':<12} {'jose ops/s':>12} {'compact ops/s':>14} {'speedup':>8}")
+    for name, jose_func, compact_func in cases:
+        jose_ops = _ops_per_second(jose_func, number)
+        compact_ops = _ops_per_second(compact_func, number)
+        print(
+            f"{name:<12} {jose_ops:>12.0f} {compact_ops:>14.0f} "
+            f"{compact_ops / jose_ops:>7.1f}x"
+        )
+
+
+@app.command()
+def responses(
+    number: int = typer.Option(20_000, help="Users serialized per timing round."),
+):
+    """Compare FastAPI's response serialization with the trusted serializer."""
+    adapter = TypeAdapter(list[UserResponse])
+    trusted = trusted_serializer(list[UserResponse])
+    now = datetime.now(UTC).replace(tzinfo=None)
+
+    print(
+        f"{'users':>6} {'validated rows/s':>17} {'trusted rows/s':>15} {'speedup':>8}"
+    )
+    for size in (10, 100, 1000):
+        users = [
+            User(
+                id=index,
+                username=f"user{index}",
+                password_hash="x" * 60,
+                role=Role.USER,
+                created_at=now,
+                updated_at=now,
+            )
+            for index in range(size)
+        ]
+        rounds = max(number // size, 1)
+        validated = size * _ops_per_second(
+            lambda users=users: adapter.dump_json(
+                adapter.validate_python(users, from_attributes=True)
+            ),
+            rounds,
+        )
+        trusted_rows = size * _ops_per_second(
+            lambda users=users: trusted(users), rounds
+        )
+        print(
+            f"{size:>6} {validated:>17.0f} {trusted_rows:>15.0f} "
+            f"{trusted_rows / validated:>7.1f}x"
+        )
+
+
+async def _us_per_call(func: Callable[[], Awaitable[object]], number: int) -> float:
+    """Time a coroutine function and return its latency.
+
+    :param func: The operation to time.
+    :param number: How many times to await it per round.
+
+    :return: Microseconds per call, from the fastest of three rounds.
+    """
+    timings = []
+    for _ in range(3):
+        started_at = time.perf_counter()
+        for _ in range(number):
+            await func()
+        timings.append(time.perf_counter() - started_at)
+    return 1e6 * min(timings) / number
+
+
+async def _compare_statements(
+    number: int, calls: int
+) -> tuple[list[tuple[str, float, float, float, float, float]], StatementCacheStats]:
+    """Time hot lookups with rebuilt and prebuilt statements.
+
+    Building the select and computing its cache key are timed on their own.
+    The repository calls are timed from start to finish on the configured
+    database, through an engine with the compiled cache enabled, against a
+    user inserted in a transaction that is rolled back.
+
+    :param number: The statements built per timing round.
+    :param calls: The repository calls per timing round.
+
+    :return: Per query, the microseconds to build the select, to compute the
+        cache key of a rebuilt and of a prebuilt select, and of a call with
+        each; and the engine's compiled cache counts.
+    """
+    engine = get_async_engine()
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(bind=connection, expire_on_commit=False)
+        user = User(username=f"bench{uuid.uuid4().hex[:8]}", password_hash="x" * 60)
+        session.add(user)
+        await session.flush()
+        user_id, username = user.id, user.username
+        session.expunge_all()
+        repository = UserRepository(model=User, db_session=session)
+
+        async def call_rebuilt(statement: Select) -> None:
+            (await session.execute(statement)).scalars().first()
+            session.expunge_all()
+
+        async def call_prebuilt(func: Callable[[], Awaitable[object]]) -> None:
+            await func()
+            session.expunge_all()
+
+        cases = [
+            (
+                "get_by_id",
+                lambda: select(User).where(User.id == user_id),
+                repository._get_by_statement(User.id),
+                lambda: repository.get_by(User.id, user_id, unique=True),
+            ),
+            (
+                "get_by_username",
+                lambda: select(User).filter(User.username == username),
+                GET_BY_USERNAME,
+                lambda: repository.get_by_username(username),
+            ),
+        ]
+        results = []
+        for name, build, prebuilt, call in cases:
+            build_us = 1e6 / _ops_per_second(build, number)
+            build_and_key_us = 1e6 / _ops_per_second(
+                lambda build=build: build()._generate_cache_key(), number
+            )
+            rebuilt_key_us = build_and_key_us - build_us
+            prebuilt_key_us = 1e6 / _ops_per_second(
+                prebuilt._generate_cache_key, number
+            )
+            rebuilt_call_us = await _us_per_call(
+                lambda build=build: call_rebuilt(build()), calls
+            )
+            prebuilt_call_us = await _us_per_call(
+                lambda call=call: call_prebuilt(call), calls
+            )
+            results.append(
+                (
+                    name,
+                    build_us,
+                    rebuilt_key_us,
+                    prebuilt_key_us,
+                    rebuilt_call_us,
+                    prebuilt_call_us,
+                )
+            )
+
+        await transaction.rollback()
+    [cache_stats] = get_statement_cache_stats({"bench": engine})
+    await engine.dispose()
+    return results, cache_stats
+
+
+@app.command()
+def statements(
+    number: int = typer.Option(20_000, help="Statements built per timing round."),
+    calls: int = typer.Option(1000, help="Repository calls per timing round."),
+):
+    """Compare hot repository lookups with rebuilt and prebuilt statements."""
+    results, cache_stats = asyncio.run(_compare_statements(number, calls))
+
+    print(
+        f"{'query':<16} {'build us':>9} {'key us':>7} {'prebuilt key us':>16} "
+        f"{'call us':>8} {'prebuilt call us':>17} {'speedup':>8}"
+    )
+    for (
+        name,
+        build_us,
+        rebuilt_key_us,
+        prebuilt_key_us,
+        rebuilt_call_us,
+        prebuilt_call_us,
+    ) in results:
+        print(
+            f"{name:<16} {build_us:>9.2f} {rebuilt_key_us:>7.2f} "
+            f"{prebuilt_key_us:>16.2f} {rebuilt_call_us:>8.1f} "
+            f"{prebuilt_call_us:>17.1f} {rebuilt_call_us / prebuilt_call_us:>7.2f}x"
+        )
+    print(
+        f"compiled cache: {cache_stats.hits} hits, {cache_stats.misses} misses, "
+        f"{cache_stats.size}/{cache_stats.capacity} entries"
+    )
+
+
+async def _compare_projections(rows: int, rounds: int) -> list[tuple[str, float, int]]:
+    """Time listing users as ORM instances and as projected rows.
+
+    The benchmark users are inserted in a transaction that is rolled back.
+
+    :param rows: The number of users to list per round.
+    :param rounds: The number of timed rounds per case.
+
+    :return: The case name, rows per second and peak KiB allocated per round.
+    """
+    adapter = TypeAdapter(list[UserResponse])
+    cases = [("orm", None), ("projection", list(UserResponse.model_fields))]
+    results = []
+    engine = get_async_engine()
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(bind=connection, expire_on_commit=False)
+        prefix = uuid.uuid4().hex[:8]
+        await session.execute(
+            insert(User),
+            [
+                {"username": f"bench{prefix}{index}", "password_hash": "x" * 60}
+                for index in range(rows)
+            ],
+        )
+        repository = UserRepository(model=User, db_session=session)
+
+        async def list_users(fields: list[str] | None) -> None:
+            users = await repository.get_filtered(limit=rows, fields=fields)
+            adapter.dump_json(adapter.validate_python(users))
+            session.expunge_all()
+
+        for name, fields in cases:
+            await list_users(fields)
+            started_at = time.perf_counter()
+            for _ in range(rounds):
+                await list_users(fields)
+            elapsed = time.perf_counter() - started_at
+
+            tracemalloc.start()
+            await list_users(fields)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            results.append((name, rows * rounds / elapsed, peak // 1024))
+
+        await transaction.rollback()
+    await engine.dispose()
+    return results
+
+
+@app.command()
+def projections(
+    rows: int = typer.Option(1000, help="Users listed per round."),
+    rounds: int = typer.Option(20, help="Timed rounds per case."),
+):
+    """Compare listing users as ORM instances and as projected rows."""
+    print(f"{'path':<12} {'rows/s':>12} {'peak KiB':>10}")
+    for name, rows_per_second, peak_kib in asyncio.run(
+        _compare_projections(rows, rounds)
+    ):
+        print(f"{name:<12} {rows_per_second:>12.0f} {peak_kib:>10}")
+
+
+if __name__ == "__main__":
+    app()
@@ -1,13 +1,22 @@
 import asyncio
+import json
+import sys
+from contextlib import nullcontext
+from typing import Any
 
+import httpx
 import typer
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
+from app.controllers import UserController
+from app.helpers import ExportFormat
 from app.models import Base, Role, User
+from app.repositories import UserRepository
 from core.config import config
+from core.database.engine import create_engine
 
 app = typer.Typer()
 
@@ -17,7 +26,7 @@ def get_async_engine() -> AsyncEngine:
 
     :return: The async engine.
     """
-    return create_async_engine(str(config.SQLALCHEMY_DATABASE_URI))
+    return create_engine(config.SQLALCHEMY_DATABASE_URI, pool=config.DATABASE_CLI_POOL)
 
 
 async def async_init():
@@ -86,6 +95,24 @@ async def async_view():
             print(table)
 
 
+async def async_export(export_format: ExportFormat, output: str, batch_size: int):
+    """Helper function to stream every user to a file or stdout.
+
+    :param export_format: The output format.
+    :param output: The file to write, or '-' for stdout.
+    :param batch_size: The number of users fetched and written at a time.
+    """
+    engine = get_async_engine()
+    async with AsyncSession(engine) as session:
+        controller = UserController(UserRepository(model=User, db_session=session))
+        with (
+            nullcontext(sys.stdout.buffer) if output == "-" else open(output, "wb")
+        ) as file:
+            async for chunk in controller.export(export_format, batch_size):
+                file.write(chunk)
+    await engine.dispose()
+
+
 @app.command()
 def init():
     """Initialize the database."""
@@ -101,6 +128,89 @@ def drop(tables: str = typer.Argument(None)):
     asyncio.run(async_drop(tables))
 
 
+@app.command()
+def export(
+    export_format: ExportFormat = typer.Option(
+        ExportFormat.NDJSON, "--format", help="The output format."
+    ),
+    output: str = typer.Option("-", help="The file to write, or '-' for stdout."),
+    batch_size: int = typer.Option(
+        config.EXPORT_BATCH_SIZE, help="Users fetched and written at a time."
+    ),
+):
+    """Export every user as NDJSON or CSV with constant memory."""
+    asyncio.run(async_export(export_format, output, batch_size))
+
+
+def _summarize_plan(plan: Any) -> str:
+    """Describe the top node of a JSON query plan and the indexes it reads.
+
+    :param plan: The output of ``EXPLAIN (FORMAT JSON)``.
+
+    :return: A one-line summary.
+    """
+    root = plan[0]["Plan"]
+    summary = root["Node Type"]
+    if "Relation Name" in root:
+        summary += f" on {root['Relation Name']}"
+    summary += f" (cost {root['Total Cost']})"
+
+    indexes, nodes = [], [root]
+    while nodes:
+        node = nodes.pop()
+        if "Index Name" in node and node["Index Name"] not in indexes:
+            indexes.append(node["Index Name"])
+        nodes.extend(node.get("Plans", []))
+    if indexes:
+        summary += f", using {', '.join(indexes)}"
+    return summary
+
+
+@app.command()
+def slow(
+    url: str = typer.Option("http://localhost:8000", help="The running API server."),
+    plans: bool = typer.Option(False, help="Print the full plan of each query."),
+):
+    """Print the slow-query log of a running API server.
+
+    Logs in as the configured admin. The log is kept per worker process, so
+    this shows the log of whichever worker answers.
+    """
+    with httpx.Client(base_url=url, timeout=10) as client:
+        login = client.post(
+            "/api/v1/tokens", auth=(config.ADMIN_USERNAME, config.ADMIN_PASSWORD)
+        )
+        login.raise_for_status()
+        response = client.get(
+            "/api/v1/internal/database/slow-queries",
+            headers={"Authorization": f"Bearer {login.json()['access_token']}"},
+        )
+        response.raise_for_status()
+
+    report = response.json()
+    print(
+        f"Worker {report['worker_pid']}: {len(report['queries'])} statement(s) "
+        f"over {report['threshold'] * 1000:.0f} ms"
+    )
+    for query in report["queries"]:
+        status = " failed" if query["failed"] else ""
+        print(
+            f"\n{query['recorded_at']} {query['duration'] * 1000:.1f} ms "
+            f"{query['engine']} {query['fingerprint']}{status}"
+        )
+        print(f"  {query['statement']}")
+        if query["parameters"]:
+            print(f"  parameters: {', '.join(query['parameters'])}")
+        if query["plan"] is not None:
+            print(f"  plan: {_summarize_plan(query['plan'])}")
+            if plans:
+                print(json.dumps(query["plan"], indent=2))
+        elif query["explain_error"] is not None:
+            print(f"  plan unavailable: {query['explain_error']}")
+        else:
+            print("  plan pending")
+
+
 @app.command()
 def view():
     """View all tables in the database."""
@@ -1,6 +1,6 @@
 from enum import StrEnum
 
-from pydantic import PostgresDsn, computed_field
+from pydantic import BaseModel, PostgresDsn, computed_field
 from pydantic_core import MultiHostUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -11,10 +11,43 @@ class EnvironmentType(StrEnum):
     TESTING = "testing"
 
 
+class PasswordHashAlgorithm(StrEnum):
+    BCRYPT = "bcrypt"
+    SCRYPT = "scrypt"
+    PBKDF2_SHA256 = "pbkdf2-sha256"
+    ARGON2 = "argon2"
+
+
+class ExecutorType(StrEnum):
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class ReplicaSelection(StrEnum):
+    ROUND_ROBIN = "round_robin"
+    LEAST_CONNECTIONS = "least_connections"
+
+
+class PoolConfig(BaseModel):
+    """Connection pool settings of one engine role.
+
+    ``statement_cache_size`` sizes both asyncpg's and SQLAlchemy's prepared
+    statement caches; set it to 0 behind pgbouncer in transaction mode.
+    """
+
+    size: int = 5
+    max_overflow: int = 10
+    timeout: float = 30
+    recycle: int = 3600
+    pre_ping: bool = True
+    statement_cache_size: int = 100
+
+
 class Config(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
         env_ignore_empty=True,
+        env_nested_delimiter="__",
         extra="ignore",
     )
 
@@ -27,12 +60,45 @@ class Config(BaseSettings):
     SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRE_MINUTES: int = 60 * 24
+    TOKEN_CACHE_SIZE: int = 10_000
+    TOKEN_VERSION_TTL_SECONDS: float = 30
+
+    PASSWORD_HASH_ALGORITHM: PasswordHashAlgorithm = PasswordHashAlgorithm.BCRYPT
+    PASSWORD_HASH_EXECUTOR: ExecutorType = ExecutorType.THREAD
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_SIZE: int = 64
+
+    BCRYPT_ROUNDS: int = 12
+    BCRYPT_HASH_BUDGET_MS: float = 250
+    BCRYPT_MIN_ROUNDS: int = 10
+    BCRYPT_MAX_ROUNDS: int = 16
+    SCRYPT_COST: int = 14
+    SCRYPT_BLOCK_SIZE: int = 8
+    SCRYPT_PARALLELISM: int = 1
+    PBKDF2_ITERATIONS: int = 600_000
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536
+    ARGON2_PARALLELISM: int = 4
 
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
     POSTGRES_HOST: str
     POSTGRES_PORT: int = 5432
     POSTGRES_DB: str
+    POSTGRES_REPLICA_HOSTS: list[str] = []
+    DATABASE_WRITER_POOL: PoolConfig = PoolConfig()
+    DATABASE_READER_POOL: PoolConfig = PoolConfig()
+    DATABASE_CLI_POOL: PoolConfig = PoolConfig(size=1, max_overflow=0)
+    REPLICA_SELECTION: ReplicaSelection = ReplicaSelection.ROUND_ROBIN
+    REPLICA_HEALTH_CHECK_SECONDS: float = 5
+    REPLICA_MAX_LAG_SECONDS: float = 10
+    READ_YOUR_WRITES_SECONDS: float = 5
+    READ_ONLY_STATEMENT_TIMEOUT_SECONDS: float = 5
+    REPEATED_STATEMENT_THRESHOLD: int = 10
+    SLOW_QUERY_SECONDS: float = 0.5
+    SLOW_QUERY_LOG_SIZE: int = 100
+    SLOW_QUERY_EXPLAIN_TIMEOUT_SECONDS: float = 5
+    EXPORT_BATCH_SIZE: int = 1000
 
     ADMIN_USERNAME: str
     ADMIN_PASSWORD: str
@@ -56,5 +122,30 @@ class Config(BaseSettings):
             path=self.POSTGRES_DB,
         )
 
+    @computed_field
+    @property
+    def SQLALCHEMY_REPLICA_URIS(self) -> list[PostgresDsn]:
+        """Build the async SQLAlchemy URIs of the read replicas.
+
+        Replicas share the primary's credentials and database name. Each entry
+        of ``POSTGRES_REPLICA_HOSTS`` is a ``host`` or ``host:port``.
+
+        :return: One PostgreSQL DSN per configured replica.
+        """
+        uris = []
+        for replica in self.POSTGRES_REPLICA_HOSTS:
+            host, _, port = replica.partition(":")
+            uris.append(
+                MultiHostUrl.build(
+                    scheme="postgresql+asyncpg",
+                    username=self.POSTGRES_USER,
+                    password=self.POSTGRES_PASSWORD,
+                    host=host,
+                    port=int(port) if port else self.POSTGRES_PORT,
+                    path=self.POSTGRES_DB,
+                )
+            )
+        return uris
+
 
 config: Config = Config()
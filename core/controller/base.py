@@ -1,6 +1,7 @@
-from collections.abc import Mapping, Sequence
+from collections.abc import AsyncIterator, Mapping, Sequence
 from typing import Any, Generic, TypeVar
 
+from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.sql.elements import ColumnElement
 
@@ -30,6 +31,20 @@ class BaseController(Generic[ModelType]):
         except IntegrityError as e:
             raise BadRequestException(f"Database Integrity Error: {e.orig}")
 
+    async def bulk_create(
+        self, attributes: Sequence[Mapping[str, Any]]
+    ) -> Sequence[ModelType]:
+        """Creates many Objects in the DB in a single statement.
+
+        :param attributes: The attributes to create each object with.
+
+        :return: The created objects, in the order of ``attributes``.
+        """
+        try:
+            return await self.repository.bulk_create(attributes)
+        except IntegrityError as e:
+            raise BadRequestException(f"Database Integrity Error: {e.orig}")
+
     async def get_all(self, skip: int = 0, limit: int = 100) -> Sequence[ModelType]:
         """Returns a list of records based on pagination params.
 
@@ -46,16 +61,52 @@ class BaseController(Generic[ModelType]):
         filters: Sequence[ColumnElement[bool]] | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> Sequence[ModelType]:
+        fields: Sequence[str] | None = None,
+    ) -> Sequence[ModelType] | Sequence[Row]:
         """Retrieves a filtered list of model instances based on provided filters.
 
         :param filters: A dictionary where keys are the model fields and values are the values to filter by.
         :param skip: The number of records to skip.
         :param limit: The number of records to return.
+        :param fields: The columns to select, if not whole model instances.
+
+        :return: A list of model instances, or of rows when ``fields`` is given.
+        """
+        return await self.repository.get_filtered(filters, skip, limit, fields)
+
+    async def get_page(
+        self,
+        filters: Sequence[ColumnElement[bool]] | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+        fields: Sequence[str] | None = None,
+    ) -> tuple[Sequence[ModelType] | Sequence[Row], str | None]:
+        """Returns a page of records after the given cursor.
+
+        :param filters: The filters to apply.
+        :param cursor: The cursor returned with the previous page, if any.
+        :param limit: The number of records to return.
+        :param fields: The columns to select, if not whole model instances.
+
+        :return: The records and the cursor of the next page, if any.
+        """
+        return await self.repository.get_page(filters, cursor, limit, fields)
+
+    def stream(
+        self,
+        filters: Sequence[ColumnElement[bool]] | None = None,
+        fields: Sequence[str] | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[ModelType] | Sequence[Row]]:
+        """Yields every matching record in batches, with constant memory.
+
+        :param filters: The filters to apply.
+        :param fields: The columns to select, if not whole model instances.
+        :param batch_size: The number of records fetched per batch.
 
-        :return: A list of model instances.
+        :return: An async iterator of batches of records.
         """
-        return await self.repository.get_filtered(filters, skip, limit)
+        return self.repository.stream(filters, fields, batch_size)
 
     async def get_by_id(self, id_: int) -> ModelType | None:
         """Returns the model instance matching the id.
@@ -71,9 +122,7 @@ class BaseController(Generic[ModelType]):
             unique=True,
         )
         if not db_obj:
-            raise NotFoundException(
-                f"{self.model_class.__tablename__.title()} with id: {id_} does not exist"
-            )
+            raise self._not_found(id_)
 
         return db_obj
 
@@ -83,17 +132,60 @@ class BaseController(Generic[ModelType]):
         :param id_: The id of the object to update.
         :param attributes: The attributes to update the object with.
 
+        :raises NotFoundException: If no object has the id.
+
         :return: The updated object.
         """
-        db_obj = await self.get_by_id(id_)
-        return await self.repository.update(db_obj, attributes)
+        try:
+            db_obj = await self.repository.update_by_id(id_, attributes)
+        except IntegrityError as e:
+            raise BadRequestException(f"Database Integrity Error: {e.orig}")
+        if not db_obj:
+            raise self._not_found(id_)
+
+        return db_obj
+
+    async def bulk_update(
+        self, ids: Sequence[int], attributes: Mapping[str, Any]
+    ) -> Sequence[ModelType]:
+        """Updates many Objects in the DB in a single statement.
+
+        :param ids: The ids of the objects to update.
+        :param attributes: The attributes to update the objects with.
+
+        :return: The updated objects; ids that do not exist are left out.
+        """
+        try:
+            return await self.repository.bulk_update(ids, attributes)
+        except IntegrityError as e:
+            raise BadRequestException(f"Database Integrity Error: {e.orig}")
+
+    async def bulk_delete(self, ids: Sequence[int]) -> Sequence[int]:
+        """Deletes many Objects from the DB in a single statement.
+
+        :param ids: The ids of the objects to delete.
+
+        :return: The ids that were deleted.
+        """
+        return await self.repository.bulk_delete(ids)
 
     async def delete(self, id_: int) -> None:
         """Deletes the Object from the DB.
 
         :param id_: The id of the object to delete.
 
-        :return: True if the object was deleted, False otherwise.
+        :raises NotFoundException: If no object has the id.
         """
-        db_obj = await self.get_by_id(id_)
-        return await self.repository.delete(db_obj)
+        if not await self.repository.delete_by_id(id_):
+            raise self._not_found(id_)
+
+    def _not_found(self, id_: int) -> NotFoundException:
+        """Build the error raised when no object has the id.
+
+        :param id_: The id that did not match.
+
+        :return: The exception to raise.
+        """
+        return NotFoundException(
+            f"{self.model_class.__tablename__.title()} with id: {id_} does not exist"
+        )
@@ -1,3 +1,4 @@
+from core.database.read_only import clear_read_only, set_read_only
 from core.database.session import (
     Base,
     get_session,
@@ -5,6 +6,13 @@ from core.database.session import (
     session,
     set_session_context,
 )
+from core.database.unit_of_work import after_commit, in_unit_of_work, unit_of_work
+from core.database.usage import (
+    DatabaseUsage,
+    get_database_usage,
+    reset_database_usage,
+    set_database_usage,
+)
 
 __all__ = [
     "Base",
@@ -12,4 +20,13 @@ __all__ = [
     "get_session",
     "set_session_context",
     "reset_session_context",
+    "set_read_only",
+    "clear_read_only",
+    "in_unit_of_work",
+    "after_commit",
+    "unit_of_work",
+    "DatabaseUsage",
+    "get_database_usage",
+    "set_database_usage",
+    "reset_database_usage",
 ]
@@ -0,0 +1,75 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from contextvars import ContextVar, Token
+
+consistency_key_context: ContextVar[Hashable | None] = ContextVar(
+    "consistency_key_context", default=None
+)
+
+
+def get_consistency_key() -> Hashable | None:
+    """Return the key whose recent writes the current context must observe.
+
+    :return: The key, usually the authenticated user id, or None.
+    """
+    return consistency_key_context.get()
+
+
+def set_consistency_key(key: Hashable | None) -> Token:
+    """Bind the current context to a read-your-writes key.
+
+    :param key: The key, usually the authenticated user id.
+
+    :return: A token that can be used to restore the previous key.
+    """
+    return consistency_key_context.set(key)
+
+
+def reset_consistency_key(context: Token) -> None:
+    """Restore the read-your-writes key from a previous token.
+
+    :param context: The token returned by ``set_consistency_key``.
+    """
+    consistency_key_context.reset(context)
+
+
+class RecentWrites:
+    """Bounded table of the last write time per key.
+
+    Reads for a key that wrote within ``window`` seconds are routed to the
+    writer, so its own changes are visible even if the replicas lag. Keys are
+    kept in write order, so expired entries are dropped from the front.
+    """
+
+    def __init__(self, window: float = 5, max_size: int = 10_000):
+        self.window = window
+        self.max_size = max_size
+        self._written_at: OrderedDict[Hashable, float] = OrderedDict()
+
+    def mark(self, key: Hashable) -> None:
+        """Record a write for a key.
+
+        :param key: The key that wrote.
+        """
+        if self.window <= 0:
+            return
+
+        now = time.monotonic()
+        self._written_at[key] = now
+        self._written_at.move_to_end(key)
+        while self._written_at and (
+            len(self._written_at) > self.max_size
+            or now - next(iter(self._written_at.values())) >= self.window
+        ):
+            self._written_at.popitem(last=False)
+
+    def is_recent(self, key: Hashable) -> bool:
+        """Check whether a key wrote within the window.
+
+        :param key: The key to check.
+
+        :return: True if reads for the key should go to the writer.
+        """
+        written_at = self._written_at.get(key)
+        return written_at is not None and time.monotonic() - written_at < self.window
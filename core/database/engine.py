@@ -0,0 +1,186 @@
+import time
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Engine, event, exc
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from core.config import PoolConfig
+from core.database.usage import get_database_usage
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    name: str
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    total_wait: float
+    max_wait: float
+
+
+@dataclass(frozen=True)
+class StatementCacheStats:
+    name: str
+    size: int
+    capacity: int
+    hits: int
+    misses: int
+    uncached: int
+
+    @property
+    def hit_ratio(self) -> float | None:
+        """The share of cacheable statements found compiled, if any ran."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+
+# Compiled cache lookups per engine, counted by ``track_statement_cache``.
+_statement_cache_lookups: WeakKeyDictionary[Engine, Counter[CacheStats]] = (
+    WeakKeyDictionary()
+)
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long checkouts wait.
+
+    The wait covers everything between asking for a connection and getting
+    it: queueing for a free slot, opening a new connection and the pre-ping.
+    It is also added to the usage record of the request that waited.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, timing the wait.
+
+        :return: The checked out connection.
+        """
+        started_at = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+
+        waited = time.perf_counter() - started_at
+        self.checkouts += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        if (usage := get_database_usage()) is not None:
+            usage.pool_wait += waited
+        return connection
+
+
+def create_engine(url: object, pool: PoolConfig) -> AsyncEngine:
+    """Create an async engine with an instrumented, configured pool.
+
+    :param url: The database URL.
+    :param pool: The pool settings of the engine's role.
+
+    :return: The async engine.
+    """
+    engine = create_async_engine(
+        str(url),
+        poolclass=InstrumentedAsyncPool,
+        pool_size=pool.size,
+        max_overflow=pool.max_overflow,
+        pool_timeout=pool.timeout,
+        pool_recycle=pool.recycle,
+        pool_pre_ping=pool.pre_ping,
+        connect_args={
+            "statement_cache_size": pool.statement_cache_size,
+            "prepared_statement_cache_size": pool.statement_cache_size,
+        },
+    )
+    track_statement_cache(engine)
+    return engine
+
+
+def track_statement_cache(engine: AsyncEngine) -> None:
+    """Count how often an engine's statements are found in its compiled cache.
+
+    Engines derived with ``execution_options`` share the cache and the counts.
+
+    :param engine: The engine to instrument.
+    """
+    sync_engine = engine.sync_engine
+    if sync_engine in _statement_cache_lookups:
+        return
+    lookups = _statement_cache_lookups[sync_engine] = Counter()
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def count_lookup(
+        conn, cursor, statement, parameters, context, executemany  # noqa: ARG001
+    ):
+        if context is not None:
+            lookups[context.cache_hit] += 1
+
+
+def get_pool_stats(engines: Mapping[str, AsyncEngine]) -> list[PoolStats]:
+    """Report the occupancy and checkout waits of each engine's pool.
+
+    :param engines: The engines to report on, by name.
+
+    :return: One entry per engine.
+    """
+    stats = []
+    for name, engine in engines.items():
+        pool = engine.sync_engine.pool
+        instrumented = isinstance(pool, InstrumentedAsyncPool)
+        stats.append(
+            PoolStats(
+                name=name,
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=max(pool.overflow(), 0),
+                checkouts=pool.checkouts if instrumented else 0,
+                timeouts=pool.timeouts if instrumented else 0,
+                total_wait=pool.total_wait if instrumented else 0.0,
+                max_wait=pool.max_wait if instrumented else 0.0,
+            )
+        )
+    return stats
+
+
+def get_statement_cache_stats(
+    engines: Mapping[str, AsyncEngine],
+) -> list[StatementCacheStats]:
+    """Report the occupancy and hit counts of each engine's compiled cache.
+
+    Statements without a cache key, such as raw driver SQL, count as uncached.
+
+    :param engines: The engines to report on, by name.
+
+    :return: One entry per engine.
+    """
+    stats = []
+    for name, engine in engines.items():
+        cache = engine.sync_engine._compiled_cache
+        lookups = _statement_cache_lookups.get(engine.sync_engine, Counter())
+        hits = lookups[CacheStats.CACHE_HIT]
+        misses = lookups[CacheStats.CACHE_MISS]
+        stats.append(
+            StatementCacheStats(
+                name=name,
+                size=len(cache) if cache is not None else 0,
+                capacity=cache.capacity if cache is not None else 0,
+                hits=hits,
+                misses=misses,
+                uncached=lookups.total() - hits - misses,
+            )
+        )
+    return stats
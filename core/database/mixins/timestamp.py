@@ -1,38 +1,44 @@
-from datetime import UTC, datetime
-
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, func
 from sqlalchemy.ext.declarative import declared_attr
+from sqlalchemy.sql.elements import ColumnElement
 
 
-def utc_now() -> datetime:
-    """Return the current UTC timestamp as a naive datetime.
+def utc_now() -> ColumnElement:
+    """Return the database's current UTC timestamp as a naive datetime.
 
-    SQLAlchemy stores the timestamp columns without timezone information, so
-    this helper normalizes the UTC value before persistence.
+    The timestamp columns are stored without timezone information, so the
+    transaction time is converted to UTC before the zone is dropped. Taking
+    it from the database lets bulk and ``RETURNING`` writes stamp rows without
+    first loading them.
 
-    :return: A naive datetime representing the current UTC time.
+    :return: A SQL expression evaluating to the current UTC time.
     """
-    return datetime.now(UTC).replace(tzinfo=None)
+    return func.timezone("UTC", func.now())
 
 
 class TimestampMixin:
+    # Read server-generated timestamps back with RETURNING as part of each
+    # flush, so they never have to be lazy loaded.
+    __mapper_args__ = {"eager_defaults": True}
+
     @declared_attr
     def created_at(cls):
         """Declare the model creation timestamp column.
 
-        :return: A non-nullable SQLAlchemy datetime column populated on insert.
+        :return: A non-nullable SQLAlchemy datetime column set by the database.
         """
-        return Column(DateTime, default=utc_now, nullable=False)
+        return Column(DateTime, server_default=utc_now(), nullable=False)
 
     @declared_attr
     def updated_at(cls):
         """Declare the model update timestamp column.
 
-        :return: A non-nullable SQLAlchemy datetime column updated on changes.
+        :return: A non-nullable SQLAlchemy datetime column set by the database
+            on insert and on every update.
         """
         return Column(
             DateTime,
-            default=utc_now,
-            onupdate=utc_now,
+            server_default=utc_now(),
+            onupdate=utc_now(),
             nullable=False,
         )
@@ -0,0 +1,34 @@
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+
+_READ_ONLY_KEY = "read_only"
+
+
+def set_read_only(
+    session: AsyncSession | async_scoped_session, statement_timeout: float
+) -> None:
+    """Make a session's transactions read-only with a statement timeout.
+
+    Must be called before the session begins its first transaction.
+
+    :param session: The session to restrict.
+    :param statement_timeout: Seconds after which a statement is cancelled.
+    """
+    session.info[_READ_ONLY_KEY] = statement_timeout
+
+
+def clear_read_only(session: AsyncSession | async_scoped_session) -> None:
+    """Lift the read-only restriction of a session.
+
+    :param session: The restricted session.
+    """
+    session.info.pop(_READ_ONLY_KEY, None)
+
+
+def get_statement_timeout(info: dict) -> float | None:
+    """Return the statement timeout of a read-only session.
+
+    :param info: The ``info`` dictionary of the session.
+
+    :return: The timeout in seconds, or None if the session may write.
+    """
+    return info.get(_READ_ONLY_KEY)
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+from collections.abc import Sequence
+from itertools import count
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.config import ReplicaSelection
+
+logger = logging.getLogger(__name__)
+
+# Seconds since the last replayed transaction, or zero when the replica has
+# replayed everything it received. Primaries report zero.
+REPLICATION_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+""")
+
+
+class Replica:
+    """A read replica engine and the outcome of its latest health check."""
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.healthy = True
+        self.lag: float | None = None
+
+    @property
+    def name(self) -> str:
+        """The replica's host and port, for logging."""
+        url = self.engine.url
+        return f"{url.host}:{url.port}"
+
+    @property
+    def connections(self) -> int:
+        """The number of connections currently checked out of the pool."""
+        return self.engine.sync_engine.pool.checkedout()
+
+
+class ReplicaSet:
+    """Load-balanced read replicas with lag-aware eviction.
+
+    Replicas start out healthy. ``check`` measures each replica's replication
+    lag and evicts those that are unreachable or lag by more than ``max_lag``
+    seconds; they rejoin once a later check finds them caught up. ``choose``
+    returns None when no replica is healthy, so reads fall back to the writer.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        selection: ReplicaSelection = ReplicaSelection.ROUND_ROBIN,
+        max_lag: float = 10,
+    ):
+        self.replicas = [Replica(engine) for engine in engines]
+        self.selection = selection
+        self.max_lag = max_lag
+        self._turns = count()
+
+    def choose(self) -> AsyncEngine | None:
+        """Pick a healthy replica for the next reading session.
+
+        :return: The replica engine, or None when no replica is healthy.
+        """
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        if self.selection == ReplicaSelection.LEAST_CONNECTIONS:
+            return min(healthy, key=lambda replica: replica.connections).engine
+        return healthy[next(self._turns) % len(healthy)].engine
+
+    def is_healthy(self, engine: AsyncEngine) -> bool:
+        """Check whether a replica chosen earlier is still healthy.
+
+        :param engine: The replica engine returned by ``choose``.
+
+        :return: False if the replica has been evicted or is no longer known.
+        """
+        return any(
+            replica.engine is engine and replica.healthy for replica in self.replicas
+        )
+
+    async def check(self, timeout: float = 5) -> None:
+        """Measure every replica's lag and update its health.
+
+        :param timeout: Seconds to wait for each replica before evicting it.
+        """
+        await asyncio.gather(
+            *(self._check_replica(replica, timeout) for replica in self.replicas)
+        )
+
+    async def run_health_checks(self, interval: float) -> None:
+        """Check the replicas every ``interval`` seconds until cancelled.
+
+        :param interval: Seconds between two rounds of checks.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            await self.check(timeout=interval)
+
+    @property
+    def engines(self) -> dict[str, AsyncEngine]:
+        """The replica engines, by replica name."""
+        return {f"replica {replica.name}": replica.engine for replica in self.replicas}
+
+    async def dispose(self) -> None:
+        """Close the connection pools of every replica."""
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    async def _check_replica(self, replica: Replica, timeout: float) -> None:
+        try:
+            async with asyncio.timeout(timeout):
+                async with replica.engine.connect() as connection:
+                    lag = await connection.scalar(REPLICATION_LAG_QUERY)
+        except Exception:
+            if replica.healthy:
+                logger.warning("Replica %s evicted: health check failed", replica.name)
+            replica.healthy, replica.lag = False, None
+            return
+
+        replica.lag = float(lag or 0)
+        healthy = replica.lag <= self.max_lag
+        if healthy != replica.healthy:
+            logger.warning(
+                "Replica %s %s with %.1fs lag",
+                replica.name,
+                "rejoined" if healthy else "evicted",
+                replica.lag,
+            )
+        replica.healthy = healthy
@@ -1,15 +1,24 @@
+import functools
 from contextvars import ContextVar, Token
 
-from sqlalchemy.engine import Engine
-from sqlalchemy.ext.asyncio import (
-    AsyncSession,
-    async_scoped_session,
-    create_async_engine,
-)
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from sqlalchemy.sql.expression import Delete, Insert, Update
 
 from core.config import config
+from core.database.consistency import RecentWrites, get_consistency_key
+from core.database.engine import create_engine
+from core.database.read_only import get_statement_timeout
+from core.database.replicas import ReplicaSet
+from core.database.slow_queries import SlowQueryRecorder
+from core.database.usage import (
+    TRACK_USAGE_OPTION,
+    track_pool_usage,
+    track_statement_usage,
+)
 
 session_context: ContextVar[str] = ContextVar("session_context")
 
@@ -46,28 +55,106 @@ def reset_session_context(context: Token) -> None:
 
 
 engines = {
-    "writer": create_async_engine(
-        str(config.SQLALCHEMY_DATABASE_URI), pool_recycle=3600
-    ),
-    "reader": create_async_engine(
-        str(config.SQLALCHEMY_DATABASE_URI), pool_recycle=3600
+    "writer": create_engine(
+        config.SQLALCHEMY_DATABASE_URI, pool=config.DATABASE_WRITER_POOL
     ),
 }
+replicas = ReplicaSet(
+    [
+        create_engine(uri, pool=config.DATABASE_READER_POOL)
+        for uri in config.SQLALCHEMY_REPLICA_URIS
+    ],
+    selection=config.REPLICA_SELECTION,
+    max_lag=config.REPLICA_MAX_LAG_SECONDS,
+)
+recent_writes = RecentWrites(window=config.READ_YOUR_WRITES_SECONDS)
+slow_queries = SlowQueryRecorder(
+    threshold=config.SLOW_QUERY_SECONDS,
+    max_size=config.SLOW_QUERY_LOG_SIZE,
+    explain_timeout=config.SLOW_QUERY_EXPLAIN_TIMEOUT_SECONDS,
+)
+
+for name, engine in {**engines, **replicas.engines}.items():
+    track_pool_usage(engine)
+    track_statement_usage(engine)
+    slow_queries.track(engine, name)
+
+
+@functools.cache
+def _read_only(engine: Engine) -> Engine:
+    """Return a variant of an engine whose transactions begin ``READ ONLY``.
+
+    The variant shares the engine's pool; the flag is reset when a connection
+    is returned to it.
+
+    :param engine: The engine to wrap.
+
+    :return: The read-only engine.
+    """
+    return engine.execution_options(postgresql_readonly=True)
 
 
 class RoutingSession(Session):
     def get_bind(self, mapper=None, clause=None, **kwargs) -> Engine:
         """Route database queries to the appropriate engine.
 
+        Writes go to the writer. Reads go to a replica chosen once per session,
+        so one request reads from a single replica, or to the writer when no
+        replica is healthy. A pinned replica that a health check has since
+        evicted is replaced, so long-lived sessions stop reading from it. Once
+        a session writes, its later reads stay on the writer, and so do reads
+        of sessions whose consistency key wrote within the last
+        ``READ_YOUR_WRITES_SECONDS``. Read-only sessions run their
+        reads in ``READ ONLY`` transactions and refuse to write.
+
         :param mapper: The mapper.
         :param clause: The clause.
         :param kwargs: Additional keyword arguments.
 
+        :raises InvalidRequestError: If a read-only session tries to write.
+
         :return: The engine.
         """
+        read_only = get_statement_timeout(self.info) is not None
         if self._flushing or isinstance(clause, Update | Delete | Insert):
+            if read_only:
+                raise InvalidRequestError("Read-only sessions cannot write")
+            self.info["replica"] = None
+            if (key := get_consistency_key()) is not None:
+                recent_writes.mark(key)
             return engines["writer"].sync_engine
-        return engines["reader"].sync_engine
+
+        replica = self.info.get("replica")
+        if "replica" not in self.info or (
+            replica is not None and not replicas.is_healthy(replica)
+        ):
+            key = get_consistency_key()
+            if key is not None and recent_writes.is_recent(key):
+                self.info["replica"] = None
+            else:
+                self.info["replica"] = replicas.choose()
+        engine = (self.info["replica"] or engines["writer"]).sync_engine
+        return _read_only(engine) if read_only else engine
+
+
+@event.listens_for(RoutingSession, "after_begin")
+def set_statement_timeout(
+    session: RoutingSession, transaction, connection: Connection  # noqa: ARG001
+) -> None:
+    """Apply a read-only session's statement timeout to its transaction.
+
+    The ``SET LOCAL`` is not counted in the request's database usage.
+
+    :param session: The session that began a transaction.
+    :param transaction: The session transaction.
+    :param connection: The connection the transaction runs on.
+    """
+    statement_timeout = get_statement_timeout(session.info)
+    if statement_timeout is not None:
+        connection.exec_driver_sql(
+            f"SET LOCAL statement_timeout = {int(statement_timeout * 1000)}",
+            execution_options={TRACK_USAGE_OPTION: False},
+        )
 
 
 async_session_factory = sessionmaker(
@@ -0,0 +1,249 @@
+import asyncio
+import contextvars
+import hashlib
+import logging
+import re
+import time
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+_STARTED_AT_KEY = "slow_query_started_at"
+_EXPLAIN_OPTION = "slow_query_explain"
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "VALUES")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+(?:::\w+(?:\[\])?)?")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+
+
+@dataclass
+class SlowQuery:
+    """A statement that ran longer than the recorder's threshold.
+
+    Only the shape of the statement and the types of its parameters are kept,
+    never their values. ``plan`` is filled in once the ``EXPLAIN`` finishes.
+    """
+
+    fingerprint: str
+    statement: str
+    parameters: list[str]
+    duration: float
+    engine: str
+    recorded_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    failed: bool = False
+    plan: Any = None
+    explain_error: str | None = None
+
+
+def normalize_statement(statement: str) -> str:
+    """Reduce a statement to its shape.
+
+    Literals and placeholders become ``?``, lists of them collapse to one,
+    and whitespace is collapsed, so runs with different values match.
+
+    :param statement: The SQL statement.
+
+    :return: The normalized statement.
+    """
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER_LIST.sub("?", statement)
+    return " ".join(statement.split())
+
+
+def fingerprint_statement(statement: str) -> str:
+    """Identify the shape of a statement.
+
+    :param statement: The SQL statement.
+
+    :return: A short hexadecimal digest of the normalized statement.
+    """
+    return hashlib.sha1(normalize_statement(statement).encode()).hexdigest()[:16]
+
+
+def describe_parameters(parameters: Any) -> list[str]:
+    """Describe the bound parameters of a statement without their values.
+
+    :param parameters: The parameters passed to the DBAPI cursor.
+
+    :return: The type names of the parameters, in order.
+    """
+    if isinstance(parameters, dict):
+        parameters = parameters.values()
+    elif not isinstance(parameters, Sequence) or isinstance(parameters, str):
+        return []
+    return [type(value).__name__ for value in parameters]
+
+
+class SlowQueryRecorder:
+    """Bounded, per-process log of slow statements and their plans.
+
+    Statements of tracked engines that run for ``threshold`` seconds or more,
+    or fail after that long, are kept in a ring buffer of the last
+    ``max_size``. The plan of each one is captured with ``EXPLAIN (ANALYZE off,
+    FORMAT JSON)`` in a background task on the same engine, so the request
+    that ran the statement does not wait for it. Only one ``EXPLAIN`` runs at
+    a time, and a statement shape whose plan is still being captured is not
+    explained again.
+    """
+
+    def __init__(
+        self, threshold: float = 0.5, max_size: int = 100, explain_timeout: float = 5
+    ):
+        self.threshold = threshold
+        self.explain_timeout = explain_timeout
+        self._queries: deque[SlowQuery] = deque(maxlen=max_size)
+        self._explaining = asyncio.Semaphore(1)
+        self._pending: dict[str, asyncio.Task] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether statements are recorded at all."""
+        return self.threshold > 0 and self._queries.maxlen != 0
+
+    def queries(self) -> list[SlowQuery]:
+        """Return the recorded statements, most recent first.
+
+        :return: The slow queries.
+        """
+        return list(reversed(self._queries))
+
+    def clear(self) -> None:
+        """Forget every recorded statement."""
+        self._queries.clear()
+
+    def track(self, engine: AsyncEngine, name: str) -> None:
+        """Record the engine's slow statements.
+
+        Engines derived with ``execution_options`` share the tracking.
+
+        :param engine: The engine to track.
+        :param name: The name of the engine in the recorded entries.
+        """
+        if not self.enabled:
+            return
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def before_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany  # noqa: ARG001
+        ) -> None:
+            conn.info.setdefault(_STARTED_AT_KEY, []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def after_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany  # noqa: ARG001
+        ) -> None:
+            self._finish(engine, name, conn, statement, parameters, executemany)
+
+        @event.listens_for(sync_engine, "handle_error")
+        def handle_error(exception_context: ExceptionContext) -> None:
+            context = exception_context.execution_context
+            if exception_context.connection is not None:
+                self._finish(
+                    engine,
+                    name,
+                    exception_context.connection,
+                    exception_context.statement,
+                    exception_context.parameters,
+                    context is not None and context.executemany,
+                    failed=True,
+                )
+
+    def _finish(
+        self,
+        engine: AsyncEngine,
+        name: str,
+        connection: Connection,
+        statement: str | None,
+        parameters: Any,
+        executemany: bool,
+        failed: bool = False,
+    ) -> None:
+        """Record a finished or failed statement if it was slow.
+
+        :param engine: The engine the statement ran on.
+        :param name: The name of the engine.
+        :param connection: The connection the statement ran on.
+        :param statement: The SQL of the statement.
+        :param parameters: The parameters passed to the DBAPI cursor.
+        :param executemany: Whether the statement ran once per parameter set;
+            such statements are recorded but not explained.
+        :param failed: Whether the statement raised.
+        """
+        started_at = connection.info.get(_STARTED_AT_KEY)
+        if not started_at:
+            return
+        duration = time.perf_counter() - started_at.pop()
+        if (
+            duration < self.threshold
+            or statement is None
+            or connection.get_execution_options().get(_EXPLAIN_OPTION)
+        ):
+            return
+
+        query = SlowQuery(
+            fingerprint=fingerprint_statement(statement),
+            statement=normalize_statement(statement),
+            parameters=describe_parameters(
+                parameters[0] if executemany and parameters else parameters
+            ),
+            duration=duration,
+            engine=name,
+            failed=failed,
+        )
+        self._queries.append(query)
+        logger.warning(
+            "Slow statement on %s took %.1f ms (%s): %s",
+            name,
+            duration * 1000,
+            query.fingerprint,
+            query.statement,
+        )
+
+        explainable = statement.lstrip().upper().startswith(_EXPLAINABLE)
+        if not explainable or executemany or query.fingerprint in self._pending:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        # The task must not count towards the request's database usage.
+        task = loop.create_task(
+            self._explain(engine, query, statement, parameters),
+            context=contextvars.Context(),
+        )
+        self._pending[query.fingerprint] = task
+        task.add_done_callback(lambda _: self._pending.pop(query.fingerprint, None))
+
+    async def _explain(
+        self, engine: AsyncEngine, query: SlowQuery, statement: str, parameters: Any
+    ) -> None:
+        """Capture the plan of a slow statement.
+
+        :param engine: The engine the statement ran on.
+        :param query: The recorded entry to attach the plan to.
+        :param statement: The SQL of the statement.
+        :param parameters: The parameters passed to the DBAPI cursor.
+        """
+        try:
+            async with self._explaining, asyncio.timeout(self.explain_timeout):
+                async with engine.connect() as connection:
+                    await connection.execution_options(**{_EXPLAIN_OPTION: True})
+                    result = await connection.exec_driver_sql(
+                        f"EXPLAIN (ANALYZE off, FORMAT JSON) {statement}", parameters
+                    )
+                    query.plan = result.scalar()
+        except Exception as e:
+            query.explain_error = str(e) or type(e).__name__
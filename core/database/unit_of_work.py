@@ -0,0 +1,65 @@
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+
+_UNIT_OF_WORK_KEY = "unit_of_work"
+_AFTER_COMMIT_KEY = "unit_of_work_after_commit"
+
+
+def in_unit_of_work(session: AsyncSession | async_scoped_session) -> bool:
+    """Check whether a session's writes are committed by a unit of work.
+
+    :param session: The session to check.
+
+    :return: True if repositories should only flush their writes.
+    """
+    return session.info.get(_UNIT_OF_WORK_KEY, False)
+
+
+def after_commit(
+    session: AsyncSession | async_scoped_session, callback: Callable[[], None]
+) -> None:
+    """Run a callback once the session's writes are committed.
+
+    Inside a unit of work, the callback runs after the unit of work commits
+    and is dropped if it rolls back. Outside of one, repository writes have
+    already committed, so the callback runs right away.
+
+    :param session: The session whose commit the callback waits for.
+    :param callback: The function to call, without arguments.
+    """
+    if in_unit_of_work(session):
+        session.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+    else:
+        callback()
+
+
+@asynccontextmanager
+async def unit_of_work(
+    session: AsyncSession | async_scoped_session,
+) -> AsyncIterator[AsyncSession | async_scoped_session]:
+    """Group every write made through a session into one transaction.
+
+    Inside the block, repositories flush instead of committing. The
+    transaction is committed once when the block exits, or rolled back if it
+    raises. Outside of a unit of work, each repository write commits itself.
+    Callbacks registered with ``after_commit`` run after the commit.
+
+    :param session: The session to group writes of.
+
+    :return: An async context manager yielding the session.
+    """
+    session.info[_UNIT_OF_WORK_KEY] = True
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        session.info.pop(_UNIT_OF_WORK_KEY, None)
+        callbacks = session.info.pop(_AFTER_COMMIT_KEY, [])
+
+    for callback in callbacks:
+        callback()
@@ -0,0 +1,173 @@
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import ConnectionPoolEntry, PoolProxiedConnection
+
+_CHECKOUT_KEY = "database_usage"
+_STARTED_AT_KEY = "database_usage_started_at"
+
+# Execution option that keeps a statement out of the usage record, for the
+# session setup statements the application issues on its own.
+TRACK_USAGE_OPTION = "track_database_usage"
+
+
+@dataclass
+class DatabaseUsage:
+    """Pool connections and statements used while serving a single request.
+
+    Statements are counted by their SQL text, which holds placeholders rather
+    than values, so repeats of the same query shape add up.
+    """
+
+    connections: int = 0
+    connection_time: float = 0.0
+    pool_wait: float = 0.0
+    statements: int = 0
+    statement_time: float = 0.0
+    statement_counts: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def acquired(self) -> bool:
+        """Whether the request checked out a pooled connection."""
+        return self.connections > 0
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """Find the statements that ran more than ``threshold`` times.
+
+        :param threshold: The number of runs allowed per statement.
+
+        :return: The statements and their run counts, most frequent first.
+        """
+        return [
+            (statement, count)
+            for statement, count in self.statement_counts.most_common()
+            if count > threshold
+        ]
+
+    def server_timing(self) -> str:
+        """Format the database time as a ``Server-Timing`` header value.
+
+        :return: The header value.
+        """
+        return (
+            f'db;dur={self.statement_time * 1000:.2f};desc="{self.statements} '
+            f'statement(s)", db-pool;dur={self.pool_wait * 1000:.2f}'
+        )
+
+
+database_usage_context: ContextVar[DatabaseUsage | None] = ContextVar(
+    "database_usage_context", default=None
+)
+
+
+def get_database_usage() -> DatabaseUsage | None:
+    """Return the usage record of the current request.
+
+    :return: The usage record, or None outside of a tracked request.
+    """
+    return database_usage_context.get()
+
+
+def set_database_usage(usage: DatabaseUsage) -> Token:
+    """Start recording pool usage for the current context.
+
+    :param usage: The record that checkouts in this context are added to.
+
+    :return: A token that can be used to restore the previous record.
+    """
+    return database_usage_context.set(usage)
+
+
+def reset_database_usage(context: Token) -> None:
+    """Restore the usage record from a previous token.
+
+    :param context: The token returned by ``set_database_usage``.
+    """
+    database_usage_context.reset(context)
+
+
+def track_pool_usage(engine: AsyncEngine) -> None:
+    """Attribute the engine's pool checkouts to the current usage record.
+
+    The record is stashed on the pooled connection at checkout, so the
+    checkin is credited to the right request whichever context returns it.
+
+    :param engine: The engine whose pool is tracked.
+    """
+    pool = engine.sync_engine.pool
+
+    @event.listens_for(pool, "checkout")
+    def on_checkout(
+        dbapi_connection,  # noqa: ARG001
+        connection_record: ConnectionPoolEntry,
+        connection_proxy: PoolProxiedConnection,  # noqa: ARG001
+    ) -> None:
+        usage = database_usage_context.get()
+        if usage is not None:
+            usage.connections += 1
+            connection_record.info[_CHECKOUT_KEY] = (usage, time.perf_counter())
+
+    @event.listens_for(pool, "checkin")
+    def on_checkin(
+        dbapi_connection,  # noqa: ARG001
+        connection_record: ConnectionPoolEntry,
+    ) -> None:
+        checkout = connection_record.info.pop(_CHECKOUT_KEY, None)
+        if checkout is not None:
+            usage, checked_out_at = checkout
+            usage.connection_time += time.perf_counter() - checked_out_at
+
+
+def track_statement_usage(engine: AsyncEngine) -> None:
+    """Add the engine's statements and their duration to the usage record.
+
+    Engines derived with ``execution_options`` share the tracking. Statements
+    run with the ``TRACK_USAGE_OPTION`` execution option set to False are
+    left out.
+
+    :param engine: The engine whose statements are tracked.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany  # noqa: ARG001
+    ) -> None:
+        if database_usage_context.get() is None or (
+            context is not None
+            and not context.execution_options.get(TRACK_USAGE_OPTION, True)
+        ):
+            return
+        conn.info.setdefault(_STARTED_AT_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany  # noqa: ARG001
+    ) -> None:
+        _record_statement(conn, statement)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context: ExceptionContext) -> None:
+        if exception_context.connection is not None:
+            _record_statement(exception_context.connection, exception_context.statement)
+
+
+def _record_statement(connection: Connection, statement: str | None) -> None:
+    """Add a finished or failed statement to the current usage record.
+
+    :param connection: The connection the statement ran on.
+    :param statement: The SQL of the statement.
+    """
+    usage = database_usage_context.get()
+    started_at = connection.info.get(_STARTED_AT_KEY)
+    if usage is None or not started_at:
+        return
+    usage.statements += 1
+    usage.statement_time += time.perf_counter() - started_at.pop()
+    if statement is not None:
+        usage.statement_counts[statement] += 1
@@ -3,6 +3,7 @@ from core.exceptions.base import (
     CustomException,
     ForbiddenException,
     NotFoundException,
+    ServiceUnavailableException,
     UnauthorizedException,
 )
 
@@ -12,4 +13,5 @@ __all__ = [
     "BadRequestException",
     "UnauthorizedException",
     "ForbiddenException",
+    "ServiceUnavailableException",
 ]
@@ -33,3 +33,9 @@ class ForbiddenException(CustomException):
     status_code = HTTPStatus.FORBIDDEN
     message = HTTPStatus.FORBIDDEN.name
     description = HTTPStatus.FORBIDDEN.description
+
+
+class ServiceUnavailableException(CustomException):
+    status_code = HTTPStatus.SERVICE_UNAVAILABLE
+    message = HTTPStatus.SERVICE_UNAVAILABLE.name
+    description = HTTPStatus.SERVICE_UNAVAILABLE.description
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from functools import partial
 from typing import Annotated
 
@@ -7,9 +8,27 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.controllers import UserController
 from app.models import User
 from app.repositories import UserRepository
-from core.database import get_session
+from core.database import get_session, unit_of_work
 
-DatabaseSessionDep = Annotated[AsyncSession, Depends(get_session)]
+
+async def get_unit_of_work(
+    db_session: Annotated[AsyncSession, Depends(get_session)],
+) -> AsyncIterator[AsyncSession]:
+    """Commit the request's writes once, before the response is sent.
+
+    The transaction is rolled back if the endpoint raises.
+
+    :param db_session: The FastAPI-injected async database session.
+
+    :return: An async iterator yielding the session.
+    """
+    async with unit_of_work(db_session):
+        yield db_session
+
+
+DatabaseSessionDep = Annotated[
+    AsyncSession, Depends(get_unit_of_work, scope="function")
+]
 
 
 class Factory:
@@ -2,17 +2,29 @@ from core.fastapi.dependencies.authentication import (
     AuthenticationRequired,
     AuthenticationRequiredDep,
     BearerCredentialsDep,
+    authenticate_request,
     require_authentication,
 )
 from core.fastapi.dependencies.controllers import UserControllerDep
-from core.fastapi.dependencies.current_user import CurrentUserDep, get_current_user
+from core.fastapi.dependencies.current_user import (
+    AuthenticatedUserDep,
+    CurrentUserDep,
+    get_authenticated_user,
+    get_current_user,
+)
+from core.fastapi.dependencies.read_only import ReadOnlyDep, read_only
 
 __all__ = [
+    "AuthenticatedUserDep",
     "AuthenticationRequired",
     "AuthenticationRequiredDep",
     "BearerCredentialsDep",
     "CurrentUserDep",
+    "ReadOnlyDep",
     "UserControllerDep",
+    "authenticate_request",
+    "get_authenticated_user",
     "get_current_user",
+    "read_only",
     "require_authentication",
 ]
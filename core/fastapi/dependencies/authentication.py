@@ -2,8 +2,13 @@ from typing import Annotated
 
 from fastapi import Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from starlette.authentication import AuthCredentials, UnauthenticatedUser
 
+from core.database.consistency import set_consistency_key
 from core.exceptions.base import UnauthorizedException
+from core.fastapi.middlewares import AuthenticationBackend
+
+authentication_backend = AuthenticationBackend()
 
 OptionalBearerCredentialsDep = Annotated[
     HTTPAuthorizationCredentials | None,
@@ -11,16 +16,42 @@ OptionalBearerCredentialsDep = Annotated[
 ]
 
 
+async def authenticate_request(request: Request) -> AuthCredentials:
+    """Authenticate the request once and memoize the result on its scope.
+
+    Authentication only runs for routes that depend on it. The result is
+    stored as ``request.auth`` and ``request.user``, the same attributes
+    Starlette's ``AuthenticationMiddleware`` would set, so later dependencies
+    reuse it instead of decoding the token again. The user id becomes the
+    request's read-your-writes key, so after this user writes, their reads go
+    to the writer for a short while.
+
+    :param request: The current FastAPI request.
+
+    :return: The authentication credentials of the request.
+    """
+    if "auth" not in request.scope:
+        result = await authentication_backend.authenticate(request)
+        if result is None:
+            result = AuthCredentials(), UnauthenticatedUser()
+        credentials, user = result
+        request.scope["auth"], request.scope["user"] = credentials, user
+        if "authenticated" in credentials.scopes:
+            set_consistency_key(user.id)
+
+    return request.auth
+
+
 async def require_authentication(
     request: Request,
     access_token: OptionalBearerCredentialsDep,
 ) -> HTTPAuthorizationCredentials:
     """Require a valid authenticated request.
 
-    The authentication middleware populates ``request.auth`` and
-    ``request.user``. This dependency verifies that a bearer token was provided
-    and that the middleware accepted it before returning the token credentials
-    to downstream handlers.
+    The request is authenticated lazily through ``authenticate_request``,
+    which populates ``request.auth`` and ``request.user``. This dependency
+    verifies that a bearer token was provided and accepted before returning
+    the token credentials to downstream handlers.
 
     :param request: The current FastAPI request.
     :param access_token: Optional bearer credentials extracted from the header.
@@ -32,7 +63,8 @@ async def require_authentication(
     """
     if not access_token:
         raise UnauthorizedException("Access token is required")
-    if "authenticated" not in request.auth.scopes:
+    auth = await authenticate_request(request)
+    if "authenticated" not in auth.scopes:
         raise UnauthorizedException("Invalid access token")
 
     return access_token
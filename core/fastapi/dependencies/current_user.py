@@ -3,10 +3,40 @@ from typing import Annotated
 from fastapi import Depends, Request
 
 from app.models import User
+from app.schemas.extras import CurrentUser
+from core.exceptions import UnauthorizedException
 from core.fastapi.dependencies.authentication import BearerCredentialsDep
 from core.fastapi.dependencies.controllers import UserControllerDep
 
 
+async def get_authenticated_user(
+    request: Request,
+    user_controller: UserControllerDep,
+    _: BearerCredentialsDep,
+) -> CurrentUser:
+    """Return the identity carried by the access token.
+
+    The user id and role come from the verified token claims, so no user row
+    is loaded. The token version claim is checked against the user's current
+    version, which is answered from memory when it was confirmed recently.
+
+    :param request: The current FastAPI request.
+    :param user_controller: The controller used to check the token version.
+    :param _: Validated bearer credentials required for dependency ordering.
+
+    :raises UnauthorizedException: If the token has been revoked.
+
+    :return: The authenticated user's claims.
+    """
+    current_user: CurrentUser = request.user
+    if not await user_controller.is_token_version_current(
+        current_user.id, current_user.token_version
+    ):
+        raise UnauthorizedException("Access token has been revoked")
+
+    return current_user
+
+
 async def get_current_user(
     request: Request,
     user_controller: UserControllerDep,
@@ -14,17 +44,24 @@ async def get_current_user(
 ) -> User:
     """Load the authenticated user for the current request.
 
-    Authentication middleware stores the user identifier on ``request.user``.
+    Authentication stores the user identifier on ``request.user``.
     This dependency resolves that identifier to a full user model for endpoint
-    handlers.
+    handlers that need more than the token claims.
 
     :param request: The current FastAPI request.
     :param user_controller: The controller used to load the user.
     :param _: Validated bearer credentials required for dependency ordering.
 
+    :raises UnauthorizedException: If the token has been revoked.
+
     :return: The authenticated user model.
     """
-    return await user_controller.get_by_id(request.user.id)
+    user = await user_controller.get_by_id(request.user.id)
+    if user.token_version != request.user.token_version:
+        raise UnauthorizedException("Access token has been revoked")
+
+    return user
 
 
+AuthenticatedUserDep = Annotated[CurrentUser, Depends(get_authenticated_user)]
 CurrentUserDep = Annotated[User, Depends(get_current_user)]
@@ -0,0 +1,36 @@
+from collections.abc import AsyncIterator
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import config
+from core.database import clear_read_only, get_session, set_read_only
+
+
+def read_only(statement_timeout: float = config.READ_ONLY_STATEMENT_TIMEOUT_SECONDS):
+    """Create a dependency that makes a route's database access read-only.
+
+    The route's transactions begin ``READ ONLY`` with the given statement
+    timeout, and any write raises instead of reaching the writer. List it
+    before dependencies that query the database, since it must apply before
+    the session's first transaction.
+
+    :param statement_timeout: Seconds after which a statement is cancelled.
+
+    :return: A FastAPI dependency restricting the request's session.
+    """
+
+    async def restrict_session(
+        db_session: Annotated[AsyncSession, Depends(get_session)],
+    ) -> AsyncIterator[None]:
+        set_read_only(db_session, statement_timeout)
+        try:
+            yield
+        finally:
+            clear_read_only(db_session)
+
+    return restrict_session
+
+
+ReadOnlyDep = Depends(read_only())
@@ -32,7 +32,11 @@ class AuthenticationBackend(BaseAuthenticationBackend):
         except UnauthorizedException:
             return None
 
-        current_user = CurrentUser(id=payload.user_id)
+        current_user = CurrentUser(
+            id=payload.user_id,
+            role=payload.role,
+            token_version=payload.token_version,
+        )
         return AuthCredentials(["authenticated"]), current_user
 
     def _extract_token(self, authorization: str) -> tuple[str, str | None]:
@@ -1,28 +1,116 @@
-from uuid import uuid4
+import logging
+from itertools import count
 
-from starlette.types import ASGIApp, Receive, Scope, Send
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from core.database.consistency import reset_consistency_key, set_consistency_key
 from core.database.session import reset_session_context, session, set_session_context
+from core.database.usage import (
+    DatabaseUsage,
+    reset_database_usage,
+    set_database_usage,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class SQLAlchemyMiddleware:
-    def __init__(self, app: ASGIApp) -> None:
+    def __init__(self, app: ASGIApp, repeated_statement_threshold: int = 0) -> None:
         self.app = app
+        self.repeated_statement_threshold = repeated_statement_threshold
+        self._request_ids = count()
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        """Create a SQLAlchemy session for the request.
+        """Scope a SQLAlchemy session to the request.
+
+        The session and its pooled connection are only created when the request
+        first uses them, so requests that never query the database skip both.
+        Database usage is recorded on ``scope["state"]["database_usage"]``,
+        reported in a ``Server-Timing`` header and logged once the request
+        ends. A warning is logged for each statement the request ran more than
+        ``repeated_statement_threshold`` times, usually an N+1 query; ``0``
+        turns the warning off.
 
         :param scope: The ASGI scope.
         :param receive: The receive channel.
         :param send: The send channel.
         """
-        session_id = str(uuid4())
-        context = set_session_context(session_id=session_id)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        usage = DatabaseUsage()
+        scope.setdefault("state", {})["database_usage"] = usage
+        request_id = f"request-{next(self._request_ids)}"
+        context = set_session_context(session_id=request_id)
+        usage_context = set_database_usage(usage)
+        consistency_context = set_consistency_key(None)
+        status_code = None
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if usage.statements or usage.acquired:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", usage.server_timing())
+            await send(message)
 
         try:
-            await self.app(scope, receive, send)
-        except Exception as exception:
-            raise exception
+            await self.app(scope, receive, send_with_timing)
         finally:
             await session.remove()
+            reset_consistency_key(consistency_context)
+            reset_database_usage(usage_context)
             reset_session_context(context=context)
+            if usage.statements or usage.acquired:
+                self._log_usage(scope, request_id, status_code, usage)
+
+    def _log_usage(
+        self,
+        scope: Scope,
+        request_id: str,
+        status_code: int | None,
+        usage: DatabaseUsage,
+    ) -> None:
+        """Log a request's database usage as ``key=value`` pairs.
+
+        The values are also attached to the record as ``database_usage``, for
+        handlers that format records as JSON.
+
+        :param scope: The ASGI scope.
+        :param request_id: The request's session context identifier.
+        :param status_code: The response status code, if a response started.
+        :param usage: The request's database usage.
+        """
+        if logger.isEnabledFor(logging.INFO):
+            fields = {
+                "request_id": request_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status_code,
+                "statements": usage.statements,
+                "statement_ms": round(usage.statement_time * 1000, 2),
+                "pool_wait_ms": round(usage.pool_wait * 1000, 2),
+                "connections": usage.connections,
+                "connection_ms": round(usage.connection_time * 1000, 2),
+            }
+            logger.info(
+                " ".join(f"{key}={value}" for key, value in fields.items()),
+                extra={"database_usage": fields},
+            )
+
+        if self.repeated_statement_threshold <= 0:
+            return
+        for statement, runs in usage.repeated_statements(
+            self.repeated_statement_threshold
+        ):
+            logger.warning(
+                "request_id=%s method=%s path=%s ran the same statement %d times: %s",
+                request_id,
+                scope["method"],
+                scope["path"],
+                runs,
+                " ".join(statement.split()),
+            )
@@ -0,0 +1,175 @@
+import functools
+import inspect
+import types
+from collections.abc import Callable
+from operator import attrgetter
+from typing import Any, Union, get_args, get_origin
+
+from fastapi import Response
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.dependencies.utils import get_typed_return_annotation
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import TypedDict
+
+Serializer = Callable[[Any], bytes]
+
+_RESPONSE_PARAMETER = "trusted_json_response"
+
+
+def _field_reader(model: type[BaseModel]) -> tuple[Callable[[Any], dict], type] | None:
+    """Build a function that reads a model's fields off any object.
+
+    The fields are typed through a TypedDict with the model's annotations, so
+    they serialize like the model without the object being validated first.
+
+    :param model: The response model.
+
+    :return: The field reader and the TypedDict, or None if the model relies
+        on aliases or custom serializers that a TypedDict would not apply.
+    """
+    decorators = model.__pydantic_decorators__
+    fields = model.model_fields
+    if (
+        model.model_computed_fields
+        or decorators.field_serializers
+        or decorators.model_serializers
+        or any(field.alias or field.serialization_alias for field in fields.values())
+    ):
+        return None
+
+    names = tuple(fields)
+    values = attrgetter(*names)
+    if len(names) == 1:
+        (name,) = names
+
+        def read(obj: Any) -> dict:
+            return {name: values(obj)}
+
+    else:
+
+        def read(obj: Any) -> dict:
+            return dict(zip(names, values(obj), strict=True))
+
+    typed_dict = TypedDict(
+        model.__name__, {name: field.annotation for name, field in fields.items()}
+    )
+    return read, typed_dict
+
+
+def trusted_serializer(response_type: Any) -> Serializer | None:
+    """Precompile a JSON serializer for trusted values of a response type.
+
+    Supported types are a response model, a list of one, or either of them
+    or None. Objects only need the model's fields as attributes, so ORM
+    instances, rows and model instances all serialize the same way.
+
+    :param response_type: The response model of a route.
+
+    :return: A function returning the JSON bytes of a value, or None if the
+        type is not supported.
+    """
+    origin = get_origin(response_type)
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in get_args(response_type) if arg is not type(None)]
+        serializer = trusted_serializer(args[0]) if len(args) == 1 else None
+        if serializer is None:
+            return None
+        return lambda value: b"null" if value is None else serializer(value)
+
+    if origin is list:
+        (item_type,) = get_args(response_type) or (Any,)
+        model = item_type
+    else:
+        model = response_type
+    if not (inspect.isclass(model) and issubclass(model, BaseModel)):
+        return None
+
+    reader = _field_reader(model)
+    if reader is None:
+        return None
+    as_dict, typed_dict = reader
+    if origin is list:
+        adapter = TypeAdapter(list[typed_dict])
+        return lambda value: adapter.dump_json([as_dict(item) for item in value])
+
+    adapter = TypeAdapter(typed_dict)
+    return lambda value: adapter.dump_json(as_dict(value))
+
+
+class TrustedJSONRoute(APIRoute):
+    """Route that serializes its endpoint's results without validating them.
+
+    FastAPI validates every result against the response model before
+    serializing it. Routes of a router created with this ``route_class``
+    instead dump results straight to JSON with a serializer compiled once per
+    route, so endpoints must return objects that already match the model,
+    such as repository output. The response model still documents the route.
+    Routes whose model is not supported by ``trusted_serializer`` keep the
+    default behaviour.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        response_model = kwargs.get("response_model")
+        if isinstance(response_model, DefaultPlaceholder):
+            response_model = get_typed_return_annotation(endpoint)
+        serializer = trusted_serializer(response_model) if response_model else None
+        if serializer is not None and inspect.iscoroutinefunction(endpoint):
+            endpoint = _serialize_results(
+                endpoint, serializer, kwargs.get("status_code")
+            )
+        super().__init__(path, endpoint, **kwargs)
+
+
+def _serialize_results(
+    endpoint: Callable[..., Any], serializer: Serializer, status_code: int | None
+) -> Callable[..., Any]:
+    """Wrap an endpoint to return its result as a serialized response.
+
+    The wrapper asks FastAPI for the endpoint's ``Response`` parameter, adding
+    one if needed, so headers and a status code set by the endpoint are kept.
+
+    :param endpoint: The endpoint function.
+    :param serializer: The serializer of the route's response model.
+    :param status_code: The status code declared on the route, if any.
+
+    :return: The wrapped endpoint.
+    """
+    signature = inspect.signature(endpoint)
+    response_name = next(
+        (
+            name
+            for name, parameter in signature.parameters.items()
+            if inspect.isclass(parameter.annotation)
+            and issubclass(parameter.annotation, Response)
+        ),
+        None,
+    )
+    parameters = list(signature.parameters.values())
+    if response_name is None:
+        parameters.append(
+            inspect.Parameter(
+                _RESPONSE_PARAMETER, inspect.Parameter.KEYWORD_ONLY, annotation=Response
+            )
+        )
+
+    @functools.wraps(endpoint)
+    async def wrapper(**kwargs: Any) -> Any:
+        if response_name is None:
+            sub_response = kwargs.pop(_RESPONSE_PARAMETER)
+        else:
+            sub_response = kwargs[response_name]
+        result = await endpoint(**kwargs)
+        if isinstance(result, Response):
+            return result
+
+        response = Response(
+            serializer(result),
+            status_code=sub_response.status_code or status_code or 200,
+            media_type="application/json",
+        )
+        response.raw_headers.extend(sub_response.headers.raw)
+        return response
+
+    wrapper.__signature__ = signature.replace(parameters=parameters)
+    return wrapper
@@ -1,17 +1,38 @@
-from collections.abc import Mapping, Sequence
+from collections.abc import AsyncIterator, Callable, Hashable, Mapping, Sequence
 from typing import Any, Generic, TypeVar
 
-from sqlalchemy import Select, select
+from sqlalchemy import Row, Select, bindparam, delete, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.elements import ColumnElement
 
-from core.database import Base
+from core.database import Base, in_unit_of_work
+from core.repository.cursor import decode_cursor, encode_cursor
 
 ModelType = TypeVar("ModelType", bound=Base)
+StatementType = TypeVar("StatementType")
+
+# Statements built by ``BaseRepository._statement``, by repository class,
+# model and key. Keys are fixed by code, so the dictionary stays small.
+_statements: dict[Hashable, Any] = {}
 
 
 class BaseRepository(Generic[ModelType]):
-    """Base class for data repositories."""
+    """Base class for data repositories.
+
+    ``keyset_columns`` names the unique, indexed sort key used by ``get_page``.
+
+    Read methods that take ``fields`` select only those columns and return
+    plain rows instead of model instances, skipping the identity map and
+    attribute instrumentation; rows expose the columns as attributes, so
+    ``from_attributes`` response models serialize them directly.
+
+    Hot queries are built once with ``_statement`` and executed with bound
+    parameters. SQLAlchemy memoizes the cache key of a statement object, so
+    reusing it skips both constructing the query and walking it to look up
+    its compiled form.
+    """
+
+    keyset_columns: tuple[str, ...] = ("id",)
 
     def __init__(self, model: type[ModelType], db_session: AsyncSession):
         self.session: AsyncSession = db_session
@@ -28,9 +49,34 @@ class BaseRepository(Generic[ModelType]):
             attributes = {}
         model = self.model_class(**attributes)
         self.session.add(model)
-        await self.session.commit()
+        await self._commit()
         return model
 
+    async def bulk_create(
+        self, attributes: Sequence[Mapping[str, Any]]
+    ) -> Sequence[ModelType]:
+        """Creates model instances with one multi-row ``INSERT ... RETURNING``.
+
+        Column values are inserted as given; attributes that are not columns,
+        such as model property setters, are not applied.
+
+        :param attributes: The column values of each instance.
+
+        :return: The created model instances, in the order of ``attributes``.
+        """
+        if not attributes:
+            return []
+
+        result = await self.session.scalars(
+            insert(self.model_class).returning(
+                self.model_class, sort_by_parameter_order=True
+            ),
+            [dict(item) for item in attributes],
+        )
+        models = result.all()
+        await self._commit()
+        return models
+
     async def get_all(self, skip: int = 0, limit: int = 100) -> Sequence[ModelType]:
         """Returns a list of model instances.
 
@@ -39,31 +85,118 @@ class BaseRepository(Generic[ModelType]):
 
         :return: A list of model instances.
         """
-        query = select(self.model_class)
-        query = query.offset(skip).limit(limit)
-
-        return await self._all_unique(query)
+        query = self._paginated()
+        return await self._all_unique(query, {"skip": skip, "limit": limit})
 
     async def get_filtered(
         self,
         filters: Sequence[ColumnElement[bool]] | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> Sequence[ModelType]:
+        fields: Sequence[str] | None = None,
+    ) -> Sequence[ModelType] | Sequence[Row]:
         """Retrieves a filtered list of model instances based on provided filters.
 
         :param filters: A dictionary where keys are the model fields and values are the values to filter by.
         :param skip: The number of records to skip.
         :param limit: The number of records to return.
+        :param fields: The columns to select, if not whole model instances.
 
-        :return: A list of model instances.
+        :return: A list of model instances, or of rows when ``fields`` is given.
         """
-        query = select(self.model_class)
+        if filters:
+            query = self._select(fields).where(*filters).offset(skip).limit(limit)
+            params = None
+        else:
+            query = self._paginated(fields)
+            params = {"skip": skip, "limit": limit}
+
+        if fields is not None:
+            return await self._rows(query, params)
+        return await self._all_unique(query, params)
+
+    async def get_page(
+        self,
+        filters: Sequence[ColumnElement[bool]] | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+        fields: Sequence[str] | None = None,
+    ) -> tuple[Sequence[ModelType] | Sequence[Row], str | None]:
+        """Returns a page of model instances ordered by ``keyset_columns``.
+
+        Pages resume after the key of the previous page's last row instead of
+        skipping rows, so every page is an index range scan of the same cost.
+
+        :param filters: The filters to apply.
+        :param cursor: The cursor returned with the previous page, if any.
+        :param limit: The number of records to return.
+        :param fields: The columns to select, if not whole model instances; the
+            keyset columns are always added.
+
+        :raises BadRequestException: If the cursor is malformed.
+
+        :return: The model instances, or rows when ``fields`` is given, and the
+            cursor of the next page, or None on the last page.
+        """
+        columns = [getattr(self.model_class, name) for name in self.keyset_columns]
+        if fields is not None:
+            fields = [
+                *fields,
+                *(name for name in self.keyset_columns if name not in fields),
+            ]
+        query = self._select(fields)
         if filters:
             query = query.where(*filters)
+        if cursor is not None:
+            values = decode_cursor(
+                cursor, [column.type.python_type for column in columns]
+            )
+            query = query.where(tuple_(*columns) > tuple_(*values))
+
+        query = query.order_by(*columns).limit(limit + 1)
+        if fields is not None:
+            models = await self._rows(query)
+        else:
+            models = await self._all(query)
+        if len(models) <= limit:
+            return models, None
+
+        models = models[:limit]
+        next_cursor = encode_cursor(
+            [getattr(models[-1], name) for name in self.keyset_columns]
+        )
+        return models, next_cursor
+
+    async def stream(
+        self,
+        filters: Sequence[ColumnElement[bool]] | None = None,
+        fields: Sequence[str] | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[ModelType] | Sequence[Row]]:
+        """Yields every matching record in batches through a server-side cursor.
 
-        query = query.offset(skip).limit(limit)
-        return await self._all_unique(query)
+        Only one batch is held in memory at a time, whatever the number of
+        matching rows. Records are ordered by ``keyset_columns``.
+
+        :param filters: The filters to apply.
+        :param fields: The columns to select, if not whole model instances.
+        :param batch_size: The number of records fetched per batch.
+
+        :return: An async iterator of batches of model instances, or of rows
+            when ``fields`` is given.
+        """
+        query = self._select(fields)
+        if filters:
+            query = query.where(*filters)
+        query = query.order_by(
+            *(getattr(self.model_class, name) for name in self.keyset_columns)
+        ).execution_options(yield_per=batch_size)
+
+        result = await self.session.stream(query)
+        if fields is None:
+            result = result.scalars()
+        async for partition in result.partitions():
+            yield partition
 
     async def get_by(
         self,
@@ -73,17 +206,17 @@ class BaseRepository(Generic[ModelType]):
     ) -> ModelType | Sequence[ModelType] | None:
         """Returns the model instance matching the field and value.
 
-        :param field: The field to match.
+        :param column: The column to match.
         :param value: The value to match.
+        :param unique: Whether to return a single instance instead of a list.
 
         :return: The model instance.
         """
-        query = select(self.model_class)
-        query = self._get_by(query, column, value)
+        query = self._get_by_statement(column)
         if unique:
-            return await self._one(query)
+            return await self._one(query, {"value": value})
 
-        return await self._all(query)
+        return await self._all(query, {"value": value})
 
     async def update(
         self, model: ModelType, attributes: Mapping[str, Any]
@@ -100,56 +233,236 @@ class BaseRepository(Generic[ModelType]):
                 setattr(model, key, value)
 
         self.session.add(model)
-        await self.session.commit()
+        await self._commit()
         return model
 
+    async def update_by_id(
+        self, id_: Any, attributes: Mapping[str, Any]
+    ) -> ModelType | None:
+        """Updates a row with a single ``UPDATE ... RETURNING``.
+
+        Unlike ``update``, the row is not loaded first. Attributes set to None
+        are left unchanged.
+
+        :param id_: The primary key of the row to update.
+        :param attributes: The column values or SQL expressions to set.
+
+        :return: The updated model instance, or None if no row matched.
+        """
+        values = {key: value for key, value in attributes.items() if value is not None}
+        if not values:
+            return await self._one(
+                select(self.model_class).where(self.model_class.id == id_)
+            )
+
+        result = await self.session.scalars(
+            update(self.model_class)
+            .where(self.model_class.id == id_)
+            .values(**values)
+            .returning(self.model_class),
+            execution_options={"populate_existing": True},
+        )
+        model = result.one_or_none()
+        await self._commit()
+        return model
+
+    async def bulk_update(
+        self, ids: Sequence[Any], attributes: Mapping[str, Any]
+    ) -> Sequence[ModelType]:
+        """Applies the same values to many rows with ``UPDATE ... WHERE id IN``.
+
+        :param ids: The primary keys of the rows to update.
+        :param attributes: The column values or SQL expressions to set.
+
+        :return: The updated model instances; missing ids are left out.
+        """
+        if not ids:
+            return []
+
+        result = await self.session.scalars(
+            update(self.model_class)
+            .where(self.model_class.id.in_(ids))
+            .values(**attributes)
+            .returning(self.model_class),
+            execution_options={"populate_existing": True},
+        )
+        models = result.all()
+        await self._commit()
+        return models
+
+    async def delete_by_id(self, id_: Any) -> bool:
+        """Deletes a row with a single ``DELETE ... RETURNING``.
+
+        :param id_: The primary key of the row to delete.
+
+        :return: True if a row was deleted, False if none matched.
+        """
+        result = await self.session.scalars(
+            delete(self.model_class)
+            .where(self.model_class.id == id_)
+            .returning(self.model_class.id)
+        )
+        deleted = result.one_or_none() is not None
+        await self._commit()
+        return deleted
+
+    async def bulk_delete(self, ids: Sequence[Any]) -> Sequence[Any]:
+        """Deletes many rows with ``DELETE ... WHERE id IN``.
+
+        :param ids: The primary keys of the rows to delete.
+
+        :return: The primary keys that were deleted; missing ids are left out.
+        """
+        if not ids:
+            return []
+
+        result = await self.session.scalars(
+            delete(self.model_class)
+            .where(self.model_class.id.in_(ids))
+            .returning(self.model_class.id)
+        )
+        deleted_ids = result.all()
+        await self._commit()
+        return deleted_ids
+
     async def delete(self, model: ModelType) -> None:
         """Deletes the model.
 
         :param model: The model to delete.
         """
         await self.session.delete(model)
-        await self.session.commit()
+        await self._commit()
+
+    async def _commit(self) -> None:
+        """Commits the session, or only flushes it inside a unit of work.
+
+        A unit of work commits every write of the request at once when it
+        ends, so repository calls do not each pay for a commit.
+        """
+        if in_unit_of_work(self.session):
+            await self.session.flush()
+        else:
+            await self.session.commit()
+
+    def _statement(
+        self, key: Hashable, build: Callable[[], StatementType]
+    ) -> StatementType:
+        """Returns a statement built once per repository class, model and key.
+
+        The statement must take its varying values as bound parameters.
+
+        :param key: Identifies the statement within the repository.
+        :param build: Builds the statement the first time it is needed.
+
+        :return: The shared statement.
+        """
+        cache_key = (type(self), self.model_class, key)
+        statement = _statements.get(cache_key)
+        if statement is None:
+            statement = _statements[cache_key] = build()
+        return statement
 
-    async def _all(self, query: Select) -> Sequence[ModelType]:
+    def _get_by_statement(self, column: Any) -> Select:
+        """Returns the cached query matching a column against a ``value``.
+
+        :param column: The column to match.
+
+        :return: The select statement, taking a ``value`` parameter.
+        """
+        return self._statement(
+            ("get_by", column),
+            lambda: self._get_by(select(self.model_class), column, bindparam("value")),
+        )
+
+    def _paginated(self, fields: Sequence[str] | None = None) -> Select:
+        """Returns the cached, unfiltered query for a page of records.
+
+        :param fields: The names of the columns to select, if any.
+
+        :return: The select statement, taking ``skip`` and ``limit`` parameters.
+        """
+        return self._statement(
+            ("paginated", None if fields is None else tuple(fields)),
+            lambda: self._select(fields)
+            .offset(bindparam("skip"))
+            .limit(bindparam("limit")),
+        )
+
+    def _select(self, fields: Sequence[str] | None = None) -> Select:
+        """Starts a query for whole model instances or for some columns.
+
+        :param fields: The names of the columns to select, if any.
+
+        :return: The select statement.
+        """
+        if fields is None:
+            return select(self.model_class)
+        return select(*(getattr(self.model_class, name) for name in fields))
+
+    async def _rows(
+        self, query: Select, params: Mapping[str, Any] | None = None
+    ) -> Sequence[Row]:
+        """Returns all rows of a column query.
+
+        :param query: The query to execute.
+        :param params: The values of the query's bound parameters, if any.
+
+        :return: A list of rows.
+        """
+        result = await self.session.execute(query, params)
+        return result.all()
+
+    async def _all(
+        self, query: Select, params: Mapping[str, Any] | None = None
+    ) -> Sequence[ModelType]:
         """Returns all results from the query.
 
         :param query: The query to execute.
+        :param params: The values of the query's bound parameters, if any.
 
         :return: A list of model instances.
         """
-        result = await self.session.execute(query)
+        result = await self.session.execute(query, params)
         return result.scalars().all()
 
-    async def _all_unique(self, query: Select) -> Sequence[ModelType]:
+    async def _all_unique(
+        self, query: Select, params: Mapping[str, Any] | None = None
+    ) -> Sequence[ModelType]:
         """Returns all unique results from the query.
 
         :param query: The query to execute.
+        :param params: The values of the query's bound parameters, if any.
 
         :return: A list of unique model instances.
         """
-        result = await self.session.execute(query)
+        result = await self.session.execute(query, params)
         return result.scalars().all()
 
-    async def _first(self, query: Select) -> ModelType | None:
+    async def _first(
+        self, query: Select, params: Mapping[str, Any] | None = None
+    ) -> ModelType | None:
         """Returns the first result from the query.
 
         :param query: The query to execute.
+        :param params: The values of the query's bound parameters, if any.
 
         :return: The first model instance.
         """
-        results = await self.session.execute(query)
+        results = await self.session.execute(query, params)
 
         return results.scalar()
 
-    async def _one(self, query: Select) -> ModelType | None:
+    async def _one(
+        self, query: Select, params: Mapping[str, Any] | None = None
+    ) -> ModelType | None:
         """Returns the first result from the query or raises NoResultFound.
 
         :param query: The query to execute.
+        :param params: The values of the query's bound parameters, if any.
 
         :return: The first model instance.
         """
-        result = await self.session.execute(query)
+        result = await self.session.execute(query, params)
         return result.scalar_one_or_none()
 
     def _get_by(self, query: Select, column: Any, value: Any) -> Select:
@@ -0,0 +1,45 @@
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from core.exceptions import BadRequestException
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor.
+
+    :param values: The key column values of the last row.
+
+    :return: The URL-safe cursor.
+    """
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else value for value in values
+    ]
+    data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> list[Any]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    :param cursor: The cursor received from the client.
+    :param types: The Python types of the key columns, in order.
+
+    :raises BadRequestException: If the cursor is malformed.
+
+    :return: The key column values.
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(data)
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError
+        return [
+            datetime.fromisoformat(value) if type_ is datetime else type_(value)
+            for value, type_ in zip(payload, types, strict=True)
+        ]
+    except (binascii.Error, TypeError, ValueError):
+        raise BadRequestException("Invalid cursor")
@@ -0,0 +1,322 @@
+import base64
+import hashlib
+import hmac
+import secrets
+from abc import ABC, abstractmethod
+
+import bcrypt
+
+try:
+    import argon2
+except ImportError:  # pragma: no cover - optional dependency
+    argon2 = None
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii").rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4))
+
+
+class PasswordHasher(ABC):
+    """Base class for password hashing backends.
+
+    Every backend writes a distinct prefix into the hashes it produces, so
+    ``identify`` can pick the backend that verifies a stored hash. Hashers are
+    plain picklable objects so they can run in a process pool.
+    """
+
+    algorithm: str
+    prefixes: tuple[str, ...]
+    max_password_bytes: int | None = None
+
+    def identify(self, hashed_password: str) -> bool:
+        """Check whether a stored hash was produced by this backend.
+
+        :param hashed_password: The stored hash.
+
+        :return: True when the hash carries one of this backend's prefixes.
+        """
+        return hashed_password.startswith(self.prefixes)
+
+    @abstractmethod
+    def hash(self, password: bytes) -> str:
+        """Hash a password with this backend's current parameters.
+
+        :param password: The UTF-8 encoded password.
+
+        :return: The encoded hash, including the algorithm prefix.
+        """
+
+    @abstractmethod
+    def verify(self, password: bytes, hashed_password: str) -> bool:
+        """Check a password against a hash produced by this backend.
+
+        :param password: The UTF-8 encoded password.
+        :param hashed_password: The stored hash.
+
+        :return: True when the password matches, False otherwise.
+        """
+
+    @abstractmethod
+    def needs_update(self, hashed_password: str) -> bool:
+        """Check whether a hash was produced with different parameters.
+
+        :param hashed_password: A stored hash produced by this backend.
+
+        :return: True when the hash should be regenerated.
+        """
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.algorithm}>"
+
+
+class BCryptHasher(PasswordHasher):
+    algorithm = "bcrypt"
+    prefixes = ("$2a$", "$2b$", "$2y$")
+    max_password_bytes = 72
+
+    def __init__(self, rounds: int = 12):
+        self.rounds = rounds
+
+    def hash(self, password: bytes) -> str:
+        """Hash a password with bcrypt.
+
+        :param password: The UTF-8 encoded password, at most 72 bytes.
+
+        :return: The bcrypt hash.
+        """
+        return bcrypt.hashpw(password, bcrypt.gensalt(self.rounds)).decode("utf-8")
+
+    def verify(self, password: bytes, hashed_password: str) -> bool:
+        """Check a password against a bcrypt hash.
+
+        :param password: The UTF-8 encoded password.
+        :param hashed_password: The stored bcrypt hash.
+
+        :return: True when the password matches, False otherwise.
+        """
+        try:
+            return bcrypt.checkpw(password, hashed_password.encode("utf-8"))
+        except ValueError:
+            return False
+
+    def needs_update(self, hashed_password: str) -> bool:
+        """Check whether a bcrypt hash uses a lower cost.
+
+        Hashes with a higher cost are kept, so a cost that differs between
+        deploys does not rehash passwords back and forth.
+
+        :param hashed_password: The stored bcrypt hash.
+
+        :return: True when the cost is below ``rounds``.
+        """
+        try:
+            return int(hashed_password.split("$")[2]) < self.rounds
+        except (IndexError, ValueError):
+            return False
+
+
+class ScryptHasher(PasswordHasher):
+    """Scrypt hashes, encoded as ``$scrypt$ln=<log2 n>,r=<r>,p=<p>$salt$hash``."""
+
+    algorithm = "scrypt"
+    prefixes = ("$scrypt$",)
+
+    def __init__(self, cost: int = 14, block_size: int = 8, parallelism: int = 1):
+        self.cost = cost
+        self.block_size = block_size
+        self.parallelism = parallelism
+
+    def hash(self, password: bytes) -> str:
+        """Hash a password with scrypt.
+
+        :param password: The UTF-8 encoded password.
+
+        :return: The encoded scrypt hash.
+        """
+        salt = secrets.token_bytes(16)
+        digest = self._derive(
+            password, salt, self.cost, self.block_size, self.parallelism
+        )
+        return (
+            f"$scrypt$ln={self.cost},r={self.block_size},p={self.parallelism}"
+            f"${_b64encode(salt)}${_b64encode(digest)}"
+        )
+
+    def verify(self, password: bytes, hashed_password: str) -> bool:
+        """Check a password against a scrypt hash.
+
+        :param password: The UTF-8 encoded password.
+        :param hashed_password: The stored scrypt hash.
+
+        :return: True when the password matches, False otherwise.
+        """
+        try:
+            cost, block_size, parallelism, salt, digest = self._parse(hashed_password)
+            candidate = self._derive(password, salt, cost, block_size, parallelism)
+        except ValueError:
+            return False
+        return hmac.compare_digest(candidate, digest)
+
+    def needs_update(self, hashed_password: str) -> bool:
+        """Check whether a scrypt hash uses different cost parameters.
+
+        :param hashed_password: The stored scrypt hash.
+
+        :return: True when any of the parameters differ.
+        """
+        try:
+            parameters = self._parse(hashed_password)[:3]
+        except ValueError:
+            return False
+        return parameters != (self.cost, self.block_size, self.parallelism)
+
+    def _derive(
+        self, password: bytes, salt: bytes, cost: int, block_size: int, parallelism: int
+    ) -> bytes:
+        n = 2**cost
+        return hashlib.scrypt(
+            password,
+            salt=salt,
+            n=n,
+            r=block_size,
+            p=parallelism,
+            maxmem=128 * block_size * (n + parallelism + 2),
+            dklen=32,
+        )
+
+    def _parse(self, hashed_password: str) -> tuple[int, int, int, bytes, bytes]:
+        try:
+            _, _, parameters, salt, digest = hashed_password.split("$")
+            values = dict(item.split("=") for item in parameters.split(","))
+            return (
+                int(values["ln"]),
+                int(values["r"]),
+                int(values["p"]),
+                _b64decode(salt),
+                _b64decode(digest),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError("Malformed scrypt hash") from e
+
+
+class PBKDF2Hasher(PasswordHasher):
+    """PBKDF2-HMAC-SHA256 hashes, encoded as ``$pbkdf2-sha256$<rounds>$salt$hash``."""
+
+    algorithm = "pbkdf2-sha256"
+    prefixes = ("$pbkdf2-sha256$",)
+
+    def __init__(self, iterations: int = 600_000):
+        self.iterations = iterations
+
+    def hash(self, password: bytes) -> str:
+        """Hash a password with PBKDF2-HMAC-SHA256.
+
+        :param password: The UTF-8 encoded password.
+
+        :return: The encoded PBKDF2 hash.
+        """
+        salt = secrets.token_bytes(16)
+        digest = hashlib.pbkdf2_hmac("sha256", password, salt, self.iterations)
+        return (
+            f"$pbkdf2-sha256${self.iterations}"
+            f"${_b64encode(salt)}${_b64encode(digest)}"
+        )
+
+    def verify(self, password: bytes, hashed_password: str) -> bool:
+        """Check a password against a PBKDF2 hash.
+
+        :param password: The UTF-8 encoded password.
+        :param hashed_password: The stored PBKDF2 hash.
+
+        :return: True when the password matches, False otherwise.
+        """
+        try:
+            iterations, salt, digest = self._parse(hashed_password)
+        except ValueError:
+            return False
+        candidate = hashlib.pbkdf2_hmac("sha256", password, salt, iterations)
+        return hmac.compare_digest(candidate, digest)
+
+    def needs_update(self, hashed_password: str) -> bool:
+        """Check whether a PBKDF2 hash uses a different iteration count.
+
+        :param hashed_password: The stored PBKDF2 hash.
+
+        :return: True when the iteration count differs.
+        """
+        try:
+            return self._parse(hashed_password)[0] != self.iterations
+        except ValueError:
+            return False
+
+    def _parse(self, hashed_password: str) -> tuple[int, bytes, bytes]:
+        try:
+            _, _, iterations, salt, digest = hashed_password.split("$")
+            return int(iterations), _b64decode(salt), _b64decode(digest)
+        except ValueError as e:
+            raise ValueError("Malformed pbkdf2 hash") from e
+
+
+class Argon2Hasher(PasswordHasher):
+    """Argon2id hashes through ``argon2-cffi``, when it is installed."""
+
+    algorithm = "argon2"
+    prefixes = ("$argon2",)
+
+    def __init__(
+        self, time_cost: int = 3, memory_cost: int = 65536, parallelism: int = 4
+    ):
+        if argon2 is None:
+            raise RuntimeError("The argon2 hasher requires the argon2-cffi package")
+        self._hasher = argon2.PasswordHasher(
+            time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism
+        )
+
+    def hash(self, password: bytes) -> str:
+        """Hash a password with argon2id.
+
+        :param password: The UTF-8 encoded password.
+
+        :return: The encoded argon2 hash.
+        """
+        return self._hasher.hash(password)
+
+    def verify(self, password: bytes, hashed_password: str) -> bool:
+        """Check a password against an argon2 hash.
+
+        :param password: The UTF-8 encoded password.
+        :param hashed_password: The stored argon2 hash.
+
+        :return: True when the password matches, False otherwise.
+        """
+        try:
+            return self._hasher.verify(hashed_password, password)
+        except (
+            argon2.exceptions.VerificationError,
+            argon2.exceptions.InvalidHashError,
+        ):
+            return False
+
+    def needs_update(self, hashed_password: str) -> bool:
+        """Check whether an argon2 hash uses different parameters.
+
+        :param hashed_password: The stored argon2 hash.
+
+        :return: True when the hash should be regenerated.
+        """
+        try:
+            return self._hasher.check_needs_rehash(hashed_password)
+        except argon2.exceptions.InvalidHashError:
+            return False
+
+
+def argon2_available() -> bool:
+    """Check whether the optional argon2 backend can be used.
+
+    :return: True when ``argon2-cffi`` is installed.
+    """
+    return argon2 is not None
@@ -1,36 +1,108 @@
+"""Sign and verify JWTs.
+
+Tokens signed with the configured HS256, HS384 or HS512 key are encoded and
+verified here without python-jose. Other algorithms, foreign headers and
+registered claims such as ``aud`` still go through python-jose, which is only
+imported once one of them is met.
+"""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import json
 from collections.abc import Mapping
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from jose import JWTError, jwt
-
 from core.config import config
 from core.exceptions import UnauthorizedException
 
+HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+# Registered claims whose validation is left to python-jose.
+DELEGATED_CLAIMS = frozenset({"aud", "iss", "sub", "jti", "at_hash"})
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
 
 class JWTHandler:
     secret_key = config.SECRET_KEY
     algorithm = config.JWT_ALGORITHM
     expire_minutes = config.JWT_EXPIRE_MINUTES
 
-    def encode(self, payload: Mapping[str, Any]) -> str:
+    def __init__(self) -> None:
+        digest = HMAC_DIGESTS.get(self.algorithm)
+        self._mac = (
+            hmac.new(self.secret_key.encode("utf-8"), digestmod=digest)
+            if digest
+            else None
+        )
+        # Same serialization as python-jose, so tokens stay byte-identical.
+        self._header_segment = _b64url_encode(
+            json.dumps(
+                {"alg": self.algorithm, "typ": "JWT"},
+                separators=(",", ":"),
+                sort_keys=True,
+            ).encode("utf-8")
+        )
+
+    def expires_at(self) -> datetime:
+        """Return the expiry for a token issued now.
+
+        :return: The current time plus the configured expiration interval.
+        """
+        return datetime.now(UTC) + timedelta(minutes=self.expire_minutes)
+
+    def encode(
+        self, payload: Mapping[str, Any], expires_at: datetime | None = None
+    ) -> str:
         """Encode claims into a signed JWT.
 
-        The configured expiration interval is added to a copy of the supplied
-        payload so callers do not have their mapping mutated.
+        The expiration is added to a copy of the supplied payload so callers do
+        not have their mapping mutated. HMAC algorithms are signed directly
+        with a precomputed header and key; others go through python-jose.
 
         :param payload: Claims to include in the token.
+        :param expires_at: The token expiry, defaulting to ``expires_at()``.
+            Pass the same value to sign several tokens issued together.
 
         :return: The encoded JWT string.
         """
-        expire = datetime.now(UTC) + timedelta(minutes=self.expire_minutes)
+        expire = expires_at or self.expires_at()
         claims = dict(payload)
-        claims.update({"exp": expire})
-        return jwt.encode(claims, self.secret_key, algorithm=self.algorithm)
+        if self._mac is None:
+            from jose import jwt
+
+            claims.update({"exp": expire})
+            return jwt.encode(claims, self.secret_key, algorithm=self.algorithm)
+
+        claims.update({"exp": int(expire.timestamp())})
+        payload_segment = _b64url_encode(
+            json.dumps(claims, separators=(",", ":")).encode("utf-8")
+        )
+        signing_input = self._header_segment + b"." + payload_segment
+        return (
+            signing_input + b"." + _b64url_encode(self._sign(signing_input))
+        ).decode("ascii")
 
     def decode(self, token: str) -> dict[str, Any]:
         """Decode and validate a signed JWT.
 
+        Tokens with the configured header are verified directly, comparing
+        signatures in constant time. Tokens with any other header, or with
+        claims such as ``aud`` that need extra validation, are handed to
+        python-jose.
+
         :param token: The JWT string to decode.
 
         :raises UnauthorizedException: If the token is malformed, expired, or
@@ -38,10 +110,89 @@ class JWTHandler:
 
         :return: The decoded token claims.
         """
+        claims = self._decode_compact(token)
+        if claims is None or not DELEGATED_CLAIMS.isdisjoint(claims):
+            return self._decode_with_jose(token)
+        return claims
+
+    def _decode_compact(self, token: str) -> dict[str, Any] | None:
+        """Verify a token signed with the configured HMAC header.
+
+        :param token: The JWT string to decode.
+
+        :raises UnauthorizedException: If the token fails validation.
+
+        :return: The claims, or None when the token needs the generic path.
+        """
+        if self._mac is None:
+            return None
+
+        try:
+            signing_input, signature = token.encode("ascii").rsplit(b".", 1)
+            header_segment, payload_segment = signing_input.split(b".")
+        except (UnicodeEncodeError, ValueError):
+            raise UnauthorizedException("Invalid token")
+        if header_segment != self._header_segment:
+            return None
+
+        try:
+            valid = hmac.compare_digest(
+                self._sign(signing_input), _b64url_decode(signature)
+            )
+            claims = json.loads(_b64url_decode(payload_segment))
+        except (binascii.Error, ValueError):
+            raise UnauthorizedException("Invalid token")
+        if not valid or not isinstance(claims, dict):
+            raise UnauthorizedException("Invalid token")
+
+        self._validate_times(claims)
+        return claims
+
+    def _validate_times(self, claims: Mapping[str, Any]) -> None:
+        """Validate the time claims the way python-jose does, with no leeway.
+
+        :param claims: The decoded claims.
+
+        :raises UnauthorizedException: If the token is expired, not yet valid,
+            or carries non-numeric time claims.
+        """
+        now = int(datetime.now(UTC).timestamp())
+        try:
+            if "iat" in claims:
+                int(claims["iat"])
+            if "nbf" in claims and int(claims["nbf"]) > now:
+                raise UnauthorizedException("Invalid token")
+            if "exp" in claims and int(claims["exp"]) < now:
+                raise UnauthorizedException("Invalid token")
+        except (TypeError, ValueError):
+            raise UnauthorizedException("Invalid token")
+
+    def _decode_with_jose(self, token: str) -> dict[str, Any]:
+        """Decode a token through python-jose's generic validation.
+
+        :param token: The JWT string to decode.
+
+        :raises UnauthorizedException: If the token fails validation.
+
+        :return: The decoded token claims.
+        """
+        from jose import JWTError, jwt
+
         try:
             return jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
         except JWTError:
             raise UnauthorizedException("Invalid token")
 
+    def _sign(self, signing_input: bytes) -> bytes:
+        """Sign with a copy of the keyed HMAC instead of re-keying every time.
+
+        :param signing_input: The encoded header and payload segments.
+
+        :return: The raw signature.
+        """
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
 
 jwt_handler: JWTHandler = JWTHandler()
@@ -1,42 +1,366 @@
+import asyncio
+import math
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
 import bcrypt
 
+from core.config import ExecutorType, config
+from core.exceptions import ServiceUnavailableException
+from core.security.hashers import (
+    Argon2Hasher,
+    BCryptHasher,
+    PasswordHasher,
+    PBKDF2Hasher,
+    ScryptHasher,
+    argon2_available,
+)
+
+BCRYPT_CALIBRATION_ROUNDS = 8
+BCRYPT_CALIBRATION_SAMPLES = 3
+
+T = TypeVar("T")
+
+
+def _time_hashpw(rounds: int, samples: int) -> float:
+    salt = bcrypt.gensalt(rounds)
+    timings = []
+    for _ in range(samples):
+        started_at = time.perf_counter()
+        bcrypt.hashpw(b"calibration", salt)
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+@dataclass(frozen=True)
+class PasswordPoolStats:
+    executor: str
+    workers: int
+    max_queue_size: int
+    queued: int
+    running: int
+    peak_queued: int
+    completed: int
+    rejected: int
+
 
 class PasswordHandler:
+    """Hash and verify passwords.
+
+    New hashes use the default hasher, while stored hashes are verified by
+    whichever registered hasher recognises their prefix, so several schemes can
+    coexist until users log in again and are migrated.
+
+    The synchronous methods hash inline and are meant for scripts and the ORM
+    setter. Request handlers should use the ``async`` methods, which run the
+    hasher in a bounded worker pool so the event loop is never blocked.
+    """
+
+    def __init__(
+        self,
+        hashers: Sequence[PasswordHasher] | None = None,
+        default_algorithm: str = BCryptHasher.algorithm,
+        executor_type: ExecutorType = ExecutorType.THREAD,
+        max_workers: int = 4,
+        max_queue_size: int = 64,
+    ):
+        self.hashers = {
+            hasher.algorithm: hasher for hasher in hashers or [BCryptHasher()]
+        }
+        if default_algorithm not in self.hashers:
+            raise ValueError(f"Password hasher {default_algorithm!r} is not available")
+        self.default_algorithm = default_algorithm
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+
+        self._executor: Executor | None = None
+        self._in_flight = 0
+        self._peak_queued = 0
+        self._completed = 0
+        self._rejected = 0
+
+    @property
+    def hasher(self) -> PasswordHasher:
+        """Return the hasher used for new hashes.
+
+        :return: The default password hasher.
+        """
+        return self.hashers[self.default_algorithm]
+
+    def identify(self, hashed_password: str) -> PasswordHasher | None:
+        """Return the registered hasher that produced a stored hash.
+
+        :param hashed_password: The stored hash.
+
+        :return: The matching hasher, or None for an unknown format.
+        """
+        for hasher in self.hashers.values():
+            if hasher.identify(hashed_password):
+                return hasher
+        return None
+
     def generate_password_hash(self, password: str) -> str:
-        """Generate a bcrypt hash for a plaintext password.
+        """Generate a hash for a plaintext password with the default hasher.
 
         :param password: The plaintext password to hash.
 
-        :raises ValueError: If the UTF-8 encoded password exceeds bcrypt's
-            72-byte input limit.
+        :raises ValueError: If the UTF-8 encoded password exceeds the hasher's
+            input limit.
 
-        :return: The generated bcrypt hash.
+        :return: The generated hash.
         """
-        password_bytes = password.encode("utf-8")
-        if len(password_bytes) > 72:
-            raise ValueError("Password cannot be longer than 72 bytes")
-
-        return bcrypt.hashpw(password_bytes, bcrypt.gensalt()).decode("utf-8")
+        return self.hasher.hash(self._encode_for_hashing(password))
 
     def check_password_hash(self, hashed_password: str, plain_password: str) -> bool:
-        """Check whether a plaintext password matches a bcrypt hash.
+        """Check whether a plaintext password matches a stored hash.
 
-        Invalid hashes and passwords that exceed bcrypt's byte limit are treated
-        as non-matches instead of raising to callers.
+        Unknown or invalid hashes and passwords that exceed the hasher's byte
+        limit are treated as non-matches instead of raising to callers.
 
-        :param hashed_password: The stored bcrypt hash.
+        :param hashed_password: The stored hash.
         :param plain_password: The plaintext password to verify.
 
         :return: True when the password matches the hash, otherwise False.
         """
+        hasher = self.identify(hashed_password)
         plain_password_bytes = plain_password.encode("utf-8")
-        if len(plain_password_bytes) > 72:
+        if hasher is None or self._exceeds_limit(hasher, plain_password_bytes):
             return False
 
-        try:
-            return bcrypt.checkpw(plain_password_bytes, hashed_password.encode("utf-8"))
-        except ValueError:
+        return hasher.verify(plain_password_bytes, hashed_password)
+
+    async def hash_password(self, password: str) -> str:
+        """Generate a hash with the default hasher in the worker pool.
+
+        :param password: The plaintext password to hash.
+
+        :raises ValueError: If the UTF-8 encoded password exceeds the hasher's
+            input limit.
+        :raises ServiceUnavailableException: If the worker pool queue is full.
+
+        :return: The generated hash.
+        """
+        password_bytes = self._encode_for_hashing(password)
+        return await self._submit(self.hasher.hash, password_bytes)
+
+    async def hash_passwords(
+        self, passwords: Sequence[str], return_exceptions: bool = False
+    ) -> list[str | BaseException]:
+        """Hash several passwords in parallel in the worker pool.
+
+        At most ``max_workers`` hashes of the batch are in flight at once, so a
+        large batch keeps every worker busy without filling the queue that
+        concurrent requests rely on.
+
+        :param passwords: The plaintext passwords to hash.
+        :param return_exceptions: Return a failed password's exception in
+            place of its hash instead of raising it.
+
+        :raises ValueError: If a password exceeds the hasher's input limit.
+        :raises ServiceUnavailableException: If the worker pool queue is full.
+
+        :return: The hashes, in the order of ``passwords``.
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def hash_one(password: str) -> str:
+            async with semaphore:
+                return await self.hash_password(password)
+
+        return await asyncio.gather(
+            *(hash_one(password) for password in passwords),
+            return_exceptions=return_exceptions,
+        )
+
+    async def verify_password(self, hashed_password: str, plain_password: str) -> bool:
+        """Check a plaintext password against a stored hash in the worker pool.
+
+        :param hashed_password: The stored hash.
+        :param plain_password: The plaintext password to verify.
+
+        :raises ServiceUnavailableException: If the worker pool queue is full.
+
+        :return: True when the password matches the hash, otherwise False.
+        """
+        hasher = self.identify(hashed_password)
+        plain_password_bytes = plain_password.encode("utf-8")
+        if hasher is None or self._exceeds_limit(hasher, plain_password_bytes):
             return False
 
+        return await self._submit(hasher.verify, plain_password_bytes, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Check whether a stored hash should be regenerated.
+
+        :param hashed_password: The stored hash.
+
+        :return: True when the hash was made by another hasher or with
+            different parameters than the default hasher uses.
+        """
+        hasher = self.identify(hashed_password)
+        if hasher is None:
+            return False
+        if hasher is not self.hasher:
+            return True
+        return hasher.needs_update(hashed_password)
+
+    async def calibrate(
+        self, budget_ms: float, min_rounds: int = 10, max_rounds: int = 16
+    ) -> int:
+        """Pick the highest bcrypt cost whose hash time fits the budget.
+
+        A low-cost hash is timed in the worker pool and extrapolated, as each
+        extra round doubles the bcrypt work.
+
+        :param budget_ms: The target time for a single hash, in milliseconds.
+        :param min_rounds: The lowest cost to accept, even if over budget.
+        :param max_rounds: The highest cost to accept.
+
+        :raises ValueError: If the default hasher is not bcrypt, the only
+            scheme whose cost can be calibrated.
+
+        :return: The selected cost, which is also stored on the bcrypt hasher.
+        """
+        hasher = self.hasher
+        if not isinstance(hasher, BCryptHasher):
+            raise ValueError(
+                f"Cannot calibrate the {self.default_algorithm!r} hasher, only bcrypt"
+            )
+
+        seconds = await self._submit(
+            _time_hashpw, BCRYPT_CALIBRATION_ROUNDS, BCRYPT_CALIBRATION_SAMPLES
+        )
+        rounds = BCRYPT_CALIBRATION_ROUNDS + math.floor(
+            math.log2(budget_ms / (seconds * 1000))
+        )
+        hasher.rounds = max(min_rounds, min(rounds, max_rounds))
+        return hasher.rounds
+
+    def stats(self) -> PasswordPoolStats:
+        """Return a snapshot of the worker pool queue.
+
+        :return: The current queue depth and lifetime counters.
+        """
+        return PasswordPoolStats(
+            executor=self.executor_type.value,
+            workers=self.max_workers,
+            max_queue_size=self.max_queue_size,
+            queued=max(self._in_flight - self.max_workers, 0),
+            running=min(self._in_flight, self.max_workers),
+            peak_queued=self._peak_queued,
+            completed=self._completed,
+            rejected=self._rejected,
+        )
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool, waiting for running jobs to finish."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def _submit(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a hashing function in the worker pool.
+
+        :param func: A picklable callable, so it can be sent to a process.
+        :param args: The arguments to call the function with.
+
+        :raises ServiceUnavailableException: If the worker pool queue is full.
+
+        :return: The function result.
+        """
+        if self._in_flight >= self.max_workers + self.max_queue_size:
+            self._rejected += 1
+            raise ServiceUnavailableException("Password hashing queue is full")
+
+        self._in_flight += 1
+        self._peak_queued = max(self._peak_queued, self._in_flight - self.max_workers)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+
+    def _get_executor(self) -> Executor:
+        """Return the worker pool, creating it on first use.
+
+        The pool is created lazily so forked server workers each get their own.
+
+        :return: The executor running the hashing jobs.
+        """
+        if self._executor is None:
+            if self.executor_type == ExecutorType.PROCESS:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hasher",
+                )
+        return self._executor
+
+    def _encode_for_hashing(self, password: str) -> bytes:
+        """Encode a password and enforce the default hasher's input limit.
+
+        :param password: The plaintext password.
+
+        :raises ValueError: If the encoded password is too long for the hasher.
+
+        :return: The UTF-8 encoded password.
+        """
+        password_bytes = password.encode("utf-8")
+        if self._exceeds_limit(self.hasher, password_bytes):
+            raise ValueError(
+                f"Password cannot be longer than {self.hasher.max_password_bytes} bytes"
+            )
+        return password_bytes
+
+    def _exceeds_limit(self, hasher: PasswordHasher, password_bytes: bytes) -> bool:
+        """Check a password against a hasher's input limit.
+
+        :param hasher: The hasher that will process the password.
+        :param password_bytes: The UTF-8 encoded password.
+
+        :return: True when the password is too long for the hasher.
+        """
+        return (
+            hasher.max_password_bytes is not None
+            and len(password_bytes) > hasher.max_password_bytes
+        )
+
+
+def build_hashers() -> list[PasswordHasher]:
+    """Create the configured password hashers.
+
+    :return: Every available hasher, with parameters taken from the config.
+    """
+    hashers: list[PasswordHasher] = [
+        BCryptHasher(rounds=config.BCRYPT_ROUNDS),
+        ScryptHasher(
+            cost=config.SCRYPT_COST,
+            block_size=config.SCRYPT_BLOCK_SIZE,
+            parallelism=config.SCRYPT_PARALLELISM,
+        ),
+        PBKDF2Hasher(iterations=config.PBKDF2_ITERATIONS),
+    ]
+    if argon2_available():
+        hashers.append(
+            Argon2Hasher(
+                time_cost=config.ARGON2_TIME_COST,
+                memory_cost=config.ARGON2_MEMORY_COST,
+                parallelism=config.ARGON2_PARALLELISM,
+            )
+        )
+    return hashers
+
 
-password_handler: PasswordHandler = PasswordHandler()
+password_handler: PasswordHandler = PasswordHandler(
+    hashers=build_hashers(),
+    default_algorithm=config.PASSWORD_HASH_ALGORITHM,
+    executor_type=config.PASSWORD_HASH_EXECUTOR,
+    max_workers=config.PASSWORD_HASH_WORKERS,
+    max_queue_size=config.PASSWORD_HASH_QUEUE_SIZE,
+)
@@ -1,17 +1,20 @@
 from app.models import Role
 from core.exceptions import ForbiddenException
-from core.fastapi.dependencies import CurrentUserDep
+from core.fastapi.dependencies import AuthenticatedUserDep
 
 
 def require_role(required_role: Role):
     """Create a dependency that enforces a minimum user role.
 
+    The role is read from the access token claims, so the check does not load
+    the user row.
+
     :param required_role: The lowest role allowed to access the endpoint.
 
     :return: A FastAPI dependency that returns the current user when permitted.
     """
 
-    def role_checker(current_user: CurrentUserDep):
+    def role_checker(current_user: AuthenticatedUserDep):
         if current_user.role.value < required_role.value:
             raise ForbiddenException("Insufficient permissions")
         return current_user
@@ -0,0 +1,153 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class TokenCacheStats:
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class TokenCache(Generic[V]):
+    """Bounded LRU cache of verified token payloads.
+
+    Entries are keyed by a SHA-256 digest of the token, so raw tokens are never
+    kept in memory, and each entry expires with the token's ``exp`` claim.
+    A ``max_size`` of zero disables the cache.
+    """
+
+    def __init__(self, max_size: int = 10_000):
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[V, float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, token: str) -> V | None:
+        """Return the cached payload for a token that has not expired.
+
+        :param token: The encoded token.
+
+        :return: The cached payload, or None on a miss.
+        """
+        if self.max_size <= 0:
+            return None
+
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        value, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, token: str, value: V, expires_at: float) -> None:
+        """Cache the payload of a verified token.
+
+        :param token: The encoded token.
+        :param value: The verified payload.
+        :param expires_at: The token's expiry as a Unix timestamp.
+        """
+        if self.max_size <= 0:
+            return
+
+        key = self._key(token)
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+    def stats(self) -> TokenCacheStats:
+        """Return the cache size and hit counters.
+
+        :return: A snapshot of the cache statistics.
+        """
+        return TokenCacheStats(
+            size=len(self._entries),
+            max_size=self.max_size,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
+
+    def _key(self, token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+class TokenVersionCache:
+    """Bounded cache of recently confirmed per-user token versions.
+
+    Access tokens carry the user's token version, which is bumped whenever
+    their role or password changes or the account is deleted. Versions read
+    from the database are trusted for ``ttl`` seconds; versions written by this
+    process take effect immediately. A ``ttl`` of zero disables the cache.
+    """
+
+    REVOKED = -1
+
+    def __init__(self, ttl: float = 30, max_size: int = 10_000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[int, tuple[int, float]] = OrderedDict()
+
+    def get(self, user_id: int) -> int | None:
+        """Return the user's token version if it was confirmed recently.
+
+        :param user_id: The user id.
+
+        :return: The token version, ``REVOKED`` for deleted users, or None
+            when the version has to be read again.
+        """
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+
+        version, checked_at = entry
+        if time.monotonic() - checked_at >= self.ttl:
+            del self._entries[user_id]
+            return None
+
+        self._entries.move_to_end(user_id)
+        return version
+
+    def set(self, user_id: int, version: int | None) -> None:
+        """Record the user's current token version.
+
+        :param user_id: The user id.
+        :param version: The token version, or None when the user is gone.
+        """
+        if self.ttl <= 0 or self.max_size <= 0:
+            return
+
+        self._entries[user_id] = (
+            self.REVOKED if version is None else version,
+            time.monotonic(),
+        )
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached version."""
+        self._entries.clear()
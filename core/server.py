@@ -1,16 +1,19 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, RedirectResponse
-from starlette.middleware.authentication import AuthenticationMiddleware
 
 from api import router
 from core.config import config
+from core.database.session import replicas
 from core.exceptions import CustomException
-from core.fastapi.middlewares import (
-    AuthenticationBackend,
-    SQLAlchemyMiddleware,
-)
+from core.fastapi.middlewares import SQLAlchemyMiddleware
+from core.security import password_handler
 
 
 def init_routers(app_: FastAPI) -> None:
@@ -40,6 +43,9 @@ def init_listeners(app_: FastAPI) -> None:
 def make_middleware() -> list[Middleware]:
     """Create the middleware for the FastAPI application.
 
+    Authentication is not a middleware: routes opt in through the
+    authentication dependencies, so public routes skip it entirely.
+
     :returns: The middleware for the FastAPI application.
     """
     middleware = [
@@ -49,13 +55,38 @@ def make_middleware() -> list[Middleware]:
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=["X-Next-Cursor"],
+        ),
+        Middleware(
+            SQLAlchemyMiddleware,
+            repeated_statement_threshold=config.REPEATED_STATEMENT_THRESHOLD,
         ),
-        Middleware(SQLAlchemyMiddleware),
-        Middleware(AuthenticationMiddleware, backend=AuthenticationBackend()),
     ]
     return middleware
 
 
+@asynccontextmanager
+async def lifespan(app_: FastAPI) -> AsyncIterator[None]:  # noqa: ARG001
+    """Manage resources that live for the duration of the application.
+
+    :param app_: The FastAPI application.
+    """
+    health_checks = None
+    if replicas.replicas:
+        await replicas.check(timeout=config.REPLICA_HEALTH_CHECK_SECONDS)
+        health_checks = asyncio.create_task(
+            replicas.run_health_checks(config.REPLICA_HEALTH_CHECK_SECONDS)
+        )
+
+    yield
+    if health_checks is not None:
+        health_checks.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await health_checks
+        await replicas.dispose()
+    password_handler.shutdown()
+
+
 def create_app() -> FastAPI:
     """Create the FastAPI application.
 
@@ -68,6 +99,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         middleware=make_middleware(),
+        lifespan=lifespan,
     )
     # Initialize the routers
     app_.include_router(router)
@@ -8,6 +8,7 @@ from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.helpers import token_versions
 from app.models import Role, User
 from core.database import get_session
 from core.server import create_app
@@ -21,6 +22,13 @@ def app() -> Generator[FastAPI, Any, None]:
     yield app
 
 
+@pytest.fixture(autouse=True)
+def clear_token_versions() -> Generator[None, Any, None]:
+    """Forget token versions cached for users of a previous test."""
+    yield
+    token_versions.clear()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def client(
     app: FastAPI, db_session: AsyncSession
@@ -0,0 +1,115 @@
+import pytest
+from httpx import AsyncClient
+
+from app.models import Role
+
+
+@pytest.mark.asyncio
+class TestInternalEndpoints:
+    @pytest.mark.parametrize("role", [Role.ADMIN])
+    async def test_database_pools(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test pool statistics with authorized access."""
+        response = await authenticated_client.get("/api/v1/internal/database/pools")
+        assert response.status_code == 200
+        assert response.json()["pools"][0]["name"] == "writer"
+        assert "max_wait" in response.json()["pools"][0]
+
+    @pytest.mark.parametrize("role", [Role.USER, Role.MODERATOR])
+    async def test_unauthorized_database_pools(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test unauthorized access to pool statistics."""
+        response = await authenticated_client.get("/api/v1/internal/database/pools")
+        assert response.status_code == 403
+
+    @pytest.mark.parametrize("role", [Role.ADMIN])
+    async def test_database_statement_cache(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test compiled cache statistics with authorized access."""
+        response = await authenticated_client.get(
+            "/api/v1/internal/database/statement-cache"
+        )
+        assert response.status_code == 200
+        cache = response.json()["caches"][0]
+        assert cache["name"] == "writer"
+        assert "hit_ratio" in cache
+
+    @pytest.mark.parametrize("role", [Role.USER, Role.MODERATOR])
+    async def test_unauthorized_database_statement_cache(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test unauthorized access to compiled cache statistics."""
+        response = await authenticated_client.get(
+            "/api/v1/internal/database/statement-cache"
+        )
+        assert response.status_code == 403
+
+    @pytest.mark.parametrize("role", [Role.ADMIN])
+    async def test_database_slow_queries(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test the slow-query log with authorized access."""
+        response = await authenticated_client.get(
+            "/api/v1/internal/database/slow-queries"
+        )
+        assert response.status_code == 200
+        assert isinstance(response.json()["queries"], list)
+
+    @pytest.mark.parametrize("role", [Role.USER, Role.MODERATOR])
+    async def test_unauthorized_database_slow_queries(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test unauthorized access to the slow-query log."""
+        response = await authenticated_client.get(
+            "/api/v1/internal/database/slow-queries"
+        )
+        assert response.status_code == 403
+
+    @pytest.mark.parametrize("role", [Role.ADMIN])
+    async def test_password_pool(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test password hashing pool statistics with authorized access."""
+        response = await authenticated_client.get(
+            "/api/v1/internal/security/password-pool"
+        )
+        assert response.status_code == 200
+        pool = response.json()["pool"]
+        assert pool["completed"] >= 1
+        assert pool["rejected"] == 0
+
+    @pytest.mark.parametrize("role", [Role.USER, Role.MODERATOR])
+    async def test_unauthorized_password_pool(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test unauthorized access to password hashing pool statistics."""
+        response = await authenticated_client.get(
+            "/api/v1/internal/security/password-pool"
+        )
+        assert response.status_code == 403
+
+    @pytest.mark.parametrize("role", [Role.ADMIN])
+    async def test_token_cache(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test token cache statistics with authorized access."""
+        url = "/api/v1/internal/security/token-cache"
+        first = (await authenticated_client.get(url)).json()["cache"]
+        response = await authenticated_client.get(url)
+        assert response.status_code == 200
+        cache = response.json()["cache"]
+        assert cache["hits"] == first["hits"] + 1
+        assert cache["misses"] == first["misses"]
+
+    @pytest.mark.parametrize("role", [Role.USER, Role.MODERATOR])
+    async def test_unauthorized_token_cache(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test unauthorized access to token cache statistics."""
+        response = await authenticated_client.get(
+            "/api/v1/internal/security/token-cache"
+        )
+        assert response.status_code == 403
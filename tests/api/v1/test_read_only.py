@@ -0,0 +1,85 @@
+import importlib
+import re
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Role, User
+from core.config import config
+from core.database import get_session
+from core.database.replicas import ReplicaSet
+from core.database.usage import track_statement_usage
+from core.fastapi.dependencies import ReadOnlyDep
+from core.server import create_app
+
+session_module = importlib.import_module("core.database.session")
+
+
+@pytest_asyncio.fixture
+async def routing_session(
+    monkeypatch: pytest.MonkeyPatch, app: FastAPI, db_session: AsyncSession
+) -> AsyncGenerator[AsyncSession, None]:
+    """Serve requests from a routing session on the test database."""
+    monkeypatch.setattr(session_module, "engines", {"writer": db_session.bind})
+    monkeypatch.setattr(session_module, "replicas", ReplicaSet([]))
+    track_statement_usage(db_session.bind)
+    routing_session = AsyncSession(
+        sync_session_class=session_module.RoutingSession, expire_on_commit=False
+    )
+
+    async def _get_session():
+        yield routing_session
+
+    app.dependency_overrides[get_session] = _get_session
+    yield routing_session
+    app.dependency_overrides.pop(get_session, None)
+    await routing_session.close()
+
+
+@pytest.mark.asyncio
+class TestReadOnlyRoutes:
+    @pytest.mark.parametrize("role", [Role.ADMIN])
+    async def test_read_route_sets_statement_timeout(
+        self,
+        authenticated_client: AsyncClient,
+        routing_session: AsyncSession,
+        db_session: AsyncSession,
+        role: Role,  # noqa: ARG002
+    ):
+        """Test a read route times its statements out without counting that."""
+        statements = []
+
+        @event.listens_for(db_session.bind.sync_engine, "before_cursor_execute")
+        def record(
+            conn, cursor, statement, parameters, context, executemany  # noqa: ARG001
+        ) -> None:
+            statements.append(statement)
+
+        response = await authenticated_client.get("/api/v1/users")
+
+        assert response.status_code == 200
+        timeout = int(config.READ_ONLY_STATEMENT_TIMEOUT_SECONDS * 1000)
+        assert f"SET LOCAL statement_timeout = {timeout}" in statements
+        count = re.search(r"(\d+) statement", response.headers["Server-Timing"])
+        assert int(count.group(1)) == len(statements) - 1
+
+    async def test_write_on_read_route_fails(self, routing_session: AsyncSession):
+        """Test a write from a read route raises instead of reaching the writer."""
+        app = create_app()
+
+        @app.post("/write", dependencies=[ReadOnlyDep])
+        async def write():
+            routing_session.add(User(username="writer", password="password"))
+            await routing_session.flush()
+
+        app.dependency_overrides[get_session] = lambda: routing_session
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            with pytest.raises(InvalidRequestError, match="Read-only"):
+                await client.post("/write")
@@ -1,6 +1,7 @@
 import base64
 from datetime import UTC, datetime, timedelta
 
+import bcrypt
 import pytest
 from httpx import AsyncClient
 from jose import jwt
@@ -9,6 +10,8 @@ from starlette.status import HTTP_200_OK, HTTP_401_UNAUTHORIZED
 
 from app.models import User
 from core.config import config
+from core.security import password_handler
+from core.security.hashers import ScryptHasher
 
 
 @pytest.mark.asyncio
@@ -23,6 +26,36 @@ class TestTokenEndpoints:
         response = await self._login(client, user.username, "password")
         assert response.status_code == 200
 
+    async def test_login_rehashes_password_with_outdated_cost(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        password_hash = bcrypt.hashpw(b"password", bcrypt.gensalt(4)).decode()
+        user = User(username="legacyuser", password_hash=password_hash)
+        db_session.add(user)
+        await db_session.commit()
+
+        response = await self._login(client, user.username, "password")
+
+        await db_session.refresh(user)
+        assert response.status_code == HTTP_200_OK
+        assert user.password_hash != password_hash
+        assert not password_handler.needs_rehash(user.password_hash)
+
+    async def test_login_keeps_hash_the_default_hasher_cannot_take(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        password = "é" * 40
+        password_hash = ScryptHasher(cost=4).hash(password.encode())
+        user = User(username="longpassword", password_hash=password_hash)
+        db_session.add(user)
+        await db_session.commit()
+
+        response = await self._login(client, user.username, password)
+
+        await db_session.refresh(user)
+        assert response.status_code == HTTP_200_OK
+        assert user.password_hash == password_hash
+
     async def test_refresh_token_success(self, client: AsyncClient, user: User):
         token_response = await self._login(client, user.username, "password")
 
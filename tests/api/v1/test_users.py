@@ -1,7 +1,11 @@
+import base64
+import json
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Role
+from app.models import Role, User
 from tests.factory.users import create_fake_user
 
 
@@ -37,6 +41,72 @@ class TestUserEndpoints:
         response = await authenticated_client.post("/api/v1/users", json=fake_user)
         assert response.status_code == 400
 
+    @pytest.mark.parametrize("role", [Role.ADMIN])
+    async def test_create_users_in_batch(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test batch creation reports each invalid item and creates the rest."""
+        taken = create_fake_user()
+        await authenticated_client.post("/api/v1/users", json=taken)
+        new_user = create_fake_user()
+        users = [new_user, new_user, taken, {"username": "no_symbols"}]
+
+        response = await authenticated_client.post(
+            "/api/v1/users/batch", json={"users": users}
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [result["index"] for result in results] == [0, 1, 2, 3]
+        assert results[0]["id"] is not None and results[0]["error"] is None
+        assert results[1]["error"] == "Duplicate username in batch"
+        assert results[2]["error"] == "Username already exists"
+        assert results[3]["error"] is not None
+        response = await authenticated_client.get(f"/api/v1/users/{results[0]['id']}")
+        assert response.json()["username"] == new_user["username"]
+
+    @pytest.mark.parametrize("role", [Role.MODERATOR])
+    async def test_unauthorized_batch_create_users(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test that batch endpoints are reserved to admins."""
+        response = await authenticated_client.post(
+            "/api/v1/users/batch", json={"users": [create_fake_user()]}
+        )
+        assert response.status_code == 403
+
+    @pytest.mark.parametrize("role", [Role.ADMIN])
+    async def test_update_and_delete_users_in_batch(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test batch role updates and deletes report missing ids."""
+        response = await authenticated_client.post(
+            "/api/v1/users/batch",
+            json={"users": [create_fake_user() for _ in range(2)]},
+        )
+        ids = [result["id"] for result in response.json()["results"]]
+
+        response = await authenticated_client.put(
+            "/api/v1/users/batch",
+            json={"ids": [*ids, 0], "role": Role.MODERATOR.value},
+        )
+        assert response.status_code == 200
+        assert [result["error"] is None for result in response.json()["results"]] == [
+            True,
+            True,
+            False,
+        ]
+        response = await authenticated_client.get(f"/api/v1/users/{ids[0]}")
+        assert response.json()["role"] == Role.MODERATOR.value
+
+        response = await authenticated_client.request(
+            "DELETE", "/api/v1/users/batch", json={"ids": ids}
+        )
+        assert response.status_code == 200
+        assert all(result["error"] is None for result in response.json()["results"])
+        response = await authenticated_client.get(f"/api/v1/users/{ids[1]}")
+        assert response.status_code == 404
+
     @pytest.mark.parametrize("role", [Role.ADMIN, Role.USER, Role.MODERATOR])
     async def test_get_all_users(
         self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
@@ -45,6 +115,27 @@ class TestUserEndpoints:
         response = await authenticated_client.get("/api/v1/users")
         assert response.status_code == 200
 
+    @pytest.mark.parametrize("role", [Role.ADMIN])
+    async def test_get_users_with_cursor(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test keyset pagination of the user list."""
+        for _ in range(2):
+            await authenticated_client.post("/api/v1/users", json=create_fake_user())
+
+        response = await authenticated_client.get("/api/v1/users?limit=2")
+        first_page = response.json()
+        cursor = response.headers["X-Next-Cursor"]
+        response = await authenticated_client.get(
+            f"/api/v1/users?limit=2&cursor={cursor}"
+        )
+
+        assert response.status_code == 200
+        assert len(first_page) == 2
+        assert len(response.json()) == 1
+        assert response.json()[0]["id"] > first_page[-1]["id"]
+        assert "X-Next-Cursor" not in response.headers
+
     @pytest.mark.parametrize("role", [Role.ADMIN])
     async def test_get_user_by_id(
         self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
@@ -71,6 +162,97 @@ class TestUserEndpoints:
         assert response.status_code == 200
         assert response.json()[0]["username"] == username
 
+    @pytest.mark.parametrize("role", [Role.ADMIN])
+    async def test_search_users_ranks_and_limits_results(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test that search returns the most similar usernames first."""
+        for username in ("malicey", "alice", "alicia"):
+            user = create_fake_user()
+            user["username"] = username
+            await authenticated_client.post("/api/v1/users", json=user)
+
+        response = await authenticated_client.get(
+            "/api/v1/users/search/?query=alice&limit=1"
+        )
+
+        assert response.status_code == 200
+        assert [user["username"] for user in response.json()] == ["alice"]
+
+    @pytest.mark.parametrize("role", [Role.ADMIN])
+    async def test_search_users_escapes_wildcards(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test that LIKE wildcards in the query match literally."""
+        await authenticated_client.post("/api/v1/users", json=create_fake_user())
+
+        response = await authenticated_client.get("/api/v1/users/search/?query=%25")
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    @pytest.mark.parametrize("role", [Role.ADMIN])
+    async def test_search_users_rejects_oversized_limit(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test the hard maximum on search page size."""
+        response = await authenticated_client.get(
+            "/api/v1/users/search/?query=a&limit=101"
+        )
+        assert response.status_code == 422
+
+    @pytest.mark.parametrize("role", [Role.ADMIN])
+    async def test_export_users(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test streaming every user as NDJSON and as CSV."""
+        fake_user = create_fake_user()
+        await authenticated_client.post("/api/v1/users", json=fake_user)
+
+        response = await authenticated_client.get("/api/v1/users/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        usernames = [
+            json.loads(line)["username"] for line in response.text.splitlines()
+        ]
+        assert usernames == ["admin_user", fake_user["username"]]
+
+        response = await authenticated_client.get("/api/v1/users/export?format=csv")
+        assert response.headers["content-type"].startswith("text/csv")
+        assert response.text.splitlines()[0] == "id,created_at,updated_at,username,role"
+        assert len(response.text.splitlines()) == 3
+
+    @pytest.mark.parametrize("role", [Role.MODERATOR])
+    async def test_unauthorized_export_users(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test that only admins can export users."""
+        response = await authenticated_client.get("/api/v1/users/export")
+        assert response.status_code == 403
+
+    @pytest.mark.parametrize("role", [Role.USER])
+    async def test_autocomplete_usernames(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        role: Role,  # noqa: ARG001
+    ):
+        """Test prefix suggestions return only ids and usernames."""
+        for username in ("Bravo", "bravissimo", "abravo"):
+            db_session.add(User(username=username, password="password"))
+        await db_session.commit()
+
+        response = await authenticated_client.get(
+            "/api/v1/users/autocomplete?prefix=BRA&limit=5"
+        )
+
+        assert response.status_code == 200
+        assert [user["username"] for user in response.json()] == [
+            "bravissimo",
+            "Bravo",
+        ]
+        assert set(response.json()[0]) == {"id", "username"}
+
     @pytest.mark.parametrize("role", [Role.ADMIN])
     async def test_update_user(
         self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
@@ -85,6 +267,18 @@ class TestUserEndpoints:
         assert response.status_code == 200
         assert response.json()["username"] == "newusername"
 
+    @pytest.mark.parametrize("role", [Role.ADMIN])
+    async def test_update_and_delete_missing_user(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test that writes to a missing user are reported as not found."""
+        response = await authenticated_client.put(
+            "/api/v1/users/0", json={"username": "newusername"}
+        )
+        assert response.status_code == 404
+        response = await authenticated_client.delete("/api/v1/users/0")
+        assert response.status_code == 404
+
     @pytest.mark.parametrize("role", [Role.USER])
     async def test_unauthorized_update_user(
         self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
@@ -144,3 +338,30 @@ class TestUserEndpoints:
         assert response.status_code == 204
         response = await authenticated_client.get("/api/v1/me")
         assert response.status_code == 404
+
+    @pytest.mark.parametrize("role", [Role.ADMIN])
+    async def test_role_change_revokes_tokens(
+        self, authenticated_client: AsyncClient, role: Role  # noqa: ARG001
+    ):
+        """Test that changing a user's role revokes their access token."""
+        fake_user = create_fake_user()
+        response = await authenticated_client.post("/api/v1/users", json=fake_user)
+        user_id = response.json()["id"]
+        credentials = f"{fake_user['username']}:{fake_user['password']}"
+        encoded_credentials = base64.b64encode(credentials.encode()).decode("utf-8")
+        response = await authenticated_client.post(
+            "/api/v1/tokens", headers={"Authorization": f"Basic {encoded_credentials}"}
+        )
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        response = await authenticated_client.put(
+            f"/api/v1/users/{user_id}", json={"role": Role.MODERATOR.value}
+        )
+        assert response.status_code == 200
+
+        response = await authenticated_client.get("/api/v1/me", headers=headers)
+        assert response.status_code == 401
+        response = await authenticated_client.put(
+            "/api/v1/me", headers=headers, json={"username": "newusername"}
+        )
+        assert response.status_code == 401
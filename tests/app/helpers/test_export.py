@@ -0,0 +1,68 @@
+import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.helpers import ExportFormat, encode_export
+from app.models import Role
+from app.schemas.responses import UserResponse
+
+CREATED_AT = datetime(2026, 1, 2, 3, 4, 5)
+
+
+async def _batches(*sizes: int) -> AsyncIterator[Sequence[SimpleNamespace]]:
+    user_id = 0
+    for size in sizes:
+        batch = []
+        for _ in range(size):
+            user_id += 1
+            batch.append(
+                SimpleNamespace(
+                    id=user_id,
+                    created_at=CREATED_AT,
+                    updated_at=CREATED_AT,
+                    username=f"user{user_id}",
+                    role=Role.USER,
+                    password_hash="hidden",
+                )
+            )
+        yield batch
+
+
+@pytest.mark.asyncio
+class TestEncodeExport:
+    async def test_ndjson_yields_one_chunk_per_batch(self):
+        chunks = [
+            chunk
+            async for chunk in encode_export(
+                _batches(2, 1), UserResponse, ExportFormat.NDJSON
+            )
+        ]
+
+        lines = b"".join(chunks).splitlines()
+        assert len(chunks) == 2
+        assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+        assert json.loads(lines[0]) == {
+            "id": 1,
+            "created_at": "2026-01-02T03:04:05",
+            "updated_at": "2026-01-02T03:04:05",
+            "username": "user1",
+            "role": Role.USER.value,
+        }
+
+    async def test_csv_starts_with_header(self):
+        chunks = [
+            chunk
+            async for chunk in encode_export(
+                _batches(2), UserResponse, ExportFormat.CSV
+            )
+        ]
+
+        rows = b"".join(chunks).decode().splitlines()
+        assert rows[0] == "id,created_at,updated_at,username,role"
+        assert (
+            rows[2]
+            == f"2,2026-01-02T03:04:05,2026-01-02T03:04:05,user2,{Role.USER.value}"
+        )
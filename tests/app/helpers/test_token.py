@@ -0,0 +1,60 @@
+import pytest
+
+from app.helpers import TokenHelper, TokenType
+from app.models import Role
+from core.exceptions import UnauthorizedException
+from core.security import jwt_handler
+from core.security.token_cache import TokenCache
+
+
+class TestTokenHelper:
+    @pytest.fixture
+    def helper(self) -> TokenHelper:
+        return TokenHelper(cache=TokenCache(max_size=10))
+
+    def test_decode_caches_verified_payload(self, helper: TokenHelper):
+        token = helper.encode(1, TokenType.ACCESS, Role.USER, token_version=0)
+
+        first = helper.decode(token, expected_type=TokenType.ACCESS)
+        second = helper.decode(token, expected_type=TokenType.ACCESS)
+
+        assert first is second
+        assert first.user_id == 1
+        assert helper.cache.stats().hits == 1
+        assert helper.cache.stats().misses == 1
+
+    def test_cached_payload_still_checks_token_type(self, helper: TokenHelper):
+        token = helper.encode(1, TokenType.REFRESH, Role.USER, token_version=0)
+        helper.decode(token)
+
+        with pytest.raises(UnauthorizedException):
+            helper.decode(token, expected_type=TokenType.ACCESS)
+
+    def test_invalid_token_is_not_cached(self, helper: TokenHelper):
+        with pytest.raises(UnauthorizedException):
+            helper.decode("invalid_token")
+
+        assert helper.cache.stats().size == 0
+
+    def test_decode_returns_role_and_token_version(self, helper: TokenHelper):
+        token = helper.encode(1, TokenType.ACCESS, Role.MODERATOR, token_version=3)
+
+        payload = helper.decode(token, expected_type=TokenType.ACCESS)
+
+        assert payload.role is Role.MODERATOR
+        assert payload.token_version == 3
+
+    def test_decode_rejects_token_without_role_claims(self, helper: TokenHelper):
+        token = jwt_handler.encode({"user_id": 1, "token_type": "access"})
+
+        with pytest.raises(UnauthorizedException):
+            helper.decode(token)
+
+    def test_validate_refresh_rejects_mismatched_token_versions(
+        self, helper: TokenHelper
+    ):
+        access_token = helper.encode(1, TokenType.ACCESS, Role.USER, token_version=1)
+        refresh_token = helper.encode(1, TokenType.REFRESH, Role.USER, token_version=0)
+
+        with pytest.raises(UnauthorizedException):
+            helper.validate_refresh(access_token, refresh_token)
@@ -0,0 +1,90 @@
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event, select, text, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import User
+from app.repositories import UserRepository
+from app.repositories.users import escape_like
+
+
+def test_escape_like():
+    assert escape_like("a%b_c/d") == "a/%b/_c//d"
+
+
+class TestUserIndexes:
+    @pytest.mark.asyncio
+    async def test_creation_year_page_uses_created_at_index(
+        self, db_session: AsyncSession
+    ):
+        query = (
+            select(User)
+            .where(
+                User.created_at >= datetime(2024, 1, 1),
+                User.created_at < datetime(2025, 1, 1),
+                tuple_(User.created_at, User.id) > tuple_(datetime(2024, 6, 1), 10),
+            )
+            .order_by(User.created_at, User.id)
+            .limit(10)
+        )
+        compiled = query.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+
+        # The test table is tiny, so forbid the sequential scan the planner
+        # would otherwise prefer and check that the index can serve the query.
+        await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+        result = await db_session.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"))
+        plan = json.dumps(result.scalar())
+
+        assert "ix_users_created_at_id" in plan
+        assert '"Sort"' not in plan
+
+    @pytest.mark.asyncio
+    async def test_username_search_reads_nearest_matches_from_index(
+        self, db_session: AsyncSession
+    ):
+        query = (
+            select(User)
+            .where(User.username.ilike("%ali%", escape="/"))
+            .order_by(User.username.op("<->")("ali"), User.id)
+            .limit(10)
+        )
+        compiled = query.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+
+        # Forbid the scans that cannot return rows by distance, so the plan
+        # shows whether the trigram index can serve the ordering itself.
+        await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+        await db_session.execute(text("SET LOCAL enable_bitmapscan = off"))
+        result = await db_session.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"))
+        plan = json.dumps(result.scalar())
+
+        assert "ix_users_username_gist_trgm" in plan
+        assert '"Node Type": "Sort"' not in plan
+
+
+class TestUserRepository:
+    @pytest.mark.asyncio
+    async def test_lookups_reuse_compiled_statements(self, db_session: AsyncSession):
+        repository = UserRepository(model=User, db_session=db_session)
+        user = await repository.create({"username": "cached", "password_hash": "x"})
+        cache_hits = []
+
+        @event.listens_for(db_session.bind.sync_engine, "before_cursor_execute")
+        def record(
+            conn, cursor, statement, parameters, context, executemany  # noqa: ARG001
+        ):
+            cache_hits.append(context.cache_hit)
+
+        for _ in range(2):
+            assert await repository.get_by(User.id, user.id, unique=True) is user
+            assert await repository.get_by_username("cached") is user
+            assert await repository.search_by_username("ache") == [user]
+
+        assert cache_hits[3:] == [CacheStats.CACHE_HIT] * 3
@@ -0,0 +1,38 @@
+import time
+
+import pytest
+
+from core.database.consistency import RecentWrites
+
+
+class TestRecentWrites:
+    def test_write_is_recent_within_window(self):
+        recent_writes = RecentWrites(window=5)
+        recent_writes.mark(1)
+
+        assert recent_writes.is_recent(1)
+        assert not recent_writes.is_recent(2)
+
+    def test_write_expires_after_window(self, monkeypatch: pytest.MonkeyPatch):
+        recent_writes = RecentWrites(window=5)
+        recent_writes.mark(1)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 6)
+
+        assert not recent_writes.is_recent(1)
+        recent_writes.mark(2)
+        assert list(recent_writes._written_at) == [2]
+
+    def test_oldest_write_is_evicted(self):
+        recent_writes = RecentWrites(window=5, max_size=2)
+        for key in (1, 2, 3):
+            recent_writes.mark(key)
+
+        assert not recent_writes.is_recent(1)
+        assert recent_writes.is_recent(3)
+
+    def test_zero_window_disables_tracking(self):
+        recent_writes = RecentWrites(window=0)
+        recent_writes.mark(1)
+
+        assert not recent_writes.is_recent(1)
@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from core.config import ReplicaSelection
+from core.database.replicas import Replica, ReplicaSet
+
+
+def _engine(host: str, port: int = 5432) -> AsyncEngine:
+    return create_async_engine(f"postgresql+asyncpg://user:password@{host}:{port}/db")
+
+
+class TestReplicaSet:
+    def test_round_robin_cycles_through_replicas(self):
+        first, second = _engine("first"), _engine("second")
+        replicas = ReplicaSet([first, second])
+
+        assert [replicas.choose() for _ in range(4)] == [first, second, first, second]
+
+    def test_least_connections_picks_idlest_replica(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        busy, idle = _engine("busy"), _engine("idle")
+        replicas = ReplicaSet(
+            [busy, idle], selection=ReplicaSelection.LEAST_CONNECTIONS
+        )
+        monkeypatch.setattr(
+            Replica, "connections", property(lambda r: 5 if r.engine is busy else 1)
+        )
+
+        assert replicas.choose() is idle
+
+    def test_unhealthy_replicas_are_skipped(self):
+        lagging, healthy = _engine("lagging"), _engine("healthy")
+        replicas = ReplicaSet([lagging, healthy])
+        replicas.replicas[0].healthy = False
+
+        assert {replicas.choose() for _ in range(4)} == {healthy}
+
+    def test_is_healthy_follows_evictions(self):
+        engine = _engine("replica")
+        replicas = ReplicaSet([engine])
+
+        assert replicas.is_healthy(engine)
+        replicas.replicas[0].healthy = False
+        assert not replicas.is_healthy(engine)
+        assert not replicas.is_healthy(_engine("unknown"))
+
+    def test_no_healthy_replica_falls_back_to_writer(self):
+        assert ReplicaSet([]).choose() is None
+
+    @pytest.mark.asyncio
+    async def test_unreachable_replica_is_evicted(self):
+        replicas = ReplicaSet([_engine("127.0.0.1", port=1)])
+
+        await replicas.check(timeout=2)
+
+        assert replicas.replicas[0].healthy is False
+        assert replicas.choose() is None
+        await replicas.dispose()
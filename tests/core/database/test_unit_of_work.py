@@ -0,0 +1,66 @@
+import pytest
+from faker import Faker
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import User
+from core.database import after_commit, in_unit_of_work, unit_of_work
+from core.repository import BaseRepository
+
+fake = Faker()
+
+
+@pytest.mark.asyncio
+class TestUnitOfWork:
+    async def test_commits_writes_once_at_the_end(self, db_session: AsyncSession):
+        repository = BaseRepository(model=User, db_session=db_session)
+
+        async with unit_of_work(db_session):
+            first = await repository.create(self._user_data())
+            second = await repository.create(self._user_data())
+            assert first.id is not None
+            assert db_session.in_transaction()
+
+        assert not in_unit_of_work(db_session)
+        assert not db_session.in_transaction()
+        assert {user.id for user in await repository.get_all()} == {
+            first.id,
+            second.id,
+        }
+
+    async def test_rolls_back_when_the_block_raises(self, db_session: AsyncSession):
+        repository = BaseRepository(model=User, db_session=db_session)
+
+        with pytest.raises(RuntimeError):
+            async with unit_of_work(db_session):
+                await repository.create(self._user_data())
+                raise RuntimeError
+
+        assert not in_unit_of_work(db_session)
+        assert await repository.get_all() == []
+
+    async def test_after_commit_waits_for_the_commit(self):
+        session = AsyncSession()
+        called = []
+
+        async with unit_of_work(session):
+            after_commit(session, lambda: called.append("commit"))
+            assert called == []
+
+        after_commit(session, lambda: called.append("immediate"))
+        assert called == ["commit", "immediate"]
+
+    async def test_after_commit_is_dropped_on_rollback(self):
+        session = AsyncSession()
+        called = []
+
+        with pytest.raises(RuntimeError):
+            async with unit_of_work(session):
+                after_commit(session, lambda: called.append("commit"))
+                raise RuntimeError
+
+        async with unit_of_work(session):
+            pass
+        assert called == []
+
+    def _user_data(self):
+        return {"username": fake.unique.user_name(), "password": fake.password()}
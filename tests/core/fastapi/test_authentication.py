@@ -0,0 +1,78 @@
+import pytest
+from fastapi import Depends, FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from app.helpers import TokenType, token_helper
+from app.models import Role
+from core.fastapi.dependencies import AuthenticationRequiredDep, authentication
+from core.fastapi.dependencies.authentication import authenticate_request
+from core.server import init_listeners
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> list[Request]:
+    calls: list[Request] = []
+    authenticate = authentication.authentication_backend.authenticate
+
+    async def counting_authenticate(conn):
+        calls.append(conn)
+        return await authenticate(conn)
+
+    monkeypatch.setattr(
+        authentication.authentication_backend, "authenticate", counting_authenticate
+    )
+    return calls
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+    init_listeners(app)
+
+    async def read_user(request: Request):
+        await authenticate_request(request)
+        return request.user
+
+    @app.get("/public")
+    async def public():
+        return {}
+
+    @app.get("/private", dependencies=[AuthenticationRequiredDep])
+    async def private(user=Depends(read_user)):
+        return {"id": user.id}
+
+    return app
+
+
+@pytest.mark.asyncio
+class TestAuthentication:
+    async def _get(self, app: FastAPI, url: str, token: str | None = None):
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(url, headers=headers)
+
+    async def test_public_route_skips_authentication(
+        self, app: FastAPI, calls: list[Request]
+    ):
+        response = await self._get(app, "/public", token="invalid")
+
+        assert response.status_code == 200
+        assert calls == []
+
+    async def test_authentication_runs_once_per_request(
+        self, app: FastAPI, calls: list[Request]
+    ):
+        token = token_helper.encode(7, TokenType.ACCESS, Role.USER, 0)
+
+        response = await self._get(app, "/private", token=token)
+
+        assert response.status_code == 200
+        assert response.json() == {"id": 7}
+        assert len(calls) == 1
+
+    async def test_invalid_token_is_rejected(self, app: FastAPI, calls: list[Request]):
+        response = await self._get(app, "/private", token="invalid")
+
+        assert response.status_code == 401
+        assert len(calls) == 1
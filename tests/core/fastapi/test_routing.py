@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import APIRouter, FastAPI, Response, status
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel, Field
+
+from app.models import Role
+from core.fastapi.routing import TrustedJSONRoute, trusted_serializer
+
+
+class Item(BaseModel):
+    id: int
+    role: Role
+
+
+class AliasedItem(BaseModel):
+    id: int = Field(..., alias="itemId")
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    router = APIRouter(route_class=TrustedJSONRoute)
+
+    @router.get("/items", response_model=list[Item])
+    async def list_items(response: Response):
+        response.headers["X-Next-Cursor"] = "next"
+        return [SimpleNamespace(id=1, role=Role.ADMIN, secret="hidden")]
+
+    @router.post("/items", response_model=Item, status_code=status.HTTP_201_CREATED)
+    async def create_item():
+        return SimpleNamespace(id=2, role=Role.USER)
+
+    @router.get("/item")
+    async def get_item() -> Item | None:
+        return None
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+@pytest.mark.asyncio
+class TestTrustedJSONRoute:
+    async def _request(self, app: FastAPI, method: str, url: str):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, url)
+
+    async def test_serializes_attributes_and_keeps_headers(self, app: FastAPI):
+        response = await self._request(app, "GET", "/items")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["X-Next-Cursor"] == "next"
+        assert response.json() == [{"id": 1, "role": Role.ADMIN.value}]
+
+    async def test_keeps_route_status_code(self, app: FastAPI):
+        response = await self._request(app, "POST", "/items")
+
+        assert response.status_code == 201
+        assert response.json() == {"id": 2, "role": Role.USER.value}
+
+    async def test_serializes_optional_none(self, app: FastAPI):
+        response = await self._request(app, "GET", "/item")
+
+        assert response.json() is None
+
+
+def test_serializer_matches_model_dump():
+    item = Item(id=3, role=Role.MODERATOR)
+
+    assert trusted_serializer(Item)(item) == item.model_dump_json().encode()
+
+
+@pytest.mark.parametrize("response_type", [AliasedItem, dict[str, int], None])
+def test_unsupported_types_have_no_serializer(response_type):
+    assert trusted_serializer(response_type) is None
@@ -0,0 +1,65 @@
+import logging
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.middleware import Middleware
+from httpx import ASGITransport, AsyncClient
+
+from core.database import session
+from core.fastapi.middlewares import SQLAlchemyMiddleware
+
+
+@pytest.mark.asyncio
+class TestSQLAlchemyMiddleware:
+    async def test_request_without_queries_creates_no_session(self):
+        app = FastAPI(middleware=[Middleware(SQLAlchemyMiddleware)])
+        seen = {}
+
+        @app.get("/ping")
+        async def ping(request: Request):
+            seen["usage"] = request.state.database_usage
+            seen["has_session"] = session.registry.has()
+            return {}
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/ping")
+
+        assert response.status_code == 200
+        assert seen["has_session"] is False
+        assert not seen["usage"].acquired
+        assert seen["usage"].connection_time == 0
+
+    async def test_database_usage_is_reported(self, caplog: pytest.LogCaptureFixture):
+        app = FastAPI(
+            middleware=[
+                Middleware(SQLAlchemyMiddleware, repeated_statement_threshold=2)
+            ]
+        )
+
+        @app.get("/users")
+        async def list_users(request: Request):
+            usage = request.state.database_usage
+            usage.statements = 3
+            usage.statement_time = 0.004
+            usage.statement_counts["SELECT users.id\nFROM users"] = 3
+            return {}
+
+        transport = ASGITransport(app=app)
+        with caplog.at_level(logging.INFO, logger="core.fastapi.middlewares"):
+            async with AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                response = await client.get("/users")
+
+        assert response.headers["Server-Timing"] == (
+            'db;dur=4.00;desc="3 statement(s)", db-pool;dur=0.00'
+        )
+        [usage_record, repeated_record] = caplog.records
+        assert usage_record.database_usage["statements"] == 3
+        assert usage_record.database_usage["status"] == 200
+        assert "path=/users status=200 statements=3" in usage_record.getMessage()
+        assert repeated_record.levelno == logging.WARNING
+        assert repeated_record.getMessage().endswith(
+            "3 times: SELECT users.id FROM users"
+        )
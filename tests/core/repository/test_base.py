@@ -35,6 +35,75 @@ class TestBaseRepository:
 
         assert updated_user.username == ""
 
+    @pytest.mark.asyncio
+    async def test_update_and_delete_by_id(self, repository: BaseRepository):
+        user = await repository.create(self._user_data_generator())
+        username = fake.unique.user_name()
+
+        updated_user = await repository.update_by_id(
+            user.id, {"username": username, "password_hash": None}
+        )
+        deleted = await repository.delete_by_id(user.id)
+
+        assert updated_user.username == username
+        assert updated_user.password_hash == user.password_hash
+        assert updated_user.updated_at >= user.created_at
+        assert deleted
+        assert await repository.update_by_id(user.id, {"username": "gone"}) is None
+        assert not await repository.delete_by_id(user.id)
+
+    @pytest.mark.asyncio
+    async def test_get_page_follows_cursor(self, repository: BaseRepository):
+        created = [
+            await repository.create(self._user_data_generator()) for _ in range(5)
+        ]
+
+        first_page, cursor = await repository.get_page(limit=2)
+        second_page, cursor = await repository.get_page(cursor=cursor, limit=2)
+        last_page, last_cursor = await repository.get_page(cursor=cursor, limit=2)
+
+        pages = [*first_page, *second_page, *last_page]
+        assert [user.id for user in pages] == [user.id for user in created]
+        assert last_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_update_delete(self, repository: BaseRepository):
+        attributes = [
+            {"username": fake.unique.user_name(), "password_hash": "hash"}
+            for _ in range(3)
+        ]
+
+        created = await repository.bulk_create(attributes)
+        ids = [user.id for user in created]
+        updated = await repository.bulk_update(
+            [*ids[:2], 0], {"password_hash": "new-hash"}
+        )
+        deleted_ids = await repository.bulk_delete([ids[0], 0])
+
+        assert [user.username for user in created] == [
+            item["username"] for item in attributes
+        ]
+        assert sorted(user.id for user in updated) == ids[:2]
+        assert all(user.password_hash == "new-hash" for user in updated)
+        assert deleted_ids == [ids[0]]
+        assert len(await repository.get_all()) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_page_projects_fields(self, repository: BaseRepository):
+        created = [
+            await repository.create(self._user_data_generator()) for _ in range(3)
+        ]
+
+        rows, cursor = await repository.get_page(limit=2, fields=["username"])
+        last_rows, _ = await repository.get_page(
+            cursor=cursor, limit=2, fields=["username"]
+        )
+
+        assert rows[0]._fields == ("username", "id")
+        assert [row.username for row in [*rows, *last_rows]] == [
+            user.username for user in created
+        ]
+
     def _user_data_generator(self):
         return {
             "username": fake.user_name(),
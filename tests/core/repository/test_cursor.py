@@ -0,0 +1,23 @@
+from datetime import datetime
+
+import pytest
+
+from core.exceptions import BadRequestException
+from core.repository.cursor import decode_cursor, encode_cursor
+
+
+class TestCursor:
+    def test_round_trip(self):
+        created_at = datetime(2024, 5, 17, 12, 30, 1, 250)
+
+        cursor = encode_cursor([created_at, 42])
+
+        assert decode_cursor(cursor, [datetime, int]) == [created_at, 42]
+        assert "=" not in cursor
+
+    @pytest.mark.parametrize(
+        "cursor", ["not-base64!", encode_cursor([1, 2]), encode_cursor(["x"])]
+    )
+    def test_malformed_cursor_is_rejected(self, cursor: str):
+        with pytest.raises(BadRequestException):
+            decode_cursor(cursor, [int])
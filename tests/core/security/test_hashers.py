@@ -0,0 +1,66 @@
+import pytest
+
+from core.security.hashers import (
+    BCryptHasher,
+    PasswordHasher,
+    PBKDF2Hasher,
+    ScryptHasher,
+)
+
+
+@pytest.fixture(
+    params=[
+        BCryptHasher(rounds=4),
+        ScryptHasher(cost=4, block_size=8, parallelism=1),
+        PBKDF2Hasher(iterations=1000),
+    ],
+    ids=lambda hasher: hasher.algorithm,
+)
+def hasher(request: pytest.FixtureRequest) -> PasswordHasher:
+    return request.param
+
+
+class TestPasswordHashers:
+    def test_hash_and_verify(self, hasher: PasswordHasher):
+        hashed_password = hasher.hash(b"password")
+
+        assert hasher.identify(hashed_password)
+        assert hasher.verify(b"password", hashed_password)
+        assert not hasher.verify(b"wrong", hashed_password)
+        assert not hasher.needs_update(hashed_password)
+
+    def test_hashes_are_salted(self, hasher: PasswordHasher):
+        assert hasher.hash(b"password") != hasher.hash(b"password")
+
+    def test_malformed_hash_does_not_verify(self, hasher: PasswordHasher):
+        malformed = f"{hasher.prefixes[0]}garbage"
+
+        assert not hasher.verify(b"password", malformed)
+        assert not hasher.needs_update(malformed)
+
+    @pytest.mark.parametrize(
+        "old, new",
+        [
+            (BCryptHasher(rounds=4), BCryptHasher(rounds=5)),
+            (ScryptHasher(cost=4), ScryptHasher(cost=5)),
+            (PBKDF2Hasher(iterations=1000), PBKDF2Hasher(iterations=2000)),
+        ],
+    )
+    def test_needs_update_when_parameters_change(
+        self, old: PasswordHasher, new: PasswordHasher
+    ):
+        hashed_password = old.hash(b"password")
+
+        assert new.needs_update(hashed_password)
+        assert new.verify(b"password", hashed_password)
+
+    def test_incomplete_hasher_cannot_be_constructed(self):
+        class VerifyOnlyHasher(PasswordHasher):
+            algorithm = "verify-only"
+            prefixes = ("$verify-only$",)
+
+            def verify(self, password: bytes, hashed_password: str) -> bool:
+                return False
+
+        with pytest.raises(TypeError):
+            VerifyOnlyHasher()
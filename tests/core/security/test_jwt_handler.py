@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from datetime import UTC, datetime, timedelta
 
 import pytest
@@ -54,3 +56,60 @@ class TestJWTHandler:
     def test_decode_expired(self, mock_expired_token):
         with pytest.raises(UnauthorizedException):
             jwt_handler.decode(mock_expired_token)
+
+    def test_encoded_token_matches_python_jose(self, mock_payload):
+        expire = datetime.now(UTC) + timedelta(minutes=5)
+
+        token = jwt_handler.encode(mock_payload, expires_at=expire)
+        expected = jwt.encode(
+            {**mock_payload, "exp": expire},
+            config.SECRET_KEY,
+            algorithm=config.JWT_ALGORITHM,
+        )
+
+        assert token == expected
+
+    def test_decode_matches_python_jose(self):
+        token = jwt_handler.encode({"user_id": 1, "token_type": "access"})
+
+        assert jwt_handler.decode(token) == jwt.decode(
+            token, config.SECRET_KEY, algorithms=[config.JWT_ALGORITHM]
+        )
+
+    def test_decode_token_with_other_header(self):
+        expire = datetime.now(UTC) + timedelta(minutes=5)
+        token = jwt.encode(
+            {"user_id": 1, "exp": expire},
+            config.SECRET_KEY,
+            algorithm=config.JWT_ALGORITHM,
+            headers={"kid": "key-1"},
+        )
+
+        assert jwt_handler.decode(token)["user_id"] == 1
+
+    @pytest.mark.parametrize(
+        "tamper",
+        [
+            lambda token: token[:-2] + ("AA" if token[-2:] != "AA" else "BB"),
+            lambda token: token.replace(".", ".e30.", 1),
+            lambda token: token.split(".", 1)[0] + ".e30." + token.rsplit(".", 1)[1],
+        ],
+    )
+    def test_decode_tampered_token(self, mock_token, tamper):
+        with pytest.raises(UnauthorizedException):
+            jwt_handler.decode(tamper(mock_token))
+
+    def test_decode_token_signed_with_other_key(self, mock_payload):
+        token = jwt.encode(mock_payload, "other-secret", algorithm=config.JWT_ALGORITHM)
+
+        with pytest.raises(UnauthorizedException):
+            jwt_handler.decode(token)
+
+    def test_hmac_path_does_not_import_jose(self):
+        code = (
+            "import sys\n"
+            "from core.security import jwt_handler\n"
+            "jwt_handler.decode(jwt_handler.encode({'user_id': 1}))\n"
+            "assert 'jose' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,146 @@
+import asyncio
+
+import pytest
+
+from core.exceptions import ServiceUnavailableException
+from core.security.hashers import BCryptHasher, ScryptHasher
+from core.security.password_handler import PasswordHandler
+
+
+class TestPasswordHandler:
+    @pytest.mark.asyncio
+    async def test_hash_and_verify(self):
+        handler = PasswordHandler(max_workers=1)
+
+        hashed_password = await handler.hash_password("password")
+
+        assert await handler.verify_password(hashed_password, "password")
+        assert not await handler.verify_password(hashed_password, "wrong")
+        assert handler.check_password_hash(hashed_password, "password")
+        handler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_verify_rejects_invalid_hash(self):
+        handler = PasswordHandler(max_workers=1)
+
+        assert not await handler.verify_password("not-a-hash", "password")
+        handler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_hash_rejects_long_password(self):
+        handler = PasswordHandler(max_workers=1)
+
+        with pytest.raises(ValueError):
+            await handler.hash_password("x" * 73)
+        assert handler.stats().completed == 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_is_rejected(self):
+        handler = PasswordHandler(max_workers=1, max_queue_size=1)
+
+        results = await asyncio.gather(
+            *(handler.hash_password("password") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        rejected = [r for r in results if isinstance(r, ServiceUnavailableException)]
+        stats = handler.stats()
+        assert len(rejected) == 1
+        assert stats.rejected == 1
+        assert stats.peak_queued == 1
+        assert stats.queued == 0
+        handler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_hash_passwords_stays_within_the_pool(self):
+        handler = PasswordHandler(
+            hashers=[BCryptHasher(rounds=4)], max_workers=2, max_queue_size=0
+        )
+
+        hashed_passwords = await handler.hash_passwords(
+            [f"password{index}" for index in range(5)]
+        )
+
+        assert len(hashed_passwords) == 5
+        assert handler.check_password_hash(hashed_passwords[3], "password3")
+        assert handler.stats().rejected == 0
+        handler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_hash_passwords_can_return_exceptions(self):
+        handler = PasswordHandler(hashers=[BCryptHasher(rounds=4)], max_workers=1)
+
+        results = await handler.hash_passwords(
+            ["password", "x" * 73], return_exceptions=True
+        )
+
+        assert handler.check_password_hash(results[0], "password")
+        assert isinstance(results[1], ValueError)
+        handler.shutdown()
+
+    @pytest.mark.parametrize(
+        "hashed_password, expected",
+        [
+            ("$2b$04$abc", True),
+            ("$2b$05$abc", False),
+            ("$2b$12$abc", False),
+            ("not-a-hash", False),
+        ],
+    )
+    def test_needs_rehash(self, hashed_password: str, expected: bool):
+        handler = PasswordHandler(hashers=[BCryptHasher(rounds=5)])
+
+        assert handler.needs_rehash(hashed_password) is expected
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("budget_ms, expected", [(0.001, 4), (10**6, 6)])
+    async def test_calibrate_clamps_rounds(self, budget_ms: float, expected: int):
+        handler = PasswordHandler(max_workers=1)
+
+        rounds = await handler.calibrate(budget_ms, min_rounds=4, max_rounds=6)
+
+        assert rounds == expected
+        assert handler.hasher.rounds == expected
+        handler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_calibrate_rejects_other_default_hashers(self):
+        handler = PasswordHandler(
+            hashers=[BCryptHasher(), ScryptHasher()],
+            default_algorithm=ScryptHasher.algorithm,
+        )
+
+        with pytest.raises(ValueError):
+            await handler.calibrate(100)
+
+    @pytest.mark.asyncio
+    async def test_hash_uses_configured_rounds(self):
+        handler = PasswordHandler(hashers=[BCryptHasher(rounds=5)], max_workers=1)
+
+        hashed_password = await handler.hash_password("password")
+
+        assert hashed_password.startswith("$2b$05$")
+        assert not handler.needs_rehash(hashed_password)
+        handler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_verifies_hashes_from_non_default_hasher(self):
+        bcrypt_hasher = BCryptHasher(rounds=4)
+        handler = PasswordHandler(
+            hashers=[bcrypt_hasher, ScryptHasher(cost=4)],
+            default_algorithm=ScryptHasher.algorithm,
+            max_workers=1,
+        )
+        legacy_hash = bcrypt_hasher.hash(b"password")
+
+        new_hash = await handler.hash_password("password")
+
+        assert await handler.verify_password(legacy_hash, "password")
+        assert handler.needs_rehash(legacy_hash)
+        assert new_hash.startswith("$scrypt$")
+        assert not handler.needs_rehash(new_hash)
+        handler.shutdown()
+
+    def test_unknown_default_hasher_is_rejected(self):
+        with pytest.raises(ValueError):
+            PasswordHandler(default_algorithm="md5")
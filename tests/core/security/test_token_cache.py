@@ -0,0 +1,70 @@
+import time
+
+from core.security.token_cache import TokenCache, TokenVersionCache
+
+
+class TestTokenCache:
+    def test_get_returns_cached_value(self):
+        cache: TokenCache[str] = TokenCache(max_size=2)
+        cache.set("token", "payload", expires_at=time.time() + 60)
+
+        assert cache.get("token") == "payload"
+        assert cache.get("other") is None
+        assert cache.stats().hits == 1
+        assert cache.stats().misses == 1
+
+    def test_expired_entry_is_dropped(self):
+        cache: TokenCache[str] = TokenCache(max_size=2)
+        cache.set("token", "payload", expires_at=time.time() - 1)
+
+        assert cache.get("token") is None
+        assert cache.stats().size == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache: TokenCache[str] = TokenCache(max_size=2)
+        expires_at = time.time() + 60
+        cache.set("first", "1", expires_at)
+        cache.set("second", "2", expires_at)
+        cache.get("first")
+
+        cache.set("third", "3", expires_at)
+
+        assert cache.get("second") is None
+        assert cache.get("first") == "1"
+        assert cache.stats().evictions == 1
+
+    def test_zero_size_disables_cache(self):
+        cache: TokenCache[str] = TokenCache(max_size=0)
+        cache.set("token", "payload", expires_at=time.time() + 60)
+
+        assert cache.get("token") is None
+        assert cache.stats().size == 0
+
+
+class TestTokenVersionCache:
+    def test_get_returns_recent_version(self):
+        cache = TokenVersionCache(ttl=60)
+        cache.set(1, 2)
+
+        assert cache.get(1) == 2
+        assert cache.get(2) is None
+
+    def test_deleted_user_is_revoked(self):
+        cache = TokenVersionCache(ttl=60)
+        cache.set(1, None)
+
+        assert cache.get(1) == TokenVersionCache.REVOKED
+
+    def test_stale_version_is_dropped(self, monkeypatch):
+        cache = TokenVersionCache(ttl=30)
+        cache.set(1, 0)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 31)
+
+        assert cache.get(1) is None
+
+    def test_zero_ttl_disables_cache(self):
+        cache = TokenVersionCache(ttl=0)
+        cache.set(1, 0)
+
+        assert cache.get(1) is None